@@ -0,0 +1,168 @@
+"""
+문화재 카탈로그 컬럼 파일
+
+문화재 검색 인덱스가 사용하는 고정 길이 배열과 문자열 풀을 하나의 파일로 저장하고,
+각 워커는 이 파일을 읽기 전용 mmap 으로 열어 복사 없이 공유한다.
+
+파일 구조
+- 매직 (8 bytes) + 헤더 길이 (uint32) + JSON 헤더 (행 수, 컬럼별 dtype / 오프셋 / 길이)
+- 8 bytes 단위로 정렬된 컬럼 배열 (문자열 컬럼은 문자열 풀 오프셋 배열)
+- 문자열 풀 (UTF-8, 컬럼별로 연속 배치)
+"""
+import os
+import json
+import mmap
+import struct
+import tempfile
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from app.utils.common import classify_era, era_bitmask, parse_location_for_list
+
+CATALOG_MAGIC = b"NHCATv01"
+
+# 문자열 풀에 저장되는 컬럼 (표시용 + 이름 검색용 정규화 값)
+STRING_COLUMNS = ("name", "name_search", "hanja_search", "location", "heritage_type", "image_url")
+
+class HeritageCatalog:
+    """문화재 카탈로그 컬럼 배열 + 문자열 풀 (메모리 또는 mmap 기반)"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], pool, pool_base: int = 0, source: Optional[mmap.mmap] = None):
+        self.arrays = arrays
+        self.pool = pool
+        self.pool_base = pool_base
+        # mmap 기반이면 배열이 참조하는 동안 매핑 유지
+        self._source = source
+
+    def __len__(self) -> int:
+        return len(self.arrays["ids"])
+
+    # 문자열 컬럼 값 조회 (빈 문자열은 None)
+    def string(self, column: str, row: int) -> Optional[str]:
+        value = self.string_bytes(column, row)
+        return value.decode() if value else None
+
+    def string_bytes(self, column: str, row: int) -> bytes:
+        offsets = self.arrays[f"{column}_offsets"]
+        return self.pool[self.pool_base + int(offsets[row]):self.pool_base + int(offsets[row + 1])]
+
+    # 문자열 컬럼에서 키워드를 포함하는 행 번호 (문자열 풀 바이트 검색, 빈 키워드는 검색 없이 전체 행)
+    def find_rows(self, column: str, keyword: bytes) -> np.ndarray:
+        offsets = self.arrays[f"{column}_offsets"]
+        if not keyword:
+            return np.arange(len(offsets) - 1, dtype=np.int64)
+        start, end = self.pool_base + int(offsets[0]), self.pool_base + int(offsets[-1])
+        positions = []
+        position = self.pool.find(keyword, start, end)
+        while position != -1:
+            positions.append(position - self.pool_base)
+            position = self.pool.find(keyword, position + 1, end)
+
+        if not positions:
+            return np.empty(0, dtype=np.int64)
+
+        positions = np.asarray(positions, dtype=np.int64)
+        rows = np.searchsorted(offsets, positions, side="right") - 1
+        # 인접한 두 문자열 경계에 걸친 매칭 제외
+        within = positions + len(keyword) <= offsets[rows + 1]
+        return np.unique(rows[within])
+
+# 카탈로그 행으로 컬럼 배열 및 문자열 풀 생성
+def build_heritage_catalog(rows: Sequence[tuple]) -> HeritageCatalog:
+    (ids, type_ids, latitudes, longitudes, area_codes,
+     eras, names, name_hanjas, location_lists, locations, image_urls, type_names) = zip(*rows) if rows else ([],) * 12
+
+    latitudes = np.asarray([float(v) if v is not None else 0.0 for v in latitudes], dtype=np.float64)
+    longitudes = np.asarray([float(v) if v is not None else 0.0 for v in longitudes], dtype=np.float64)
+    # 위도 기준 정렬 순서 (거리 범위 검색 시 위도 구간 이분 탐색)
+    lat_order = np.argsort(latitudes, kind="stable").astype(np.int64)
+
+    arrays = {
+        "ids": np.asarray(ids, dtype=np.int64),
+        "type_ids": np.asarray([t if t is not None else -1 for t in type_ids], dtype=np.int64),
+        "latitudes": latitudes,
+        "longitudes": longitudes,
+        "area_codes": np.asarray([float(v) if v is not None else np.nan for v in area_codes], dtype=np.float64),
+        # 시대 카테고리 비트마스크 (DB 의 heritage_eras 와 동일한 분류 기준)
+        "era_bits": np.asarray([era_bitmask(classify_era(era)) for era in eras], dtype=np.int64),
+        "lat_rad": np.radians(latitudes),
+        "lon_rad": np.radians(longitudes),
+        "lat_order": lat_order,
+        "sorted_lat": latitudes[lat_order],
+    }
+
+    values = {
+        "name": names,
+        "name_search": [(name or "").casefold() for name in names],
+        "hanja_search": [(hanja or "").casefold() for hanja in name_hanjas],
+        "location": [
+            location_list if location_list is not None else parse_location_for_list(location)
+            for location_list, location in zip(location_lists, locations)
+        ],
+        "heritage_type": type_names,
+        "image_url": image_urls,
+    }
+
+    pool = bytearray()
+    for column in STRING_COLUMNS:
+        offsets = [len(pool)]
+        for value in values[column]:
+            pool += (value or "").encode()
+            offsets.append(len(pool))
+        arrays[f"{column}_offsets"] = np.asarray(offsets, dtype=np.int64)
+
+    return HeritageCatalog(arrays, bytes(pool))
+
+def _align(position: int) -> int:
+    return (position + 7) & ~7
+
+# 카탈로그를 컬럼 파일로 저장 (임시 파일에 기록 후 교체하여 읽는 워커에 영향 없음)
+def write_heritage_catalog(catalog: HeritageCatalog, path: str):
+    columns, position = {}, 0
+    for name, array in catalog.arrays.items():
+        columns[name] = {"dtype": array.dtype.str, "offset": position, "length": len(array)}
+        position = _align(position + array.nbytes)
+    pool = bytes(catalog.pool[catalog.pool_base:catalog.pool_base + int(catalog.arrays[f"{STRING_COLUMNS[-1]}_offsets"][-1])])
+    columns["string_pool"] = {"dtype": "|u1", "offset": position, "length": len(pool)}
+
+    header = json.dumps({"rows": len(catalog), "columns": columns}).encode()
+    data_start = _align(len(CATALOG_MAGIC) + 4 + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".heritage_catalog.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(CATALOG_MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            for name, array in [*catalog.arrays.items(), ("string_pool", None)]:
+                file.write(b"\0" * (data_start + columns[name]["offset"] - file.tell()))
+                file.write(np.ascontiguousarray(array).tobytes() if array is not None else pool)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+# 컬럼 파일을 읽기 전용 mmap 으로 열어 카탈로그 생성 (배열 복사 없음)
+def open_heritage_catalog(path: str) -> HeritageCatalog:
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mapped[:len(CATALOG_MAGIC)] != CATALOG_MAGIC:
+        mapped.close()
+        raise ValueError(f"문화재 카탈로그 파일 형식이 올바르지 않습니다: {path}")
+
+    (header_length,) = struct.unpack_from("<I", mapped, len(CATALOG_MAGIC))
+    header_start = len(CATALOG_MAGIC) + 4
+    header = json.loads(mapped[header_start:header_start + header_length])
+    data_start = _align(header_start + header_length)
+
+    columns = header["columns"]
+    pool_column = columns.pop("string_pool")
+    arrays = {
+        name: np.frombuffer(mapped, dtype=np.dtype(column["dtype"]), count=column["length"],
+                            offset=data_start + column["offset"])
+        for name, column in columns.items()
+    }
+    return HeritageCatalog(arrays, mapped, pool_base=data_start + pool_column["offset"], source=mapped)
@@ -0,0 +1,230 @@
+import os
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.heritage_catalog import HeritageCatalog, build_heritage_catalog, open_heritage_catalog
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.enums import EraCategory, SortOrder
+from app.repository.heritage_repository import HeritageRepository
+from app.utils.common import era_bitmask, parse_heritage_dist_range
+
+logger = logging.getLogger(__name__)
+
+# MySQL ST_Distance_Sphere 와 동일한 지구 반지름 (km)
+EARTH_RADIUS_KM = 6370.986
+
+class IndexedHeritage:
+    """인덱스 검색 결과로 반환되는 문화재 리스트 표시 정보"""
+    __slots__ = ("id", "name", "location", "heritage_type", "image_url")
+
+    def __init__(self, id: int, name: str, location: str, heritage_type: Optional[str], image_url: Optional[str]):
+        self.id = id
+        self.name = name
+        self.location = location
+        self.heritage_type = heritage_type
+        self.image_url = image_url
+
+class HeritageIndex:
+    """
+    문화재 카탈로그 인메모리 검색 인덱스
+    - 위도 정렬 배열로 거리 범위 후보를 좁히고, NumPy 로 구면 거리를 일괄 계산
+    - 컬럼 배열은 DB 조회 결과로 만들거나 mmap 한 카탈로그 파일을 그대로 사용
+    - 생성 후 변경하지 않으며, 재빌드 시 인스턴스 자체를 교체
+    """
+
+    def __init__(self, catalog: HeritageCatalog):
+        self.catalog = catalog
+        arrays = catalog.arrays
+
+        self.ids = arrays["ids"]
+        self.type_ids = arrays["type_ids"]
+        self.latitudes = arrays["latitudes"]
+        self.longitudes = arrays["longitudes"]
+        self.area_codes = arrays["area_codes"]
+        self.era_bits = arrays["era_bits"]
+
+        self._lat_rad = arrays["lat_rad"]
+        self._lon_rad = arrays["lon_rad"]
+        self._lat_order = arrays["lat_order"]
+        self._sorted_lat = arrays["sorted_lat"]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "HeritageIndex":
+        return cls(build_heritage_catalog(rows))
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    # 문화재 ID 로 이름 조회 (카탈로그는 ID 순 정렬, 인덱스 생성 이후 추가된 문화재는 None)
+    def get_name(self, heritage_id: int) -> Optional[str]:
+        row = int(np.searchsorted(self.ids, heritage_id))
+        if row < len(self.ids) and self.ids[row] == heritage_id:
+            return self.catalog.string("name", row)
+        return None
+
+    # 검색 결과 표시 정보 (페이지에 포함된 행만 문자열 풀에서 디코딩)
+    def _entry(self, row: int) -> IndexedHeritage:
+        return IndexedHeritage(
+            id=int(self.ids[row]),
+            name=self.catalog.string("name", row),
+            location=self.catalog.string("location", row) or "",
+            heritage_type=self.catalog.string("heritage_type", row),
+            image_url=self.catalog.string("image_url", row)
+        )
+
+    # 검색어 관련도 (완전 일치 3, 접두 일치 2, 부분 일치 1, 불일치 0)
+    def _relevance(self, keyword: bytes, row: int) -> int:
+        score = 0
+        for column in ("name_search", "hanja_search"):
+            value = self.catalog.string_bytes(column, row)
+            if value == keyword:
+                return 3
+            if value.startswith(keyword):
+                score = max(score, 2)
+            elif keyword in value:
+                score = max(score, 1)
+        return score
+
+    # 사용자 위치 기준 구면 거리 계산 (km, 소수점 2자리)
+    def _distances(self, candidates: np.ndarray, user_latitude: float, user_longitude: float) -> np.ndarray:
+        user_lat, user_lon = np.radians(user_latitude), np.radians(user_longitude)
+        dlat = self._lat_rad[candidates] - user_lat
+        dlon = self._lon_rad[candidates] - user_lon
+        a = np.sin(dlat / 2) ** 2 + np.cos(user_lat) * np.cos(self._lat_rad[candidates]) * np.sin(dlon / 2) ** 2
+        return np.round(2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))), 2)
+
+    # 최대 거리 안에 들어올 수 있는 위도 구간의 후보 행
+    def _latitude_band(self, user_latitude: float, max_dist: float) -> np.ndarray:
+        lat_delta = max_dist / 111.32
+        start = np.searchsorted(self._sorted_lat, user_latitude - lat_delta, side="left")
+        end = np.searchsorted(self._sorted_lat, user_latitude + lat_delta, side="right")
+        return np.sort(self._lat_order[start:end])
+
+    def search(
+        self,
+        limit: int,
+        offset: int,
+        user_latitude: float,
+        user_longitude: float,
+        name: Optional[str] = None,
+        area_code: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
+        distance_range: Optional[str] = None,
+        era_category: Optional[EraCategory] = None,
+        sort_by: str = "id",
+        sort_order: SortOrder = SortOrder.ASC,
+        cursor: Optional[Tuple[Optional[float], int]] = None
+    ) -> Tuple[List[Tuple[IndexedHeritage, float]], int]:
+
+        min_dist, max_dist = parse_heritage_dist_range(distance_range) if distance_range else (0, float('inf'))
+
+        # 거리 범위 후보 추출
+        if distance_range and max_dist != float('inf'):
+            candidates = self._latitude_band(user_latitude, max_dist)
+        else:
+            candidates = np.arange(len(self.catalog))
+
+        # 지역 / 유형 / 시대 필터링
+        if area_code is not None:
+            candidates = candidates[self.area_codes[candidates] == area_code]
+
+        if heritage_type is not None:
+            candidates = candidates[np.isin(self.type_ids[candidates], heritage_type)]
+
+        if era_category and era_category != EraCategory.ALL:
+            candidates = candidates[(self.era_bits[candidates] & era_bitmask([era_category])) != 0]
+
+        # 이름 필터링 (문자열 풀에서 한글/한자 이름 부분 일치 행 검색 후 관련도 점수 계산, 공백뿐인 이름은 필터 없음)
+        scores = None
+        keyword = name.strip().casefold().encode() if name else b""
+        if keyword:
+            matched_rows = np.union1d(
+                self.catalog.find_rows("name_search", keyword),
+                self.catalog.find_rows("hanja_search", keyword)
+            )
+            candidates = candidates[np.isin(candidates, matched_rows)]
+            scores = np.asarray([self._relevance(keyword, i) for i in candidates], dtype=np.int64)
+
+        distances = self._distances(candidates, user_latitude, user_longitude)
+
+        # 거리 범위 필터링
+        if distance_range:
+            in_range = (distances >= min_dist) & (distances < max_dist)
+            candidates, distances = candidates[in_range], distances[in_range]
+            if scores is not None:
+                scores = scores[in_range]
+
+        # 정렬 (거리 정렬 시 동일 거리는 ID 순, 관련도 정렬은 항상 관련도 높은 순)
+        if sort_by == "relevance" and scores is not None:
+            order = np.lexsort((self.ids[candidates], -scores))
+        elif sort_by == "distance":
+            order = np.lexsort((self.ids[candidates], distances))
+        else:
+            order = np.argsort(self.ids[candidates], kind="stable")
+
+        if sort_order == SortOrder.DESC and not (sort_by == "relevance" and scores is not None):
+            order = order[::-1]
+
+        total_count = len(order)
+
+        # 커서 페이지네이션 (정렬 결과에서 마지막 항목 이후 위치부터 조회)
+        if cursor is not None:
+            last_distance, last_id = cursor
+            sorted_ids, sorted_distances = self.ids[candidates[order]], distances[order]
+            if sort_by == "distance" and sort_order == SortOrder.ASC:
+                after = (sorted_distances > last_distance) | ((sorted_distances == last_distance) & (sorted_ids > last_id))
+            elif sort_by == "distance":
+                after = (sorted_distances < last_distance) | ((sorted_distances == last_distance) & (sorted_ids < last_id))
+            else:
+                after = sorted_ids > last_id if sort_order == SortOrder.ASC else sorted_ids < last_id
+            order = order[after]
+
+        page = order[offset:offset + limit]
+
+        return [(self._entry(candidates[i]), float(distances[i])) for i in page], total_count
+
+_heritage_index: Optional[HeritageIndex] = None
+# mmap 으로 연 카탈로그 파일의 수정 시각 (변경된 경우에만 다시 매핑)
+_catalog_mtime: Optional[float] = None
+
+def get_heritage_index() -> Optional[HeritageIndex]:
+    return _heritage_index
+
+# DB 에서 카탈로그를 읽어 인덱스 재빌드 후 교체
+async def load_heritage_index(db: AsyncSession) -> HeritageIndex:
+    global _heritage_index
+
+    rows = await HeritageRepository(db).get_heritage_catalog_rows()
+    heritage_index = HeritageIndex.from_rows(rows)
+    _heritage_index = heritage_index
+
+    logger.info(f"문화재 검색 인덱스가 로드되었습니다. (문화재 수: {len(heritage_index)})")
+    return heritage_index
+
+# 카탈로그 파일을 mmap 으로 열어 인덱스 교체 (워커 간 물리 메모리 공유)
+def load_heritage_index_from_file(path: str) -> Optional[HeritageIndex]:
+    global _heritage_index, _catalog_mtime
+
+    mtime = os.stat(path).st_mtime
+    if _heritage_index is not None and mtime == _catalog_mtime:
+        return _heritage_index
+
+    heritage_index = HeritageIndex(open_heritage_catalog(path))
+    _heritage_index, _catalog_mtime = heritage_index, mtime
+
+    logger.info(f"문화재 카탈로그 파일이 로드되었습니다. (경로: {path}, 문화재 수: {len(heritage_index)})")
+    return heritage_index
+
+# 인덱스 갱신 (시작 시 / 주기적 갱신)
+# 카탈로그 파일 경로가 설정된 경우 파일 변경 여부만 확인하고, 아니면 새 DB 세션으로 재빌드
+async def refresh_heritage_index():
+    if settings.HERITAGE_CATALOG_PATH:
+        load_heritage_index_from_file(settings.HERITAGE_CATALOG_PATH)
+        return
+
+    async with AsyncSessionLocal(info={"read_only": True, "use_replica": True}) as session:
+        await load_heritage_index(session)
@@ -0,0 +1,140 @@
+import logging
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.database import AsyncSessionLocal
+from app.models.heritage.heritage_building import HeritageBuilding
+from app.models.heritage.heritage_route import HeritageRoute
+from app.models.heritage.heritage_route_building import HeritageRouteBuilding
+from app.models.heritage.heritage_type import HeritageType
+
+logger = logging.getLogger(__name__)
+
+class TypeRecord:
+    """문화재 / 건축물 유형 참조 정보"""
+    __slots__ = ("type_id", "name", "type_name", "default_radius")
+
+    def __init__(self, type_id: int, name: Optional[str], type_name, default_radius: Optional[float]):
+        self.type_id = type_id
+        self.name = name
+        self.type_name = type_name
+        self.default_radius = default_radius
+
+class BuildingRecord:
+    """문화재 내부 건축물 참조 정보"""
+    __slots__ = ("id", "heritage_id", "building_type_id", "name", "latitude", "longitude", "custom_radius")
+
+    def __init__(self, id: int, heritage_id: Optional[int], building_type_id: Optional[int], name: Optional[str],
+                 latitude, longitude, custom_radius: Optional[float]):
+        self.id = id
+        self.heritage_id = heritage_id
+        self.building_type_id = building_type_id
+        self.name = name
+        self.latitude = latitude
+        self.longitude = longitude
+        self.custom_radius = custom_radius
+
+class RouteRecord:
+    """문화재 코스 참조 정보 (건축물은 방문 순서대로 정렬)"""
+    __slots__ = ("id", "heritage_id", "name", "buildings")
+
+    def __init__(self, id: int, heritage_id: Optional[int], name: Optional[str], buildings: Tuple[BuildingRecord, ...]):
+        self.id = id
+        self.heritage_id = heritage_id
+        self.name = name
+        self.buildings = buildings
+
+class ReferenceSnapshot:
+    """
+    문화재 유형 / 건축물 / 코스 참조 데이터 스냅샷
+    - 생성 후 변경하지 않으며, 재로드 시 인스턴스 자체를 교체
+    """
+
+    def __init__(self, types: Mapping[int, TypeRecord], buildings: Mapping[int, BuildingRecord],
+                 routes_by_heritage: Mapping[int, Tuple[RouteRecord, ...]]):
+        self.types = MappingProxyType(dict(types))
+        self.buildings = MappingProxyType(dict(buildings))
+        self.routes_by_heritage = MappingProxyType(dict(routes_by_heritage))
+        # 건축물 ID → 소속 문화재 ID
+        self.building_heritage_ids = MappingProxyType({
+            building_id: building.heritage_id for building_id, building in self.buildings.items()
+        })
+
+    def get_building(self, building_id: int) -> Optional[BuildingRecord]:
+        return self.buildings.get(building_id)
+
+    def get_routes(self, heritage_id: int) -> Tuple[RouteRecord, ...]:
+        return self.routes_by_heritage.get(heritage_id, ())
+
+    def building_belongs_to_heritage(self, heritage_id: int, building_id: int) -> Optional[bool]:
+        # 스냅샷에 없는 건축물은 판단 불가 (None)
+        if building_id not in self.building_heritage_ids:
+            return None
+        return self.building_heritage_ids[building_id] == heritage_id
+
+_reference_snapshot: Optional[ReferenceSnapshot] = None
+
+def get_reference_snapshot() -> Optional[ReferenceSnapshot]:
+    return _reference_snapshot
+
+# DB 에서 참조 데이터를 읽어 스냅샷 생성
+async def build_reference_snapshot(db: AsyncSession) -> ReferenceSnapshot:
+    type_rows = await db.execute(select(
+        HeritageType.type_id, HeritageType.name, HeritageType.type_name, HeritageType.default_radius
+    ))
+    types = {row.type_id: TypeRecord(*row) for row in type_rows}
+
+    building_rows = await db.execute(select(
+        HeritageBuilding.id,
+        HeritageBuilding.heritage_id,
+        HeritageBuilding.building_type_id,
+        HeritageBuilding.name,
+        HeritageBuilding.latitude,
+        HeritageBuilding.longitude,
+        HeritageBuilding.custom_radius
+    ))
+    buildings = {row.id: BuildingRecord(*row) for row in building_rows}
+
+    route_building_rows = await db.execute(select(HeritageRouteBuilding.route_id, HeritageRouteBuilding.building_id)
+                                           .order_by(HeritageRouteBuilding.route_id, HeritageRouteBuilding.visit_order))
+    route_buildings = defaultdict(list)
+    for route_id, building_id in route_building_rows:
+        if building_id in buildings:
+            route_buildings[route_id].append(buildings[building_id])
+
+    route_rows = await db.execute(select(HeritageRoute.id, HeritageRoute.heritage_id, HeritageRoute.name)
+                                  .order_by(HeritageRoute.id))
+    routes_by_heritage = defaultdict(list)
+    for route_id, heritage_id, name in route_rows:
+        routes_by_heritage[heritage_id].append(
+            RouteRecord(route_id, heritage_id, name, tuple(route_buildings.get(route_id, ())))
+        )
+
+    return ReferenceSnapshot(
+        types,
+        buildings,
+        {heritage_id: tuple(routes) for heritage_id, routes in routes_by_heritage.items()}
+    )
+
+# 스냅샷 재생성 후 교체 (조회 중인 요청은 기존 스냅샷을 그대로 사용)
+async def load_reference_snapshot(db: AsyncSession) -> ReferenceSnapshot:
+    global _reference_snapshot
+
+    snapshot = await build_reference_snapshot(db)
+    _reference_snapshot = snapshot
+
+    logger.info(
+        f"참조 데이터 스냅샷이 로드되었습니다. "
+        f"(유형 수: {len(snapshot.types)}, 건축물 수: {len(snapshot.buildings)}, "
+        f"코스 보유 문화재 수: {len(snapshot.routes_by_heritage)})"
+    )
+    return snapshot
+
+# 새 DB 세션으로 스냅샷 재로드 (시작 시 / 주기적 갱신)
+async def refresh_reference_snapshot():
+    async with AsyncSessionLocal(info={"read_only": True, "use_replica": True}) as session:
+        await load_reference_snapshot(session)
@@ -0,0 +1,61 @@
+"""
+문화재 표시용 위치 컬럼 백필
+
+location 원문으로부터 location_list / location_detail 값을 다시 계산해 저장한다.
+위치 파싱 규칙이 변경된 경우에도 이 명령으로 전체 데이터를 갱신한다.
+
+사용법: python -m app.commands.backfill_locations
+"""
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.database import engine
+from app.utils.common import parse_location_for_detail, parse_location_for_list
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+# ID 순서대로 배치 단위 위치 파싱 후 일괄 갱신
+async def backfill_heritage_locations(conn: AsyncConnection, batch_size: int = BATCH_SIZE) -> int:
+    last_id, updated = 0, 0
+    while True:
+        result = await conn.execute(text("""
+            SELECT id, location FROM heritages
+            WHERE id > :last_id ORDER BY id LIMIT :limit
+        """), {"last_id": last_id, "limit": batch_size})
+        rows = result.all()
+        if not rows:
+            break
+
+        await conn.execute(text("""
+            UPDATE heritages
+            SET location_list = :location_list, location_detail = :location_detail
+            WHERE id = :id
+        """), [
+            {
+                "id": heritage_id,
+                "location_list": parse_location_for_list(location),
+                "location_detail": parse_location_for_detail(location)
+            }
+            for heritage_id, location in rows
+        ])
+
+        last_id = rows[-1][0]
+        updated += len(rows)
+        logger.info(f"표시용 위치 백필 진행 중 (누적 {updated}건, 마지막 ID {last_id})")
+
+    return updated
+
+async def main():
+    async with engine.begin() as conn:
+        updated = await backfill_heritage_locations(conn)
+    logger.info(f"표시용 위치 백필 완료 (총 {updated}건)")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+저장소 핫 조회 쿼리 Python 오버헤드 벤치마크
+
+매 호출마다 select() 구문을 새로 구성하는 기존 방식과 lambda_stmt 로 캐시하는 현재 저장소 구현을
+같은 인자로 반복 실행하고, 전체 실행 시간에서 커서 실행 시간 (DB 왕복) 을 뺀 값을 쿼리당 Python 오버헤드로 보고한다.
+
+사용법: python -m app.commands.bench_statements --session-id 1 --heritage-id 1 --user-id 1 [--iterations 2000]
+"""
+import time
+import asyncio
+import logging
+import argparse
+from typing import Awaitable, Callable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
+
+from app.core.database import engine
+from app.models.chat.chat_session import ChatSession
+from app.models.heritage.heritage import Heritage
+from app.models.question import RecommendedQuestion
+from app.models.user import User
+from app.repository.chat_repository import ChatRepository
+from app.repository.heritage_repository import HeritageRepository
+from app.repository.user_repository import UserRepository
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# (쿼리 이름, 기존 방식 구문 생성, 현재 저장소 호출)
+CASES: List[Tuple[str, Callable, Callable[[AsyncSession, argparse.Namespace], Awaitable]]] = [
+    (
+        "ChatRepository.get_chat_session",
+        lambda args: select(ChatSession).where(ChatSession.id == args.session_id),
+        lambda session, args: ChatRepository(session).get_chat_session(args.session_id),
+    ),
+    (
+        "ChatRepository.get_active_session",
+        lambda args: select(ChatSession)
+            .where((ChatSession.user_id == args.user_id) & (ChatSession.heritage_id == args.heritage_id) & (ChatSession.end_time == None))
+            .order_by(ChatSession.created_at.desc()).limit(1),
+        lambda session, args: ChatRepository(session).get_active_session(args.user_id, args.heritage_id),
+    ),
+    (
+        "ChatRepository.get_recommended_questions",
+        lambda args: select(RecommendedQuestion)
+            .where(RecommendedQuestion.session_id == args.session_id).order_by(RecommendedQuestion.id),
+        lambda session, args: ChatRepository(session).get_recommended_questions(args.session_id),
+    ),
+    (
+        "HeritageRepository.get_heritage_by_id",
+        lambda args: select(Heritage).options(joinedload(Heritage.heritage_types)).where(Heritage.id == args.heritage_id),
+        lambda session, args: HeritageRepository(session).get_heritage_by_id(args.heritage_id),
+    ),
+    (
+        "HeritageRepository.get_heritage_name_by_id",
+        lambda args: select(Heritage.name).where(Heritage.id == args.heritage_id),
+        lambda session, args: HeritageRepository(session).get_heritage_name_by_id(args.heritage_id),
+    ),
+    (
+        "UserRepository.get_user_by_id",
+        lambda args: select(User).where(User.id == args.user_id),
+        lambda session, args: UserRepository(session).get_user_by_id(args.user_id),
+    ),
+]
+
+class CursorTimer:
+    """엔진의 커서 실행 시간 누적 (DB 왕복 시간)"""
+
+    def __init__(self, sync_engine):
+        self.elapsed = 0.0
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        context._bench_started = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        self.elapsed += time.perf_counter() - context._bench_started
+
+# 호출을 반복 실행하여 쿼리당 전체 시간 / DB 시간 (초) 측정
+async def measure(session: AsyncSession, timer: CursorTimer, call: Callable[[], Awaitable], iterations: int) -> Tuple[float, float]:
+    total, timer.elapsed = 0.0, 0.0
+    for _ in range(iterations):
+        # 식별 맵 재사용으로 인한 차이가 없도록 매 호출 전 비움
+        session.expunge_all()
+        started = time.perf_counter()
+        await call()
+        total += time.perf_counter() - started
+    return total / iterations, timer.elapsed / iterations
+
+async def bench_statements(args: argparse.Namespace):
+    timer = CursorTimer(engine.sync_engine)
+
+    async def run_legacy(session, build):
+        result = await session.execute(build(args))
+        return result.unique().scalars().all()
+
+    logger.info(f"{'query':<45} {'mode':<8} {'total(us)':>10} {'db(us)':>10} {'python(us)':>11}")
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for name, build, call in CASES:
+            modes = [
+                ("legacy", lambda: run_legacy(session, build)),
+                ("cached", lambda: call(session, args)),
+            ]
+            overheads = {}
+            for mode, run in modes:
+                # 워밍업 (컴파일 캐시 적재)
+                await measure(session, timer, run, args.warmup)
+                total, db_time = await measure(session, timer, run, args.iterations)
+                overheads[mode] = total - db_time
+                logger.info(f"{name:<45} {mode:<8} {total * 1e6:>10.1f} {db_time * 1e6:>10.1f} {overheads[mode] * 1e6:>11.1f}")
+
+            saved = 1 - overheads["cached"] / overheads["legacy"] if overheads["legacy"] > 0 else 0.0
+            logger.info(f"{name:<45} Python 오버헤드 감소율: {saved:.1%}")
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장소 핫 조회 쿼리 Python 오버헤드 벤치마크")
+    parser.add_argument("--session-id", type=int, required=True)
+    parser.add_argument("--heritage-id", type=int, required=True)
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    asyncio.run(bench_statements(parser.parse_args()))
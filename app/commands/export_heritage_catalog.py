@@ -0,0 +1,35 @@
+"""
+문화재 카탈로그 컬럼 파일 생성
+
+heritages 테이블을 검색 인덱스용 컬럼 파일로 내보낸다.
+HERITAGE_CATALOG_PATH 를 같은 경로로 설정하면 각 워커가 이 파일을 mmap 으로 공유한다.
+
+사용법: python -m app.commands.export_heritage_catalog [출력 경로]
+"""
+import sys
+import asyncio
+import logging
+
+from app.cache.heritage_catalog import build_heritage_catalog, write_heritage_catalog
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.repository.heritage_repository import HeritageRepository
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def export_heritage_catalog(path: str):
+    async with AsyncSessionLocal() as session:
+        rows = await HeritageRepository(session).get_heritage_catalog_rows()
+
+    catalog = build_heritage_catalog(rows)
+    write_heritage_catalog(catalog, path)
+    logger.info(f"문화재 카탈로그 파일 생성 완료 (경로: {path}, 문화재 수: {len(catalog)})")
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else settings.HERITAGE_CATALOG_PATH
+    if not output_path:
+        sys.exit("출력 경로를 지정하거나 HERITAGE_CATALOG_PATH 를 설정해 주세요.")
+    asyncio.run(export_heritage_catalog(output_path))
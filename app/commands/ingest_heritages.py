@@ -0,0 +1,279 @@
+"""
+문화재 CSV 일괄 적재
+
+CSV 를 청크 단위로 읽어 벡터 연산으로 정제한 뒤, 다중 행 INSERT ... ON DUPLICATE KEY UPDATE 로 적재한다.
+자연 키(유형, 지역 코드, 이름, 한자 이름)의 해시를 source_key 로 저장하므로 같은 파일을 다시 적재해도 중복되지 않는다.
+DB 접속 정보는 애플리케이션 설정(SQLALCHEMY_DATABASE_URI)을 사용한다.
+
+--sync 모드는 행 내용 해시(source_hash)를 저장된 값과 비교해 추가 / 변경된 행만 적재하고,
+원본에서 사라진 행은 삭제한 뒤 변경 내역(추가 / 변경 / 삭제 ID)을 JSON 으로 출력한다.
+
+사용법: python -m app.commands.ingest_heritages <CSV 경로> [--chunk-size 1000] [--sync] [--changes 변경내역.json]
+"""
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import argparse
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, delete, exists, func, not_
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.future import select
+
+from app.core.database import engine
+# 외래키 대상 테이블 메타데이터 등록을 위해 전체 모델 로드
+from app.models.init import (
+    ChatSession,
+    Heritage,
+    HeritageBuilding,
+    HeritageBuildingImage,
+    HeritageEra,
+    HeritageRoute,
+    UserBookmark
+)
+from app.models.spatial import st_point
+from app.utils.common import classify_era, parse_location_for_detail, parse_location_for_list
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+STRING_COLUMNS = [
+    "name", "name_hanja", "description", "location", "category",
+    "sub_category1", "sub_category2", "sub_category3", "era", "image_url"
+]
+
+# 변경 감지 대상 원본 컬럼
+HASH_COLUMNS = ["heritage_type_id", "latitude", "longitude", "area_code", *STRING_COLUMNS]
+
+# 적재 후 갱신 대상 컬럼 (source_key 제외)
+UPSERT_COLUMNS = [
+    "heritage_type_id", "latitude", "longitude", "geo_point", "area_code",
+    "location_list", "location_detail", *STRING_COLUMNS, "source_hash"
+]
+
+# 문화재를 참조하는 테이블 (참조 중인 문화재는 동기화 삭제 대상에서 제외)
+HERITAGE_REFERENCES = [ChatSession, UserBookmark, HeritageBuilding, HeritageBuildingImage, HeritageRoute]
+
+# 빈 값으로 취급하는 문자열 (기존 적재 스크립트가 저장한 'nan' / 'None' 포함)
+EMPTY_STRING_VALUES = ("", "nan", "NaN", "None")
+
+# 원본 값 정제 (앞뒤 공백 제거, 빈 값은 None)
+def normalize_source_value(value) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if value in EMPTY_STRING_VALUES else value
+
+# 문화재 자연 키 해시 (유형, 지역 코드, 이름, 한자 이름)
+# CSV 정제 행과 기존 DB 행이 같은 키를 갖도록 같은 기준으로 정제 후 계산
+def heritage_source_key(heritage_type_id: Optional[int], area_code: Optional[int],
+                        name: Optional[str], name_hanja: Optional[str]) -> str:
+    natural_key = "\x1f".join(
+        normalize_source_value(value) or ""
+        for value in (heritage_type_id, area_code, name, name_hanja)
+    )
+    return hashlib.sha1(natural_key.encode()).hexdigest()
+
+# 정제된 행 내용 해시 (적재 대상 컬럼 전체)
+def heritage_source_hash(record: Dict) -> str:
+    content = {column: record[column] for column in HASH_COLUMNS}
+    return hashlib.sha1(json.dumps(content, ensure_ascii=False, sort_keys=True, default=str).encode()).hexdigest()
+
+# CSV 청크 정제 및 타입 변환
+def clean_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    chunk = chunk.reindex(columns=["heritage_type_id", "latitude", "longitude", "area_code", *STRING_COLUMNS])
+
+    # 문자열 컬럼: 앞뒤 공백 제거, 빈 문자열 / 'nan' 은 NULL
+    for column in STRING_COLUMNS:
+        values = chunk[column].astype("string").str.strip()
+        chunk[column] = values.mask(values.isin(EMPTY_STRING_VALUES))
+
+    # 숫자 컬럼: 변환 불가 값은 NULL, 정수 컬럼은 nullable 정수로 변환
+    for column in ("heritage_type_id", "area_code"):
+        chunk[column] = pd.to_numeric(chunk[column], errors="coerce").round().astype("Int64")
+    for column in ("latitude", "longitude"):
+        chunk[column] = pd.to_numeric(chunk[column], errors="coerce")
+
+    # 범위를 벗어난 좌표는 NULL
+    chunk.loc[~chunk["latitude"].between(-90, 90), "latitude"] = np.nan
+    chunk.loc[~chunk["longitude"].between(-180, 180), "longitude"] = np.nan
+
+    # 이름 없는 행 제외
+    chunk = chunk[chunk["name"].notna()].copy()
+
+    chunk["location_list"] = chunk["location"].map(parse_location_for_list, na_action="ignore")
+    chunk["location_detail"] = chunk["location"].map(parse_location_for_detail, na_action="ignore")
+
+    records = chunk.astype(object).where(chunk.notna(), None)
+    records["source_key"] = [
+        heritage_source_key(type_id, area_code, name, name_hanja)
+        for type_id, area_code, name, name_hanja
+        in zip(records["heritage_type_id"], records["area_code"], records["name"], records["name_hanja"])
+    ]
+    records["source_hash"] = [heritage_source_hash(record) for record in records.to_dict("records")]
+    # 같은 청크 안의 중복 자연 키는 마지막 행 사용
+    return records.drop_duplicates(subset="source_key", keep="last")
+
+# 정제된 청크 다중 행 UPSERT
+async def upsert_heritages(conn: AsyncConnection, records: List[Dict]):
+    rows = [
+        {**record, "geo_point": st_point(record["longitude"], record["latitude"])}
+        for record in records
+    ]
+    statement = insert(Heritage.__table__).values(rows)
+    # MySQL 은 갱신식을 순서대로 평가하므로 source_hash 갱신 전에 내용 변경 여부로 updated_at 결정
+    statement = statement.on_duplicate_key_update([
+        ("updated_at", func.IF(Heritage.source_hash == statement.inserted.source_hash, Heritage.updated_at, func.now())),
+        *[(column, statement.inserted[column]) for column in UPSERT_COLUMNS]
+    ])
+    await conn.execute(statement)
+
+# 적재된 문화재의 시대 카테고리 재분류
+async def replace_heritage_eras(conn: AsyncConnection, records: List[Dict]):
+    source_keys = [record["source_key"] for record in records]
+    result = await conn.execute(select(Heritage.source_key, Heritage.id).where(Heritage.source_key.in_(source_keys)))
+    heritage_ids = dict(result.all())
+
+    await conn.execute(delete(HeritageEra).where(HeritageEra.heritage_id.in_(heritage_ids.values())))
+    era_rows = [
+        {"era": category, "heritage_id": heritage_ids[record["source_key"]]}
+        for record in records
+        for category in classify_era(record["era"])
+    ]
+    if era_rows:
+        await conn.execute(insert(HeritageEra.__table__), era_rows)
+
+async def ingest_heritages(csv_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    started_at, total = time.monotonic(), 0
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+        records = clean_chunk(chunk).to_dict("records")
+        if not records:
+            continue
+
+        # 청크 단위 트랜잭션 (중단 후 재실행 시 이미 적재된 행은 갱신만 수행)
+        async with engine.begin() as conn:
+            await upsert_heritages(conn, records)
+            await replace_heritage_eras(conn, records)
+
+        total += len(records)
+        elapsed = time.monotonic() - started_at
+        logger.info(f"문화재 적재 진행 중 (누적 {total}건, {elapsed:.1f}초, 초당 {total / max(elapsed, 1e-6):.0f}건)")
+
+    return total
+
+# 저장된 문화재 자연 키별 (ID, 행 내용 해시)
+async def load_heritage_fingerprints(conn: AsyncConnection) -> Dict[str, Tuple[int, Optional[str]]]:
+    result = await conn.stream(select(Heritage.source_key, Heritage.id, Heritage.source_hash)
+                               .where(Heritage.source_key.isnot(None)))
+    return {source_key: (heritage_id, source_hash) async for source_key, heritage_id, source_hash in result}
+
+# 원본에서 사라진 문화재 삭제 (다른 테이블에서 참조 중인 문화재는 유지)
+async def delete_missing_heritages(conn: AsyncConnection, heritage_ids: List[int]) -> Tuple[List[int], List[int]]:
+    if not heritage_ids:
+        return [], []
+
+    referenced = [exists().where(model.heritage_id == Heritage.id) for model in HERITAGE_REFERENCES]
+    result = await conn.execute(select(Heritage.id).where(and_(Heritage.id.in_(heritage_ids), *map(not_, referenced))))
+    deletable = [heritage_id for (heritage_id,) in result]
+
+    if deletable:
+        await conn.execute(delete(HeritageEra).where(HeritageEra.heritage_id.in_(deletable)))
+        await conn.execute(delete(Heritage).where(Heritage.id.in_(deletable)))
+
+    retained = sorted(set(heritage_ids) - set(deletable))
+    return deletable, retained
+
+# 증분 동기화 (변경된 행만 적재하고 변경 내역 반환)
+async def sync_heritages(csv_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
+    started_at = time.monotonic()
+    inserted_keys: List[str] = []
+    updated_ids: List[int] = []
+    seen_keys: Set[str] = set()
+    unchanged = 0
+
+    async with engine.connect() as conn:
+        fingerprints = await load_heritage_fingerprints(conn)
+    logger.info(f"저장된 문화재 해시 로드 완료 ({len(fingerprints)}건)")
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+        changed = []
+        for record in clean_chunk(chunk).to_dict("records"):
+            seen_keys.add(record["source_key"])
+            stored = fingerprints.get(record["source_key"])
+            if stored is None:
+                inserted_keys.append(record["source_key"])
+                changed.append(record)
+            elif stored[1] != record["source_hash"]:
+                updated_ids.append(stored[0])
+                changed.append(record)
+            else:
+                unchanged += 1
+
+        if changed:
+            async with engine.begin() as conn:
+                await upsert_heritages(conn, changed)
+                await replace_heritage_eras(conn, changed)
+
+        logger.info(
+            f"문화재 동기화 진행 중 (추가 {len(inserted_keys)}건, 변경 {len(updated_ids)}건, "
+            f"유지 {unchanged}건, {time.monotonic() - started_at:.1f}초)"
+        )
+
+    missing_ids = [heritage_id for source_key, (heritage_id, _) in fingerprints.items() if source_key not in seen_keys]
+    async with engine.begin() as conn:
+        deleted_ids, retained_ids = await delete_missing_heritages(conn, missing_ids)
+        inserted_ids = []
+        for start in range(0, len(inserted_keys), chunk_size):
+            result = await conn.execute(select(Heritage.id)
+                                        .where(Heritage.source_key.in_(inserted_keys[start:start + chunk_size])))
+            inserted_ids.extend(heritage_id for (heritage_id,) in result)
+
+    if retained_ids:
+        logger.warning(f"원본에서 사라졌지만 참조 중이라 삭제하지 않은 문화재: {retained_ids}")
+
+    return {
+        "synced_at": datetime.now(timezone.utc).isoformat(),
+        "inserted": sorted(inserted_ids),
+        "updated": sorted(updated_ids),
+        "deleted": sorted(deleted_ids),
+        "retained": retained_ids
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="문화재 CSV 일괄 적재")
+    parser.add_argument("csv_path", help="적재할 CSV 파일 경로")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 행 수")
+    parser.add_argument("--sync", action="store_true", help="변경된 행만 적재하고 사라진 행 삭제")
+    parser.add_argument("--changes", help="변경 내역 JSON 출력 경로 (미지정 시 표준 출력)")
+    args = parser.parse_args()
+
+    if args.sync:
+        changes = await sync_heritages(args.csv_path, args.chunk_size)
+        logger.info(
+            f"문화재 동기화 완료 (추가 {len(changes['inserted'])}건, 변경 {len(changes['updated'])}건, "
+            f"삭제 {len(changes['deleted'])}건)"
+        )
+        if args.changes:
+            with open(args.changes, "w", encoding="utf-8") as file:
+                json.dump(changes, file, ensure_ascii=False)
+        else:
+            json.dump(changes, sys.stdout, ensure_ascii=False)
+            sys.stdout.write("\n")
+    else:
+        total = await ingest_heritages(args.csv_path, args.chunk_size)
+        logger.info(f"문화재 적재 완료 (총 {total}건)")
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,296 @@
+"""
+기존 데이터베이스 스키마 마이그레이션
+
+신규 설치는 애플리케이션 시작 시 create_all 로 테이블이 생성되지만,
+이미 운영 중인 테이블은 컬럼/인덱스 변경이 반영되지 않으므로 이 명령으로 적용한다.
+
+사용법: python -m app.commands.migrate
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.commands.backfill_locations import backfill_heritage_locations
+from app.commands.ingest_heritages import EMPTY_STRING_VALUES, STRING_COLUMNS, heritage_source_key
+from app.core.config import settings
+from app.core.database import engine
+# 외래키 대상 테이블 메타데이터 등록을 위해 전체 모델 로드
+from app.models.init import ChatSessionArchive, HeritageEra
+from app.tasks.partition_maintenance import FUTURE_PARTITION, add_months, get_partitions, monthly_partition_definitions
+from app.utils.codec import CODEC_MARKER, ensure_encoded
+from app.utils.common import classify_era
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 컬럼 존재 여부 확인
+async def column_exists(conn: AsyncConnection, table: str, column: str) -> bool:
+    result = await conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column
+    """), {"table": table, "column": column})
+    return result.scalar() > 0
+
+# 인덱스 존재 여부 확인
+async def index_exists(conn: AsyncConnection, table: str, index: str) -> bool:
+    result = await conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :index
+    """), {"table": table, "index": index})
+    return result.scalar() > 0
+
+# 0001: 거리 검색용 POINT 컬럼 및 SPATIAL INDEX 추가
+async def add_geo_point_columns(conn: AsyncConnection):
+    for table in ("heritages", "heritage_buildings"):
+        if not await column_exists(conn, table, "geo_point"):
+            await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN geo_point POINT NULL AFTER longitude"))
+            await conn.execute(text(f"""
+                UPDATE {table}
+                SET geo_point = ST_SRID(POINT(COALESCE(longitude, 0), COALESCE(latitude, 0)), 4326)
+            """))
+            await conn.execute(text(f"ALTER TABLE {table} MODIFY geo_point POINT NOT NULL SRID 4326"))
+
+        if not await index_exists(conn, table, f"ix_{table}_geo_point"):
+            await conn.execute(text(f"CREATE SPATIAL INDEX ix_{table}_geo_point ON {table} (geo_point)"))
+
+# 0002: 문화재 이름 전문 검색용 FULLTEXT ngram 인덱스 추가
+async def add_heritage_name_fulltext_index(conn: AsyncConnection):
+    if not await index_exists(conn, "heritages", "ft_heritages_name"):
+        await conn.execute(text(
+            "CREATE FULLTEXT INDEX ft_heritages_name ON heritages (name, name_hanja) WITH PARSER ngram"
+        ))
+
+# 0003: 정규화된 시대 카테고리 테이블 생성 및 기존 데이터 분류
+async def add_heritage_era_categories(conn: AsyncConnection):
+    await conn.run_sync(lambda sync_conn: HeritageEra.__table__.create(sync_conn, checkfirst=True))
+    await conn.execute(text("DELETE FROM heritage_eras"))
+
+    result = await conn.execute(text("SELECT id, era FROM heritages"))
+    rows = [
+        {"era": category.name, "heritage_id": heritage_id}
+        for heritage_id, era in result
+        for category in classify_era(era)
+    ]
+    if rows:
+        await conn.execute(text("INSERT INTO heritage_eras (era, heritage_id) VALUES (:era, :heritage_id)"), rows)
+    logger.info(f"시대 카테고리 분류 완료 (분류 건수: {len(rows)})")
+
+# 0004: 표시용 위치 컬럼 추가 및 기존 데이터 백필
+async def add_heritage_display_locations(conn: AsyncConnection):
+    for column in ("location_list", "location_detail"):
+        if not await column_exists(conn, "heritages", column):
+            await conn.execute(text(f"ALTER TABLE heritages ADD COLUMN {column} VARCHAR(255) NULL AFTER location"))
+
+    await backfill_heritage_locations(conn)
+
+# 0005: 지역 코드 정수 변환 및 적재 UPSERT 용 자연 키 해시 컬럼 추가
+async def add_heritage_source_key(conn: AsyncConnection):
+    await conn.execute(text("ALTER TABLE heritages MODIFY area_code INT NULL"))
+
+    if not await column_exists(conn, "heritages", "source_key"):
+        await conn.execute(text("ALTER TABLE heritages ADD COLUMN source_key VARCHAR(40) NULL AFTER image_url"))
+
+    # 기존 적재 스크립트가 빈 값을 'nan' 등의 문자열로 저장했으므로 CSV 적재와 같이 NULL 로 정리
+    empty_values = ", ".join(f"'{value}'" for value in EMPTY_STRING_VALUES)
+    for column in STRING_COLUMNS:
+        await conn.execute(text(f"UPDATE heritages SET {column} = NULL WHERE BINARY TRIM({column}) IN ({empty_values})"))
+
+    result = await conn.execute(text("SELECT id, heritage_type_id, area_code, name, name_hanja FROM heritages"))
+    rows = [
+        {"id": heritage_id, "source_key": heritage_source_key(heritage_type_id, area_code, name, name_hanja)}
+        for heritage_id, heritage_type_id, area_code, name, name_hanja in result
+    ]
+    if rows:
+        await conn.execute(text("UPDATE heritages SET source_key = :source_key WHERE id = :id"), rows)
+
+    # 기존 데이터에 자연 키 중복이 있으면 인덱스 생성이 실패하므로 먼저 정리 필요
+    if not await index_exists(conn, "heritages", "source_key"):
+        await conn.execute(text("CREATE UNIQUE INDEX source_key ON heritages (source_key)"))
+
+# 0006: 증분 동기화 변경 감지용 원본 행 해시 컬럼 추가
+async def add_heritage_source_hash(conn: AsyncConnection):
+    if not await column_exists(conn, "heritages", "source_hash"):
+        await conn.execute(text("ALTER TABLE heritages ADD COLUMN source_hash VARCHAR(40) NULL AFTER source_key"))
+
+# 0007: 채팅 세션 조회 인덱스 및 종료 세션 대화 내용 보관 테이블 추가
+async def add_chat_session_archive(conn: AsyncConnection):
+    if not await index_exists(conn, "chat_sessions", "ix_chat_sessions_active"):
+        await conn.execute(text("CREATE INDEX ix_chat_sessions_active ON chat_sessions (user_id, heritage_id, end_time)"))
+    if not await index_exists(conn, "chat_sessions", "ix_chat_sessions_idle"):
+        await conn.execute(text("CREATE INDEX ix_chat_sessions_idle ON chat_sessions (end_time, updated_at)"))
+
+    await conn.run_sync(lambda sync_conn: ChatSessionArchive.__table__.create(sync_conn, checkfirst=True))
+
+# 0008: 대화 내용 / 슬라이딩 윈도우 컬럼 이진 변환 후 기존 데이터 압축 인코딩
+async def compress_chat_conversations(conn: AsyncConnection, batch_size: int = 500):
+    await conn.execute(text(
+        "ALTER TABLE chat_sessions MODIFY full_conversation MEDIUMBLOB NULL, MODIFY sliding_window MEDIUMBLOB NULL"
+    ))
+
+    targets = [
+        ("chat_sessions", "id", ("full_conversation", "sliding_window")),
+        ("chat_session_archives", "session_id", ("full_conversation",)),
+    ]
+    for table, key, columns in targets:
+        last_id, converted = 0, 0
+        while True:
+            result = await conn.execute(text(f"""
+                SELECT {key}, {', '.join(columns)} FROM {table}
+                WHERE {key} > :last_id ORDER BY {key} LIMIT :limit
+            """), {"last_id": last_id, "limit": batch_size})
+            rows = result.all()
+            if not rows:
+                break
+
+            # 헤더 없는 기존 데이터만 다시 인코딩
+            updates = [
+                {"key": row[0], **{column: ensure_encoded(value) for column, value in zip(columns, row[1:])}}
+                for row in rows
+                if any(value is not None and value[:1] != CODEC_MARKER for value in row[1:])
+            ]
+            if updates:
+                assignments = ", ".join(f"{column} = :{column}" for column in columns)
+                await conn.execute(text(f"UPDATE {table} SET {assignments} WHERE {key} = :key"), updates)
+
+            last_id = rows[-1][0]
+            converted += len(updates)
+        logger.info(f"{table} 대화 내용 압축 인코딩 완료 ({converted}건)")
+
+# 0009: 채팅 메시지 created_at 기준 월별 RANGE 파티션 적용
+async def partition_chat_messages(conn: AsyncConnection):
+    await conn.execute(text("UPDATE chat_messages SET created_at = COALESCE(timestamp, NOW()) WHERE created_at IS NULL"))
+
+    # 파티션 테이블은 외래키를 지원하지 않으므로 제거 (세션 ID 인덱스는 유지)
+    result = await conn.execute(text("""
+        SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS
+        WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'chat_messages'
+    """))
+    for (constraint,) in result.all():
+        await conn.execute(text(f"ALTER TABLE chat_messages DROP FOREIGN KEY {constraint}"))
+
+    # 파티션 키가 모든 유니크 키에 포함되어야 하므로 PK 를 (id, created_at) 으로 변경
+    result = await conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'chat_messages' AND INDEX_NAME = 'PRIMARY'
+    """))
+    if result.scalar() < 2:
+        await conn.execute(text("""
+            ALTER TABLE chat_messages
+            MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)
+        """))
+
+    if not await index_exists(conn, "chat_messages", "ix_chat_messages_session_role_created"):
+        await conn.execute(text(
+            "CREATE INDEX ix_chat_messages_session_role_created ON chat_messages (session_id, role, created_at)"
+        ))
+
+    if await get_partitions(conn, "chat_messages"):
+        return
+
+    # 가장 오래된 메시지가 속한 달부터 앞으로 사용할 달까지 월별 파티션 생성
+    result = await conn.execute(text("SELECT MIN(created_at), CURRENT_DATE() FROM chat_messages"))
+    oldest, today = result.one()
+    last_month = add_months(today.replace(day=1), settings.CHAT_MESSAGE_PARTITION_MONTHS_AHEAD)
+    first_month = oldest.date().replace(day=1) if oldest else today.replace(day=1)
+
+    definitions = monthly_partition_definitions(first_month, last_month)
+    await conn.execute(text(
+        f"ALTER TABLE chat_messages PARTITION BY RANGE COLUMNS(created_at) "
+        f"({', '.join(definitions)}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE))"
+    ))
+    logger.info(f"chat_messages 월별 파티션 적용 완료 ({len(definitions)}개)")
+
+# 0010: 사용자 / 문화재별 활성 세션 유니크 제약 추가 (기존 중복 활성 세션은 최근 세션만 유지)
+async def add_chat_session_active_unique(conn: AsyncConnection):
+    await conn.execute(text("""
+        UPDATE chat_sessions s
+        JOIN (
+            SELECT user_id, heritage_id, MAX(id) AS latest_id FROM chat_sessions
+            WHERE end_time IS NULL GROUP BY user_id, heritage_id HAVING COUNT(*) > 1
+        ) d ON s.user_id = d.user_id AND s.heritage_id = d.heritage_id
+        SET s.end_time = NOW()
+        WHERE s.end_time IS NULL AND s.id <> d.latest_id
+    """))
+
+    if not await column_exists(conn, "chat_sessions", "is_active"):
+        await conn.execute(text(
+            "ALTER TABLE chat_sessions ADD COLUMN is_active BOOL "
+            "GENERATED ALWAYS AS (IF(end_time IS NULL, 1, NULL)) VIRTUAL AFTER end_time"
+        ))
+    if not await index_exists(conn, "chat_sessions", "ux_chat_sessions_active"):
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX ux_chat_sessions_active ON chat_sessions (user_id, heritage_id, is_active)"
+        ))
+    # 활성 세션 조회는 유니크 인덱스로 대체
+    if await index_exists(conn, "chat_sessions", "ix_chat_sessions_active"):
+        await conn.execute(text("DROP INDEX ix_chat_sessions_active ON chat_sessions"))
+
+# 0011: 이용 통계 증분 집계용 보관 시각 인덱스 추가 (집계 테이블은 시작 시 create_all 로 생성)
+async def add_chat_session_archive_time_index(conn: AsyncConnection):
+    if not await index_exists(conn, "chat_session_archives", "ix_chat_session_archives_archived"):
+        await conn.execute(text(
+            "CREATE INDEX ix_chat_session_archives_archived ON chat_session_archives (archived_at, session_id)"
+        ))
+
+# 0012: 게스트 토큰 만료 시각 컬럼 및 정리 대상 조회 인덱스 추가
+async def add_user_token_expiry(conn: AsyncConnection):
+    if not await column_exists(conn, "users", "token_expires_at"):
+        await conn.execute(text("ALTER TABLE users ADD COLUMN token_expires_at DATETIME NULL AFTER token"))
+        # 기존 토큰은 마지막 로그인 (토큰 발급) 시각 기준으로 만료 시각 계산
+        await conn.execute(text("""
+            UPDATE users
+            SET token_expires_at = COALESCE(last_login, created_at) + INTERVAL :minutes MINUTE,
+                last_login = last_login
+            WHERE token IS NOT NULL
+        """), {"minutes": settings.GUEST_TOKEN_EXPIRE_MINUTES})
+
+    if not await index_exists(conn, "users", "ix_users_token_expires_at"):
+        await conn.execute(text("CREATE INDEX ix_users_token_expires_at ON users (token_expires_at)"))
+    if not await index_exists(conn, "users", "ix_users_last_login"):
+        await conn.execute(text("CREATE INDEX ix_users_last_login ON users (last_login)"))
+
+MIGRATIONS: List[Tuple[str, Callable[[AsyncConnection], Awaitable[None]]]] = [
+    ("0001_add_geo_point_columns", add_geo_point_columns),
+    ("0002_add_heritage_name_fulltext_index", add_heritage_name_fulltext_index),
+    ("0003_add_heritage_era_categories", add_heritage_era_categories),
+    ("0004_add_heritage_display_locations", add_heritage_display_locations),
+    ("0005_add_heritage_source_key", add_heritage_source_key),
+    ("0006_add_heritage_source_hash", add_heritage_source_hash),
+    ("0007_add_chat_session_archive", add_chat_session_archive),
+    ("0008_compress_chat_conversations", compress_chat_conversations),
+    ("0009_partition_chat_messages", partition_chat_messages),
+    ("0010_add_chat_session_active_unique", add_chat_session_active_unique),
+    ("0011_add_chat_session_archive_time_index", add_chat_session_archive_time_index),
+    ("0012_add_user_token_expiry", add_user_token_expiry),
+]
+
+async def migrate():
+    async with engine.begin() as conn:
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                name VARCHAR(100) PRIMARY KEY,
+                applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        result = await conn.execute(text("SELECT name FROM schema_migrations"))
+        applied = {row[0] for row in result}
+
+    for name, migration in MIGRATIONS:
+        if name in applied:
+            continue
+
+        logger.info(f"마이그레이션을 적용합니다: {name}")
+        # MySQL DDL 은 암묵적으로 커밋되므로 각 단계는 재실행 가능하도록 작성
+        async with engine.begin() as conn:
+            await migration(conn)
+            await conn.execute(text("INSERT INTO schema_migrations (name) VALUES (:name)"), {"name": name})
+        logger.info(f"마이그레이션 적용 완료: {name}")
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -1,4 +1,4 @@
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal, Optional
 from dotenv import load_dotenv
 
 # load .env file
@@ -76,14 +76,91 @@ class Settings(BaseSettings):
     MAX_RETRIES : int
     RETRY_DELAY : int
 
+    # 유휴 채팅 세션 정리 및 종료 세션 대화 내용 보관
+    CHAT_SESSION_SWEEPER_ENABLED : bool = True
+    CHAT_SESSION_SWEEP_INTERVAL_SECONDS : int = 300
+    CHAT_SESSION_SWEEP_BATCH_SIZE : int = 500
+    CHAT_SESSION_IDLE_MINUTES : int = 120
+    # 종료 후 요약 생성이 끝날 시간을 두고 보관
+    CHAT_SESSION_ARCHIVE_AFTER_MINUTES : int = 60
+
+    # 채팅 메시지 월별 파티션 관리 (보관 기간이 지난 파티션은 통째로 삭제 또는 별도 테이블로 분리)
+    CHAT_MESSAGE_PARTITION_ENABLED : bool = True
+    CHAT_MESSAGE_PARTITION_INTERVAL_SECONDS : int = 86400
+    CHAT_MESSAGE_PARTITION_MONTHS_AHEAD : int = 3
+    # 0 이면 보관 기간 제한 없음
+    CHAT_MESSAGE_RETENTION_MONTHS : int = 12
+    # drop: 파티션 삭제 / archive: chat_messages_pYYYYMM 테이블로 교환 후 삭제
+    CHAT_MESSAGE_RETENTION_MODE : Literal["drop", "archive"] = "archive"
+
+    # 사용자 이용 기록 내보내기 (서버 측 커서로 한 번에 읽는 행 수)
+    USER_EXPORT_BATCH_SIZE : int = 500
+
+    # 이용 통계 증분 집계 (커밋 중일 수 있는 최근 행은 SETTLE_MINUTES 이후 집계, 복제 지연보다 길게 설정)
+    ANALYTICS_ENABLED : bool = True
+    ANALYTICS_INTERVAL_SECONDS : int = 600
+    ANALYTICS_BATCH_SIZE : int = 5000
+    ANALYTICS_SETTLE_MINUTES : int = 5
+    ANALYTICS_USE_REPLICA : bool = True
+
     # 로그인 보안 관리
     SECRET_KEY : str
     ALGORITHM : str
     ACCESS_TOKEN_EXPIRE_MINUTES : int
+    # 임시 로그인 (게스트) 토큰 만료 시간
+    GUEST_TOKEN_EXPIRE_MINUTES : int = 60
+
+    # 만료된 게스트 토큰 정리 및 이용 기록 없는 게스트 사용자 삭제
+    GUEST_SWEEPER_ENABLED : bool = True
+    GUEST_SWEEP_INTERVAL_SECONDS : int = 300
+    GUEST_SWEEP_BATCH_SIZE : int = 200
+    # 토큰 만료 후 세션 / 북마크 없이 이 기간이 지나면 사용자 삭제
+    GUEST_USER_RETENTION_DAYS : int = 7
 
     # 기본 이미지 URL
     DEFAULT_IMAGE_URL : str
 
+    # 데이터베이스 커넥션 풀
+    DB_POOL_SIZE : int = 10
+    DB_MAX_OVERFLOW : int = 20
+    DB_POOL_TIMEOUT_SECONDS : int = 30
+    DB_POOL_RECYCLE_SECONDS : int = 1800
+    DB_POOL_PRE_PING : bool = True
+    # 엔진별 컴파일 SQL 캐시 크기 (lambda_stmt 조회는 호출 위치별로 항목을 사용)
+    DB_QUERY_CACHE_SIZE : int = 1200
+
+    # 읽기 전용 복제본 (쉼표로 구분한 host[:port], 미설정 시 모든 조회를 주 DB 로 처리)
+    MYSQL_REPLICA_SERVERS : Optional[str] = None
+    # 쓰기 후 복제 지연 동안 같은 클라이언트의 조회를 주 DB 로 고정하는 시간
+    REPLICA_PRIMARY_PIN_SECONDS : int = 5
+
+    # 느린 쿼리 로그 (경고 / 오류 기준 시간, ms)
+    SLOW_QUERY_LOG_ENABLED : bool = False
+    SLOW_QUERY_WARN_MS : int = 200
+    SLOW_QUERY_ERROR_MS : int = 1000
+
+    # 요청별 쿼리 집계 (요청당 쿼리 수 예산, 같은 구문이 이 횟수 이상 반복되면 N+1 의심 쿼리로 기록)
+    QUERY_STATS_ENABLED : bool = True
+    QUERY_BUDGET_PER_REQUEST : int = 20
+    QUERY_REPEAT_THRESHOLD : int = 5
+
+    # 문화재 검색 인메모리 인덱스
+    HERITAGE_INDEX_ENABLED : bool = True
+    HERITAGE_INDEX_REFRESH_SECONDS : int = 600
+    # 설정 시 export_heritage_catalog 로 생성한 컬럼 파일을 mmap 으로 공유 (DB 조회 없음)
+    HERITAGE_CATALOG_PATH : Optional[str] = None
+
+    # 문화재 유형 / 건축물 / 코스 참조 데이터 스냅샷
+    REFERENCE_SNAPSHOT_ENABLED : bool = True
+    REFERENCE_SNAPSHOT_REFRESH_SECONDS : int = 600
+
+    # 문화재 검색 전체 개수 캐시
+    HERITAGE_COUNT_CACHE_TTL_SECONDS : int = 60
+    HERITAGE_COUNT_CACHE_SIZE : int = 1024
+
+    # 문화재 이름 전문 검색 (MySQL ngram_token_size 와 동일하게 설정)
+    FULLTEXT_NGRAM_TOKEN_SIZE : int = 2
+
     @computed_field
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> MySQLDsn:
@@ -96,4 +173,23 @@ class Settings(BaseSettings):
             path=self.MYSQL_DB,
         )
 
+    @computed_field
+    @property
+    def SQLALCHEMY_REPLICA_URIS(self) -> list[str]:
+        if not self.MYSQL_REPLICA_SERVERS:
+            return []
+
+        uris = []
+        for server in self.MYSQL_REPLICA_SERVERS.split(","):
+            host, _, port = server.strip().partition(":")
+            uris.append(str(MultiHostUrl.build(
+                scheme="mysql+aiomysql",
+                username=self.MYSQL_USER,
+                password=self.MYSQL_PASSWORD,
+                host=host,
+                port=int(port) if port else self.MYSQL_PORT,
+                path=self.MYSQL_DB,
+            )))
+        return uris
+
 settings = Settings()
\ No newline at end of file
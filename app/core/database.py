@@ -1,17 +1,90 @@
-from sqlalchemy.orm import sessionmaker
+import random
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 
 from app.core.config import settings
+from app.core.db_metrics import InstrumentedAsyncQueuePool, enable_slow_query_log
+from app.core.query_stats import enable_query_stats
+
+def create_pooled_engine(url: str, **kwargs):
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        **kwargs
+    )
+
+# 복제본 조회 전용 엔진 (autocommit 으로 트랜잭션 없이 조회, 반환 시 풀 ROLLBACK 생략)
+def create_read_engine(url: str):
+    return create_pooled_engine(url, isolation_level="AUTOCOMMIT", pool_reset_on_return=None)
+
+# 애플리케이션 전체에서 공유하는 단일 엔진 (워커당 주 DB 커넥션 풀 1개)
+engine = create_pooled_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+# 주 DB 조회 전용 엔진 (복제본 미설정 또는 쓰기 직후 클라이언트의 조회)
+# 별도 풀을 만들지 않고 engine 의 풀을 공유하며 체크아웃한 커넥션만 autocommit 으로 전환 (반환 시 격리 수준 복원)
+primary_read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+# 읽기 전용 복제본 엔진 (설정된 경우에만)
+replica_engines = [create_read_engine(url) for url in settings.SQLALCHEMY_REPLICA_URIS]
+
+# 커넥션 풀을 가진 엔진 (지표 조회 / 이벤트 등록 대상, primary_read_engine 은 engine 의 풀과 이벤트를 공유)
+pooled_engines = {
+    "primary": engine,
+    **{f"replica:{replica.url.host}:{replica.url.port}": replica for replica in replica_engines}
+}
 
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True)
+if settings.SLOW_QUERY_LOG_ENABLED:
+    for pooled_engine in pooled_engines.values():
+        enable_slow_query_log(pooled_engine.sync_engine, settings.SLOW_QUERY_WARN_MS, settings.SLOW_QUERY_ERROR_MS)
+
+if settings.QUERY_STATS_ENABLED:
+    for pooled_engine in pooled_engines.values():
+        enable_query_stats(pooled_engine.sync_engine)
 
 Base = declarative_base()
 
+class RoutingSession(Session):
+    """
+    조회 / 쓰기 라우팅 세션
+    - info["read_only"] 가 설정된 세션은 autocommit 조회 전용 엔진 사용
+    - info["use_replica"] 가 설정된 세션의 조회는 복제본으로 전송
+    - 쓰기가 한 번이라도 발생한 세션은 이후 모든 쿼리를 주 DB 로 전송
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("has_writes") or self._flushing:
+            return engine.sync_engine
+
+        use_replica = self.info.get("use_replica") and replica_engines
+        if self.info.get("read_only"):
+            return (random.choice(replica_engines) if use_replica else primary_read_engine).sync_engine
+        if use_replica:
+            return random.choice(replica_engines).sync_engine
+        return engine.sync_engine
+
+# 쓰기 발생 여부 기록 (ORM flush 및 UPDATE / DELETE / INSERT 문 실행)
+@event.listens_for(RoutingSession, "after_flush")
+def mark_session_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def mark_statement_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
 AsyncSessionLocal = sessionmaker (
     autocommit=False,    # False인 경우 자동으로 트랜잭션 커밋 X   
     autoflush=False,     # True인 경우 쿼리 작업 실행 전 보류 중인 DB 변경 사항을 자동으로 Flush 
-    bind=engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False
-)
\ No newline at end of file
+)
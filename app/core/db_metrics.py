@@ -0,0 +1,86 @@
+import time
+import logging
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger("app.sql.slow_query")
+
+class PoolCheckoutStats:
+    """커넥션 풀 체크아웃 대기 시간 누적 통계"""
+    __slots__ = ("count", "total_seconds", "max_seconds", "timeouts")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.timeouts = 0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 비동기 커넥션 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkout_stats = self.checkout_stats
+        return pool
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            self.checkout_stats.timeouts += 1
+            raise
+        finally:
+            self.checkout_stats.record(time.perf_counter() - started_at)
+
+# 커넥션 풀 사용 현황 및 체크아웃 대기 시간
+def get_pool_metrics(pool: InstrumentedAsyncQueuePool) -> Dict[str, float]:
+    stats = pool.checkout_stats
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "utilization": round(pool.checkedout() / capacity, 4) if capacity else 0.0,
+        "checkout_count": stats.count,
+        "checkout_timeouts": stats.timeouts,
+        "checkout_wait_avg_ms": round(stats.total_seconds / stats.count * 1000, 3) if stats.count else 0.0,
+        "checkout_wait_max_ms": round(stats.max_seconds * 1000, 3),
+    }
+
+# 느린 쿼리 로그 등록 (경고 / 오류 기준 시간 초과 시에만 기록)
+def enable_slow_query_log(engine: Engine, warn_ms: int, error_ms: int):
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+        if elapsed_ms < warn_ms:
+            return
+
+        level = logging.ERROR if elapsed_ms >= error_ms else logging.WARNING
+        logger.log(level, f"느린 쿼리 ({elapsed_ms:.1f}ms): {' '.join(statement.split())[:1000]}")
+
+    # 실행 실패 시 시작 시각 정리
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("query_started_at") if context.connection is not None else None
+        if started:
+            started.pop()
@@ -1,14 +1,27 @@
 from typing import Optional
-from fastapi import HTTPException, Header, status
+from fastapi import HTTPException, Header, Request, status
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.core.primary_pin import is_primary_pinned, register_write_session
 
-async def get_db():
+# 쓰기 세션을 요청 state 에 등록 (쓰기가 발생하면 PrimaryPinMiddleware 가 응답에 주 DB 고정 쿠키 설정)
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
+        register_write_session(request, session.sync_session)
         yield session
         await session.commit()
         # with을 사용하면 알아서 session을 닫아줌
         # await session.close()
 
+# 조회 전용 엔드포인트용 세션
+# - autocommit 조회 전용 엔진을 사용하며 커밋하지 않음
+# - 복제본으로 라우팅하되, 최근 쓰기한 클라이언트 (주 DB 고정 쿠키 유효) 는 주 DB 로 조회
+async def get_read_db(request: Request):
+    use_replica = not is_primary_pinned(request, settings.REPLICA_PRIMARY_PIN_SECONDS)
+
+    async with AsyncSessionLocal(info={"read_only": True, "use_replica": use_replica}) as session:
+        yield session
+
 async def get_token(Authorization: Optional[str] = Header(None)) -> str:
     if not Authorization:
         raise HTTPException(
@@ -0,0 +1,73 @@
+"""
+쓰기 직후 조회의 주 DB 고정 (read-your-writes)
+
+쓰기가 발생한 요청의 응답에 고정 만료 시각 쿠키를 설정하고, 이후 요청은 쿠키가 유효한 동안 주 DB 로 조회한다.
+워커 메모리가 아닌 클라이언트 쿠키에 두므로 다음 요청이 다른 워커로 가도 동일하게 적용된다.
+
+- get_db 가 요청 scope 의 state 에 쓰기 세션을 등록
+- PrimaryPinMiddleware 가 응답 시작 시 세션에 쓰기가 있었거나 커밋 대기 중인 변경이 있으면 쿠키 설정
+"""
+import time
+from http.cookies import SimpleCookie
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+PRIMARY_PIN_COOKIE = "primary_pin_until"
+
+# 요청 scope state 에 등록하는 쓰기 세션 키
+WRITE_SESSION_STATE_KEY = "db_write_session"
+
+def register_write_session(request: Request, session: Session):
+    setattr(request.state, WRITE_SESSION_STATE_KEY, session)
+
+# 쓰기 실행 여부 또는 get_db 종료 시 커밋될 변경 (응답 시작 이후 flush) 여부
+def has_pending_writes(session: Optional[Session]) -> bool:
+    if session is None:
+        return False
+    return bool(session.info.get("has_writes") or session.new or session.dirty or session.deleted)
+
+# 고정 만료 시각이 남아 있는지 확인 (설정 시간보다 먼 만료 시각은 무시)
+def is_primary_pinned(request: Request, pin_seconds: int, now: Optional[float] = None) -> bool:
+    value = request.cookies.get(PRIMARY_PIN_COOKIE)
+    if not value:
+        return False
+    try:
+        pinned_until = float(value)
+    except ValueError:
+        return False
+    now = time.time() if now is None else now
+    return now < pinned_until <= now + pin_seconds
+
+def build_pin_cookie(pin_seconds: int, now: Optional[float] = None) -> str:
+    pinned_until = (time.time() if now is None else now) + pin_seconds
+    cookie = SimpleCookie()
+    cookie[PRIMARY_PIN_COOKIE] = f"{pinned_until:.3f}"
+    cookie[PRIMARY_PIN_COOKIE]["max-age"] = pin_seconds
+    cookie[PRIMARY_PIN_COOKIE]["path"] = "/"
+    cookie[PRIMARY_PIN_COOKIE]["httponly"] = True
+    cookie[PRIMARY_PIN_COOKIE]["samesite"] = "Lax"
+    return cookie.output(header="").strip()
+
+class PrimaryPinMiddleware:
+    """쓰기가 발생한 요청의 응답에 주 DB 고정 쿠키 설정"""
+
+    def __init__(self, app, pin_seconds: int):
+        self.app = app
+        self.pin_seconds = pin_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.pin_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start":
+                if has_pending_writes(scope.get("state", {}).get(WRITE_SESSION_STATE_KEY)):
+                    headers = list(message.get("headers", []))
+                    headers.append((b"set-cookie", build_pin_cookie(self.pin_seconds).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
@@ -0,0 +1,113 @@
+"""
+요청별 SQL 실행 통계
+
+엔진 커서 이벤트로 요청마다 실행한 쿼리 수 / DB 시간을 집계하고,
+같은 구문이 반복 실행되면 N+1 의심 쿼리로 기록한다.
+
+- QueryStatsMiddleware 가 요청 시작 시 통계 객체를 contextvar 에 설정
+- 요청 종료 시 쿼리 예산 초과 / N+1 의심 쿼리를 로그로 남기고 등록된 관찰자에게 전달
+  (테스트에서는 conftest.py 의 query_budget 픽스처가 관찰자로 등록하여 예산 초과 시 실패 처리)
+"""
+import time
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.sql.query_stats")
+
+class RequestQueryStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.statements[" ".join(statement.split())] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total_seconds * 1000, 3)
+
+    # threshold 회 이상 반복 실행된 구문 (N+1 의심)
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        return {statement: count for statement, count in self.statements.items() if count >= threshold}
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+# 요청 종료 시 통계를 전달받는 관찰자 (테스트 픽스처, 지표 수집 등)
+_observers: List[Callable[[RequestQueryStats], None]] = []
+
+def get_current_query_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+def add_query_stats_observer(observer: Callable[[RequestQueryStats], None]):
+    _observers.append(observer)
+
+def remove_query_stats_observer(observer: Callable[[RequestQueryStats], None]):
+    if observer in _observers:
+        _observers.remove(observer)
+
+# 요청별 쿼리 집계 이벤트 등록 (요청 밖에서 실행된 쿼리는 집계하지 않음)
+def enable_query_stats(engine: Engine):
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_stats.get() is not None:
+            conn.info.setdefault("query_stats_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        started = conn.info.get("query_stats_started_at")
+        if stats is not None and started:
+            stats.record(statement, time.perf_counter() - started.pop())
+
+    # 실행 실패 시 시작 시각 정리
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("query_stats_started_at") if context.connection is not None else None
+        if started:
+            started.pop()
+
+class QueryStatsMiddleware:
+    """요청별 쿼리 수 / DB 시간 집계 및 쿼리 예산 초과, N+1 의심 쿼리 로그"""
+
+    def __init__(self, app, budget: int, repeat_threshold: int):
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(f"{scope['method']} {scope['path']}")
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_stats.reset(token)
+            self.report(stats)
+
+    def report(self, stats: RequestQueryStats):
+        if stats.count > self.budget:
+            logger.warning(f"쿼리 예산 초과 ({stats.path}): {stats.count}회 / 예산 {self.budget}회, DB 시간 {stats.total_ms}ms")
+
+        for statement, count in stats.repeated(self.repeat_threshold).items():
+            logger.warning(f"N+1 의심 쿼리 ({stats.path}): {count}회 반복 - {statement[:500]}")
+
+        for observer in list(_observers):
+            try:
+                observer(stats)
+            except Exception as e:
+                logger.error(f"쿼리 통계 관찰자 실행 중 오류 발생: {str(e)}", exc_info=True)
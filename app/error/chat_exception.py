@@ -9,6 +9,11 @@ class SessionNotFoundException(ChatServiceException):
     def __init__(self, session_id: int):
         super().__init__(f"세션 ID {session_id}인 채팅 세션을 찾을 수 없습니다.")
 
+class SessionEndedException(ChatServiceException):
+    """종료된 채팅 세션에 대화를 추가하려 할 때 발생하는 예외"""
+    def __init__(self, session_id: int):
+        super().__init__(f"세션 ID {session_id}인 채팅 세션은 이미 종료되었습니다.")
+
 class QuizGenerationException(ChatServiceException):
     """퀴즈 생성 중 오류가 발생했을 때 발생하는 예외"""
     def __init__(self, reason: str):
@@ -27,4 +27,9 @@ class InvalidCoordinatesException(HeritageServiceException):
 class DatabaseConnectionError(HeritageServiceException):
     """데이터베이스 연결 오류 시 발생하는 예외"""
     def __init__(self):
-        super().__init__("데이터베이스 연결에 실패했습니다.")
\ No newline at end of file
+        super().__init__("데이터베이스 연결에 실패했습니다.")
+
+class InvalidCursorException(HeritageServiceException):
+    """페이지네이션 커서가 유효하지 않을 때 발생하는 예외"""
+    def __init__(self, cursor: str):
+        super().__init__(f"유효하지 않은 페이지네이션 커서입니다: {cursor}")
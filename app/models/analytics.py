@@ -0,0 +1,37 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    DateTime
+)
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# 원본 테이블별 집계 완료 위치 (id 또는 (시각, id) 기준)
+class AnalyticsWatermark(Base):
+    __tablename__ = 'analytics_watermarks'
+    name = Column(String(50), primary_key=True)
+    last_id = Column(Integer, nullable=False, default=0)
+    last_time = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+# 일별 / 문화재별 이용 집계
+class DailyHeritageStat(Base):
+    __tablename__ = 'daily_heritage_stats'
+    stat_date = Column(Date, primary_key=True)
+    heritage_id = Column(Integer, primary_key=True)
+    session_count = Column(Integer, nullable=False, default=0)
+    turn_count = Column(Integer, nullable=False, default=0)     # 사용자 메시지 수
+    quiz_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+# 일별 / 건축물별 방문 집계 (채팅 요약의 visited_buildings 기준)
+class DailyBuildingVisit(Base):
+    __tablename__ = 'daily_building_visits'
+    stat_date = Column(Date, primary_key=True)
+    heritage_id = Column(Integer, primary_key=True)
+    building_name = Column(String(255), primary_key=True)
+    visit_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
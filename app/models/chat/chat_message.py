@@ -2,10 +2,12 @@ import enum
 from sqlalchemy import (
     Column, 
     Integer, 
-    ForeignKey, 
     DateTime, 
     Enum, 
-    Text
+    Text,
+    Index,
+    DDL,
+    event
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,12 +17,33 @@ from app.models.enums import RoleType
 
 class ChatMessage(Base):
     __tablename__ = 'chat_messages'
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey('chat_sessions.id'))
+    # created_at 기준 월별 RANGE 파티션 (파티션 키를 포함해야 하므로 PK 는 (id, created_at), 외래키 미사용)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    session_id = Column(Integer, nullable=False)
     role = Column(Enum(RoleType))
     content = Column(Text)
     timestamp = Column(DateTime(timezone=True), default=func.now())
-    created_at = Column(DateTime(timezone=True), default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, autoincrement=False, nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
 
-    chat_sessions = relationship("ChatSession", back_populates="chat_messages")
\ No newline at end of file
+    chat_sessions = relationship(
+        "ChatSession",
+        primaryjoin="foreign(ChatMessage.session_id) == ChatSession.id",
+        back_populates="chat_messages"
+    )
+
+    __table_args__ = (
+        # 세션별 최근 메시지 조회 (created_at 조건으로 파티션 프루닝)
+        Index('ix_chat_messages_session_role_created', 'session_id', 'role', 'created_at'),
+    )
+
+    # ORM 식별자는 AUTO_INCREMENT id 만 사용 (created_at 은 DB 서버 시각으로 저장)
+    __mapper_args__ = {"primary_key": [id]}
+
+# 테이블 생성 시 파티션 지정 (월별 파티션은 app.tasks.partition_maintenance 에서 추가)
+event.listen(
+    ChatMessage.__table__,
+    "after_create",
+    DDL("ALTER TABLE chat_messages PARTITION BY RANGE COLUMNS(created_at) (PARTITION p_future VALUES LESS THAN (MAXVALUE))")
+    .execute_if(dialect="mysql")
+)
@@ -4,8 +4,13 @@ from sqlalchemy import (
     ForeignKey, 
     DateTime, 
     Text,
+    LargeBinary,
     JSON,
-    String
+    String,
+    Boolean,
+    Computed,
+    Index,
+    UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -21,9 +26,11 @@ class ChatSession(Base):
     heritage_name = Column(String(255))
     start_time = Column(DateTime(timezone=True), server_default=func.now())
     end_time = Column(DateTime(timezone=True), nullable=True)
+    # 활성 세션이면 1, 종료된 세션이면 NULL (사용자 / 문화재별 활성 세션 유일성 제약용)
+    is_active = Column(Boolean, Computed("IF(end_time IS NULL, 1, NULL)", persisted=False))
     quiz_count = Column(Integer, default=settings.QUIZ_COUNT)
-    full_conversation = Column(Text)    # 전체 대화 내용 저장
-    sliding_window = Column(Text)       # 슬라이딩 윈도우 내용 저장
+    full_conversation = Column(LargeBinary(length=16777215))    # 전체 대화 내용 저장 (app.utils.codec 인코딩)
+    sliding_window = Column(LargeBinary(length=16777215))       # 슬라이딩 윈도우 내용 저장 (app.utils.codec 인코딩)
     summary_keywords = Column(JSON)     # 요약 키워드 저장
     visited_buildings = Column(JSON)    # 방문한 건물 목록 저장
     summary_generated_at = Column(DateTime(timezone=True), nullable=True)    # 요약 생성 시간 추적
@@ -32,6 +39,17 @@ class ChatSession(Base):
 
     users = relationship("User", back_populates="chat_sessions")
     heritages = relationship("Heritage", back_populates="chat_sessions")
-    chat_messages = relationship("ChatMessage", back_populates="chat_sessions")
+    chat_messages = relationship(
+        "ChatMessage",
+        primaryjoin="ChatSession.id == foreign(ChatMessage.session_id)",
+        back_populates="chat_sessions"
+    )
     quizzes = relationship("Quiz", back_populates="chat_sessions")
-    recommended_questions = relationship("RecommendedQuestion", back_populates="chat_sessions")
\ No newline at end of file
+    recommended_questions = relationship("RecommendedQuestion", back_populates="chat_sessions")
+
+    __table_args__ = (
+        # 사용자 / 문화재별 활성 세션은 1개 (종료된 세션은 NULL 이므로 제약 대상 아님)
+        UniqueConstraint('user_id', 'heritage_id', 'is_active', name='ux_chat_sessions_active'),
+        # 유휴 세션 정리 대상 조회
+        Index('ix_chat_sessions_idle', 'end_time', 'updated_at'),
+    )
\ No newline at end of file
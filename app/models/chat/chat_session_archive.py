@@ -0,0 +1,22 @@
+from sqlalchemy import (
+    Column, 
+    Integer, 
+    ForeignKey, 
+    DateTime, 
+    LargeBinary,
+    Index
+)
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+class ChatSessionArchive(Base):
+    __tablename__ = 'chat_session_archives'
+    session_id = Column(Integer, ForeignKey('chat_sessions.id'), primary_key=True)
+    full_conversation = Column(LargeBinary(length=16777215))    # 전체 대화 내용 (app.utils.codec 인코딩, MEDIUMBLOB)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # 보관 순서 기준 증분 집계 (app.tasks.usage_analytics)
+        Index('ix_chat_session_archives_archived', 'archived_at', 'session_id'),
+    )
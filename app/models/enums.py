@@ -35,6 +35,10 @@ class SortOrder(str, Enum):
     ASC = "오름차순"
     DESC = "내림차순"
 
+class CountMode(str, Enum):
+    EXACT = "정확"
+    ESTIMATED = "추정"
+
 class EraCategory(str, Enum):
     ALL = "전체"
     PREHISTORIC = "선사시대"
@@ -51,4 +55,8 @@ class EraCategory(str, Enum):
     GORYEO = "고려시대"
     JOSEON = "조선시대"
     KOREAN_EMPIRE = "대한제국시대"
-    JAPANESE_COLONIAL = "일제강점기"
\ No newline at end of file
+    JAPANESE_COLONIAL = "일제강점기"
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -6,12 +6,16 @@ from sqlalchemy import (
     DECIMAL, 
     Text, 
     DateTime,
-    ForeignKey
+    ForeignKey,
+    Index,
+    event
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.models.spatial import Point, sync_geo_point
+from app.utils.common import parse_location_for_detail, parse_location_for_list
 
 class Heritage(Base):
     __tablename__ = 'heritages'
@@ -21,15 +25,20 @@ class Heritage(Base):
     name_hanja = Column(String(100))
     description = Column(Text)
     location = Column(String(255))
+    location_list = Column(String(255))      # 리스트 표시용 위치 (location 변경 시 갱신)
+    location_detail = Column(String(255))    # 상세 표시용 위치 (location 변경 시 갱신)
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    geo_point = deferred(Column(Point(), nullable=False))    # 거리 검색용 좌표 (SPATIAL INDEX)
     category = Column(String(50))
     sub_category1 = Column(String(50))
     sub_category2 = Column(String(50))
     sub_category3 = Column(String(50))
     era = Column(String(255))
-    area_code = Column(Float)
+    area_code = Column(Integer)
     image_url = Column(String(255))
+    source_key = Column(String(40), unique=True)    # 적재 원본 자연 키 해시 (UPSERT 기준)
+    source_hash = Column(String(40))                # 적재 원본 행 내용 해시 (변경 감지)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -38,4 +47,22 @@ class Heritage(Base):
     buildings = relationship("HeritageBuilding", back_populates="heritages")
     routes = relationship("HeritageRoute", back_populates="heritages")
     bookmarks = relationship("UserBookmark", back_populates="heritages")
-    building_images = relationship("HeritageBuildingImage", back_populates="heritages")
\ No newline at end of file
+    building_images = relationship("HeritageBuildingImage", back_populates="heritages")
+    eras = relationship("HeritageEra", back_populates="heritages", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index('ix_heritages_geo_point', 'geo_point', mysql_prefix='SPATIAL'),
+        Index('ft_heritages_name', 'name', 'name_hanja', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+    )
+
+event.listen(Heritage, 'before_insert', sync_geo_point)
+event.listen(Heritage, 'before_update', sync_geo_point)
+
+# 시대 원문 (era) 변경 시 정규화된 시대 카테고리 (heritage_eras) 는 속성 이벤트로 동기화하지 않음
+# (AsyncSession 에서 로드되지 않은 eras 컬렉션 지연 로딩 불가) -> era 를 변경하는 적재 명령 (replace_heritage_eras) 에서 명시적으로 갱신
+
+# 위치 원문 변경 시 표시용 위치 컬럼 동기화
+@event.listens_for(Heritage.location, 'set')
+def sync_display_locations(target, value, oldvalue, initiator):
+    target.location_list = parse_location_for_list(value)
+    target.location_detail = parse_location_for_detail(value)
\ No newline at end of file
@@ -6,12 +6,15 @@ from sqlalchemy import (
     Text,
     DECIMAL,
     Float,
-    DateTime
+    DateTime,
+    Index,
+    event
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.models.spatial import Point, sync_geo_point
 
 class HeritageBuilding(Base):
     __tablename__ = 'heritage_buildings'
@@ -22,6 +25,7 @@ class HeritageBuilding(Base):
     description = Column(Text)
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    geo_point = deferred(Column(Point(), nullable=False))    # 거리 검색용 좌표 (SPATIAL INDEX)
     custom_radius = Column(Float)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -31,4 +35,9 @@ class HeritageBuilding(Base):
     images = relationship("HeritageBuildingImage", back_populates="buildings")
     route_buildings = relationship("HeritageRouteBuilding", back_populates="buildings")
 
+    __table_args__ = (
+        Index('ix_heritage_buildings_geo_point', 'geo_point', mysql_prefix='SPATIAL'),
+    )
 
+event.listen(HeritageBuilding, 'before_insert', sync_geo_point)
+event.listen(HeritageBuilding, 'before_update', sync_geo_point)
@@ -0,0 +1,18 @@
+from sqlalchemy import (
+    Column, 
+    Integer, 
+    Enum,
+    ForeignKey
+)
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+from app.models.enums import EraCategory
+
+class HeritageEra(Base):
+    __tablename__ = 'heritage_eras'
+    # 시대 카테고리 우선 복합 키 (시대 필터링 시 인덱스 탐색)
+    era = Column(Enum(EraCategory), primary_key=True)
+    heritage_id = Column(Integer, ForeignKey('heritages.id', ondelete='CASCADE'), primary_key=True, index=True)
+
+    heritages = relationship("Heritage", back_populates="eras")
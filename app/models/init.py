@@ -6,5 +6,8 @@ from .heritage.heritage_building_image import HeritageBuildingImage
 from .heritage.heritage_route import HeritageRoute
 from .heritage.heritage_route_building import HeritageRouteBuilding
 from .heritage.heritage_type import HeritageType
+from .heritage.heritage_era import HeritageEra
 from .chat.chat_session import ChatSession
-from .chat.chat_message import ChatMessage
\ No newline at end of file
+from .chat.chat_message import ChatMessage
+from .chat.chat_session_archive import ChatSessionArchive
+from .analytics import AnalyticsWatermark, DailyBuildingVisit, DailyHeritageStat
\ No newline at end of file
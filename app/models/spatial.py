@@ -0,0 +1,30 @@
+from sqlalchemy import func, inspect
+from sqlalchemy.types import UserDefinedType
+
+# MySQL 지리 좌표계 (WGS84)
+WGS84_SRID = 4326
+
+class Point(UserDefinedType):
+    """SRID 가 고정된 MySQL POINT 컬럼 타입 (SPATIAL INDEX 사용 조건)"""
+    cache_ok = True
+
+    def __init__(self, srid: int = WGS84_SRID):
+        self.srid = srid
+
+    def get_col_spec(self, **kw):
+        return f"POINT SRID {self.srid}"
+
+# 경도/위도 값으로 POINT 표현식 생성
+# POINT(x, y) 는 내부적으로 경도-위도 순서로 저장되므로 ST_SRID 로 좌표계만 지정
+def st_point(longitude, latitude, srid: int = WGS84_SRID):
+    return func.ST_SRID(func.POINT(longitude or 0, latitude or 0), srid)
+
+# 경도/위도 변경 시 geo_point 컬럼 동기화 (before_insert / before_update 이벤트)
+def sync_geo_point(mapper, connection, target):
+    state = inspect(target)
+    if state.has_identity and not (
+        state.attrs.latitude.history.has_changes() or
+        state.attrs.longitude.history.has_changes()
+    ):
+        return
+    target.geo_point = st_point(target.longitude, target.latitude)
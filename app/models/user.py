@@ -1,5 +1,5 @@
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -16,10 +16,18 @@ class User(Base):
     # is_active = Column(Boolean, default=True)
     # role = Column(Enum(UserRole), default=UserRole.USER)
     token = Column(String(255), unique=True, index=True)
+    token_expires_at = Column(DateTime(timezone=True), nullable=True)    # 토큰 만료 시각 (만료 토큰 정리 기준)
     # refresh_token = Column(String(255), unique=True, index=True, nullable=True)
     # refresh_token_expires_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_login = Column(DateTime(timezone=True), onupdate=func.now())
     
     chat_sessions = relationship("ChatSession", back_populates="users")
-    bookmarks = relationship("UserBookmark", back_populates="users")
\ No newline at end of file
+    bookmarks = relationship("UserBookmark", back_populates="users")
+
+    __table_args__ = (
+        # 만료 토큰 정리 대상 조회
+        Index('ix_users_token_expires_at', 'token_expires_at'),
+        # 장기 미사용 게스트 사용자 정리 대상 조회
+        Index('ix_users_last_login', 'last_login'),
+    )
\ No newline at end of file
@@ -0,0 +1,171 @@
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import desc, func, or_, and_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.analytics import AnalyticsWatermark, DailyBuildingVisit, DailyHeritageStat
+from app.models.chat.chat_message import ChatMessage
+from app.models.chat.chat_session import ChatSession
+from app.models.chat.chat_session_archive import ChatSessionArchive
+from app.models.enums import RoleType
+from app.models.heritage.heritage import Heritage
+from app.models.quiz import Quiz
+from app.repository.chat_repository import minutes_ago
+
+logger = logging.getLogger(__name__)
+
+class AnalyticsRepository:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # 집계 위치 잠금 조회 (다른 워커가 같은 원본을 집계 중이면 None)
+    async def lock_watermark(self, name: str) -> Optional[AnalyticsWatermark]:
+        await self.db.execute(mysql_insert(AnalyticsWatermark.__table__)
+                              .values(name=name, last_id=0)
+                              .prefix_with("IGNORE"))
+        result = await self.db.execute(select(AnalyticsWatermark)
+                                       .where(AnalyticsWatermark.name == name)
+                                       .with_for_update(skip_locked=True)
+                                       .execution_options(populate_existing=True))
+        return result.scalar_one_or_none()
+
+    # 집계할 다음 ID 구간 상한 (settle_minutes 이전에 생성된 행까지만, 아직 커밋 중일 수 있는 최근 행 제외)
+    async def next_id_bound(self, model, last_id: int, batch_size: int, settle_minutes: int) -> Optional[int]:
+        result = await self.db.execute(select(model.id, model.created_at < minutes_ago(settle_minutes))
+                                       .where(model.id > last_id)
+                                       .order_by(model.id)
+                                       .limit(batch_size))
+        upto = None
+        for row_id, settled in result:
+            if not settled:
+                break
+            upto = row_id
+        return upto
+
+    # 신규 채팅 세션 수 (시작일 / 문화재별)
+    async def count_sessions(self, after_id: int, upto_id: int) -> List[Tuple[date, int, int]]:
+        stat_date = func.date(ChatSession.start_time)
+        result = await self.db.execute(select(stat_date, ChatSession.heritage_id, func.count())
+                                       .where(
+                                           (ChatSession.id > after_id) &
+                                           (ChatSession.id <= upto_id) &
+                                           (ChatSession.heritage_id != None)
+                                       )
+                                       .group_by(stat_date, ChatSession.heritage_id))
+        return result.all()
+
+    # 신규 사용자 메시지 수 (작성일 / 문화재별)
+    async def count_turns(self, after_id: int, upto_id: int) -> List[Tuple[date, int, int]]:
+        stat_date = func.date(ChatMessage.created_at)
+        result = await self.db.execute(select(stat_date, ChatSession.heritage_id, func.count())
+                                       .join(ChatSession, ChatSession.id == ChatMessage.session_id)
+                                       .where(
+                                           (ChatMessage.id > after_id) &
+                                           (ChatMessage.id <= upto_id) &
+                                           (ChatMessage.role == RoleType.USER) &
+                                           (ChatSession.heritage_id != None)
+                                       )
+                                       .group_by(stat_date, ChatSession.heritage_id))
+        return result.all()
+
+    # 신규 퀴즈 수 (출제일 / 문화재별)
+    async def count_quizzes(self, after_id: int, upto_id: int) -> List[Tuple[date, int, int]]:
+        stat_date = func.date(Quiz.created_at)
+        result = await self.db.execute(select(stat_date, ChatSession.heritage_id, func.count())
+                                       .join(ChatSession, ChatSession.id == Quiz.session_id)
+                                       .where(
+                                           (Quiz.id > after_id) &
+                                           (Quiz.id <= upto_id) &
+                                           (ChatSession.heritage_id != None)
+                                       )
+                                       .group_by(stat_date, ChatSession.heritage_id))
+        return result.all()
+
+    # 보관 처리된 세션의 방문 건축물 목록 ((보관 시각, 세션 ID) 기준 다음 구간)
+    async def get_archived_visits(self, after_time: Optional[datetime], after_id: int, batch_size: int, settle_minutes: int):
+        query = (select(ChatSessionArchive.session_id,
+                        ChatSessionArchive.archived_at,
+                        ChatSession.heritage_id,
+                        func.date(ChatSession.start_time).label("stat_date"),
+                        ChatSession.visited_buildings)
+                 .join(ChatSession, ChatSession.id == ChatSessionArchive.session_id)
+                 .where(ChatSessionArchive.archived_at < minutes_ago(settle_minutes)))
+        if after_time is not None:
+            query = query.where(or_(
+                ChatSessionArchive.archived_at > after_time,
+                and_(ChatSessionArchive.archived_at == after_time, ChatSessionArchive.session_id > after_id)
+            ))
+        result = await self.db.execute(query
+                                       .order_by(ChatSessionArchive.archived_at, ChatSessionArchive.session_id)
+                                       .limit(batch_size))
+        return result.all()
+
+    # 일별 문화재 집계 누적 (column: session_count / turn_count / quiz_count)
+    async def add_heritage_stats(self, column: str, rows: List[Tuple[date, int, int]]):
+        if not rows:
+            return
+        statement = mysql_insert(DailyHeritageStat.__table__).values([
+            {"stat_date": stat_date, "heritage_id": heritage_id, column: count}
+            for stat_date, heritage_id, count in rows
+        ])
+        await self.db.execute(statement.on_duplicate_key_update({
+            column: getattr(DailyHeritageStat, column) + statement.inserted[column]
+        }))
+
+    # 일별 건축물 방문 집계 누적
+    async def add_building_visits(self, visits: Dict[Tuple[date, int, str], int]):
+        if not visits:
+            return
+        statement = mysql_insert(DailyBuildingVisit.__table__).values([
+            {"stat_date": stat_date, "heritage_id": heritage_id, "building_name": building_name, "visit_count": count}
+            for (stat_date, heritage_id, building_name), count in visits.items()
+        ])
+        await self.db.execute(statement.on_duplicate_key_update(
+            visit_count=DailyBuildingVisit.visit_count + statement.inserted.visit_count
+        ))
+
+    # 기간 내 문화재별 이용 집계 (세션 수 내림차순)
+    async def get_heritage_stats(self, start_date: date, end_date: date, limit: int):
+        session_count = func.sum(DailyHeritageStat.session_count)
+        result = await self.db.execute(select(DailyHeritageStat.heritage_id,
+                                              Heritage.name,
+                                              session_count.label("session_count"),
+                                              func.sum(DailyHeritageStat.turn_count).label("turn_count"),
+                                              func.sum(DailyHeritageStat.quiz_count).label("quiz_count"))
+                                       .outerjoin(Heritage, Heritage.id == DailyHeritageStat.heritage_id)
+                                       .where(DailyHeritageStat.stat_date.between(start_date, end_date))
+                                       .group_by(DailyHeritageStat.heritage_id, Heritage.name)
+                                       .order_by(desc(session_count), DailyHeritageStat.heritage_id)
+                                       .limit(limit))
+        return result.all()
+
+    # 기간 내 일별 전체 이용 집계
+    async def get_daily_stats(self, start_date: date, end_date: date):
+        result = await self.db.execute(select(DailyHeritageStat.stat_date,
+                                              func.sum(DailyHeritageStat.session_count).label("session_count"),
+                                              func.sum(DailyHeritageStat.turn_count).label("turn_count"),
+                                              func.sum(DailyHeritageStat.quiz_count).label("quiz_count"))
+                                       .where(DailyHeritageStat.stat_date.between(start_date, end_date))
+                                       .group_by(DailyHeritageStat.stat_date)
+                                       .order_by(DailyHeritageStat.stat_date))
+        return result.all()
+
+    # 기간 내 인기 건축물 (방문 수 내림차순)
+    async def get_building_visits(self, start_date: date, end_date: date, heritage_id: Optional[int], limit: int):
+        visit_count = func.sum(DailyBuildingVisit.visit_count)
+        query = (select(DailyBuildingVisit.heritage_id,
+                        DailyBuildingVisit.building_name,
+                        visit_count.label("visit_count"))
+                 .where(DailyBuildingVisit.stat_date.between(start_date, end_date)))
+        if heritage_id is not None:
+            query = query.where(DailyBuildingVisit.heritage_id == heritage_id)
+        result = await self.db.execute(query
+                                       .group_by(DailyBuildingVisit.heritage_id, DailyBuildingVisit.building_name)
+                                       .order_by(desc(visit_count))
+                                       .limit(limit))
+        return result.all()
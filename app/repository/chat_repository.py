@@ -1,13 +1,14 @@
 import logging
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import logger
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import update, values, desc, delete
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy import update, values, desc, delete, insert, text, lambda_stmt
 from sqlalchemy.future import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import joinedload
 
 from app.error.auth_exception import DatabaseOperationException, UserNotFoundException
@@ -15,68 +16,78 @@ from app.error.chat_exception import ChatServiceException, SessionNotFoundExcept
 from app.error.heritage_exceptions import HeritageNotFoundException
 from app.models.chat.chat_session import ChatSession
 from app.models.chat.chat_message import ChatMessage
+from app.models.chat.chat_session_archive import ChatSessionArchive
 from app.models.enums import RoleType
 from app.models.question import RecommendedQuestion
+from app.models.quiz import Quiz
 from app.models.user import User
 from app.models.heritage.heritage import Heritage
 from app.schemas.chat import VisitedBuilding
-
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from app.utils.codec import encode_text, ensure_encoded
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
-# Create a new async engine and session factory
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True)
-SessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+# MySQL 오류 코드 (중복 키, 외래키 참조 대상 없음)
+MYSQL_DUPLICATE_ENTRY = 1062
+MYSQL_FOREIGN_KEY_VIOLATION = 1452
+
+# 파티션 범위 조건 여유 (세션 시작 시각은 애플리케이션 시계, 메시지 생성 시각은 DB 시계 기준이므로 시계 / 시간대 차이 허용)
+PARTITION_PRUNE_MARGIN = timedelta(days=1)
+
+# DB 서버 시각 기준 N분 전 (애플리케이션 / DB 시간대 차이 영향 없음)
+def minutes_ago(minutes: int):
+    return func.date_sub(func.now(), text(f"INTERVAL {int(minutes)} MINUTE"))
 
 class ChatRepository:
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    # 채팅 세션 생성
-    async def create_chat_session(self, user_id: int, heritage_id: int) -> ChatSession:
+    # 채팅 세션 생성 (활성 세션이 이미 있으면 해당 세션 반환)
+    # 사용자 / 문화재 존재 여부는 외래키, 활성 세션 중복은 유니크 제약으로 확인하므로 신규 세션은 INSERT 1회로 생성
+    async def create_chat_session(self, user_id: int, heritage_id: int, heritage_name: str) -> ChatSession:
         logger.info(f"ChatRepository에서 채팅 세션을 생성합니다. (user_id: {user_id}, heritage_id: {heritage_id})")
+        now = datetime.now()
+        session_values = dict(
+            user_id=user_id,
+            heritage_id=heritage_id,
+            heritage_name=heritage_name,
+            quiz_count=settings.QUIZ_COUNT,
+            start_time=now,
+            created_at=now,
+            updated_at=now
+        )
         try:
-            # 채팅 세션 활성화 상태 확인
-            active_session = await self.get_active_session(user_id, heritage_id)
-            if active_session:
-                logger.info(f"기존 활성 세션을 반환합니다. (session_id: {active_session.id})")
-                return active_session
+            # 동시 요청으로 중복 확인 직후 기존 세션이 종료되면 한 번 더 생성 시도
+            for _ in range(2):
+                try:
+                    result = await self.db.execute(insert(ChatSession).values(**session_values))
+                except IntegrityError as e:
+                    error_code = e.orig.args[0] if e.orig and e.orig.args else None
+                    if error_code == MYSQL_FOREIGN_KEY_VIOLATION:
+                        if "heritage_id" in str(e.orig):
+                            raise HeritageNotFoundException(heritage_id)
+                        raise UserNotFoundException(user_id)
+                    if error_code != MYSQL_DUPLICATE_ENTRY:
+                        raise
 
-            # 사용자 여부 확인 & 새 세션 생성
-            user = await self.db.execute(select(User).where(User.id == user_id))
-            user = user.scalar_one_or_none()
-            if not user:
-                raise UserNotFoundException(f"등록되지 않은 사용자입니다. (user_id: {user.id})")
-            
-            # 문화재 여부 확인
-            heritage = await self.db.execute(select(Heritage).where(Heritage.id == heritage_id))
-            heritage = heritage.scalar_one_or_none()
-            if not heritage:
-                raise HeritageNotFoundException(f"등록되지 않은 문화재입니다. (heritage_id: {heritage_id})")
-            
-            # 채팅 세션 생성
-            new_session = ChatSession(
-                user_id=user_id, 
-                heritage_id=heritage_id,
-                heritage_name=heritage.name,
-                start_time=datetime.now(),
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            self.db.add(new_session)
-            await self.db.flush()
-            await self.db.refresh(new_session)
-            
-            logger.info(f"새로운 채팅 세션이 생성되었습니다. (session_id: {new_session.id}, user_id: {user_id}, heritage_id: {heritage_id})")
-            
-            return new_session
+                    # 트랜잭션에서 이미 조회를 실행했으면 일관된 읽기로는 동시에 커밋된 세션이 보이지 않으므로 잠금 읽기
+                    active_session = await self.get_active_session(user_id, heritage_id, lock=True)
+                    if active_session:
+                        logger.info(f"기존 활성 세션을 반환합니다. (session_id: {active_session.id})")
+                        return active_session
+                    continue
+
+                # INSERT 로 생성된 ID 와 저장한 값으로 세션 구성 (refresh 조회 생략)
+                new_session = ChatSession(id=result.inserted_primary_key[0], **session_values)
+                logger.info(f"새로운 채팅 세션이 생성되었습니다. (session_id: {new_session.id}, user_id: {user_id}, heritage_id: {heritage_id})")
+                return new_session
+
+            raise ChatServiceException("활성 세션이 동시에 변경되어 채팅 세션을 생성하지 못했습니다.")
 
-        except (UserNotFoundException, HeritageNotFoundException) as e:
+        except (UserNotFoundException, HeritageNotFoundException, ChatServiceException) as e:
             logger.error(f"채팅 세션 생성 중 에러 발생: {str(e)}", exc_info=True)
             raise
         except SQLAlchemyError as e:
@@ -87,17 +98,21 @@ class ChatRepository:
             raise ChatServiceException("채팅 세션 생성 중 예상치 못한 오류 발생")
 
     # 채팅 세션 활성화 상태 조회
-    async def get_active_session(self, user_id: int, heritage_id: int) -> Optional[ChatSession]:
+    # lock: 공유 잠금 읽기 (REPEATABLE READ 스냅샷이 아닌 최신 커밋 행 조회)
+    async def get_active_session(self, user_id: int, heritage_id: int, lock: bool = False) -> Optional[ChatSession]:
         try:
-            result = await self.db.execute(select(ChatSession)
-                                        .where(
-                                            (ChatSession.user_id == user_id) &
-                                            (ChatSession.heritage_id == heritage_id) &
-                                            (ChatSession.end_time == None) # 세션 종료 유무 확인
-                                        )
-                                        .order_by(ChatSession.created_at.desc())
-                                        )
-            return result.scalar_one_or_none()
+            query = lambda_stmt(lambda: select(ChatSession)
+                                .where(
+                                    (ChatSession.user_id == user_id) &
+                                    (ChatSession.heritage_id == heritage_id) &
+                                    (ChatSession.is_active == True) # 세션 종료 유무 확인 (활성 세션 유니크 인덱스로 조회)
+                                )
+                                .limit(1)
+                                )
+            if lock:
+                query += lambda s: s.with_for_update(read=True)
+            result = await self.db.execute(query)
+            return result.scalars().first()
         except SQLAlchemyError as e:
             logger.error(f"채팅 활성화 상태 조회 중 데이터베이스 오류 발생 : {str(e)}", exc_info=True)
             raise DatabaseOperationException("활성 세션 조회 중 데이터베이스 오류 발생")
@@ -151,8 +166,8 @@ class ChatRepository:
                 timestamp=datetime.now()
             )
             self.db.add(new_message)
+            # 파티션 전체를 조회하는 refresh 없이 INSERT 결과의 id 만 사용
             await self.db.flush()
-            await self.db.refresh(new_message)
             return new_message
         except SQLAlchemyError as e:
             logger.error(f"메시지 생성 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
@@ -160,6 +175,10 @@ class ChatRepository:
     
     # 기존 채팅 메시지 업데이트 (특정 레코드 수정)
     async def update_message(self, session_id: int, **kwargs):
+        # 대화 내용 / 슬라이딩 윈도우는 압축 인코딩하여 저장
+        for column in ("full_conversation", "sliding_window"):
+            if column in kwargs:
+                kwargs[column] = encode_text(kwargs[column])
         try:
             await self.db.execute(
                 update(ChatSession).
@@ -173,11 +192,17 @@ class ChatRepository:
             raise DatabaseOperationException("메시지 업데이트 중 데이터베이스 오류 발생")
     
     # 채팅 최근 저장된 메시지 1개 조회
-    async def get_latest_message(self, session_id: int, role: RoleType) -> Optional[ChatMessage]:
+    # since: 세션 시작 시각 (지정 시 하루 전부터의 파티션만 조회, 정확한 시각 비교가 아닌 파티션 범위 제한 용도)
+    async def get_latest_message(self, session_id: int, role: RoleType, since: Optional[datetime] = None) -> Optional[ChatMessage]:
         try:
-            result = await self.db.execute(select(ChatMessage)
-                                           .where((ChatMessage.session_id == session_id) & (ChatMessage.role == role.value)
-                                        ).order_by(desc(ChatMessage.timestamp)).limit(1))
+            role_value = role.value
+            query = lambda_stmt(lambda: select(ChatMessage)
+                                .where((ChatMessage.session_id == session_id) & (ChatMessage.role == role_value)))
+            if since is not None:
+                prune_from = since - PARTITION_PRUNE_MARGIN
+                query += lambda s: s.where(ChatMessage.created_at >= prune_from)
+            query += lambda s: s.order_by(desc(ChatMessage.created_at), desc(ChatMessage.id)).limit(1)
+            result = await self.db.execute(query)
             return result.scalars().first()
         except SQLAlchemyError as e:
             logger.error(f"최근 메시지 조회 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
@@ -187,8 +212,8 @@ class ChatRepository:
     # 특정 채팅 세션 조회
     async def get_chat_session(self, session_id: int) -> Optional[ChatSession]:
         try:
-            result = await self.db.execute(select(ChatSession)
-                                        .where(ChatSession.id == session_id))
+            result = await self.db.execute(lambda_stmt(lambda: select(ChatSession)
+                                        .where(ChatSession.id == session_id)))
             return result.scalar_one_or_none()
         except SessionNotFoundException:
             raise
@@ -196,13 +221,99 @@ class ChatRepository:
             logger.error(f"채팅 세션 조회 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
             raise DatabaseOperationException("채팅 세션 조회 중 데이터베이스 오류 발생")
         
+    # 마지막 활동 이후 유휴 시간이 지난 활성 세션 일괄 종료 (종료한 세션 수 반환)
+    async def end_idle_sessions(self, idle_minutes: int, batch_size: int) -> int:
+        try:
+            # 다른 워커가 처리 중인 행은 건너뜀
+            result = await self.db.execute(select(ChatSession.id)
+                                           .where(
+                                               (ChatSession.end_time == None) &
+                                               (ChatSession.updated_at < minutes_ago(idle_minutes))
+                                           )
+                                           .order_by(ChatSession.id)
+                                           .limit(batch_size)
+                                           .with_for_update(skip_locked=True)
+                                        )
+            session_ids = result.scalars().all()
+            if session_ids:
+                await self.db.execute(update(ChatSession)
+                                      .where(ChatSession.id.in_(session_ids))
+                                      .values(end_time=func.now())
+                                      .execution_options(synchronize_session=False)
+                                    )
+            await self.db.commit()
+            return len(session_ids)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"유휴 채팅 세션 종료 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
+            raise DatabaseOperationException("유휴 채팅 세션 종료 중 데이터베이스 오류 발생")
+
+    # 종료된 세션의 대화 내용을 압축 보관 테이블로 이동 (이동한 세션 수 반환)
+    async def archive_ended_sessions(self, ended_minutes: int, batch_size: int) -> int:
+        try:
+            result = await self.db.execute(select(ChatSession.id, ChatSession.full_conversation)
+                                           .where(
+                                               (ChatSession.end_time < minutes_ago(ended_minutes)) &
+                                               ((ChatSession.full_conversation != None) | (ChatSession.sliding_window != None))
+                                           )
+                                           .order_by(ChatSession.id)
+                                           .limit(batch_size)
+                                           .with_for_update(skip_locked=True)
+                                        )
+            rows = result.all()
+            if rows:
+                archives = [
+                    {
+                        "session_id": session_id,
+                        "full_conversation": ensure_encoded(full_conversation)
+                    }
+                    for session_id, full_conversation in rows
+                ]
+                statement = mysql_insert(ChatSessionArchive.__table__).values(archives)
+                await self.db.execute(statement.on_duplicate_key_update(
+                    full_conversation=statement.inserted.full_conversation
+                ))
+                await self.db.execute(update(ChatSession)
+                                      .where(ChatSession.id.in_([session_id for session_id, _ in rows]))
+                                      .values(full_conversation=None, sliding_window=None, updated_at=ChatSession.updated_at)
+                                      .execution_options(synchronize_session=False)
+                                    )
+            await self.db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"종료 채팅 세션 보관 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
+            raise DatabaseOperationException("종료 채팅 세션 보관 중 데이터베이스 오류 발생")
+
+    # 퀴즈 사용 횟수 예약 (남은 횟수가 있을 때만 원자적으로 차감, 남은 횟수 반환)
+    # 퀴즈 저장과 같은 트랜잭션으로 커밋하도록 커밋 / 롤백은 호출 측에서 수행
+    async def reserve_quiz(self, session_id: int) -> Optional[int]:
+        try:
+            result = await self.db.execute(update(ChatSession)
+                                           .where(
+                                               (ChatSession.id == session_id) &
+                                               (ChatSession.quiz_count > 0)
+                                           )
+                                           .values(quiz_count=ChatSession.quiz_count - 1)
+                                           .execution_options(synchronize_session=False)
+                                        )
+            if result.rowcount == 0:
+                return None
+
+            remaining = await self.db.execute(select(ChatSession.quiz_count)
+                                              .where(ChatSession.id == session_id))
+            return remaining.scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(f"퀴즈 사용 횟수 예약 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
+            raise DatabaseOperationException("퀴즈 사용 횟수 예약 중 데이터베이스 오류 발생")
+
     # 추천 질문 조회
     async def get_recommended_questions(self, session_id: int) -> List[str]:
         try:
-            result = await self.db.execute(select(RecommendedQuestion)
+            result = await self.db.execute(lambda_stmt(lambda: select(RecommendedQuestion)
                                            .where(RecommendedQuestion.session_id == session_id)
                                            .order_by(RecommendedQuestion.id)
-                                        )
+                                        ))
             questions = result.scalars().all()
             
             # 문자열 리스트로 전환
@@ -214,7 +325,7 @@ class ChatRepository:
 
     # 추천 질문 저장
     async def save_recommended_questions(self, session_id: int, questions: List[str]):
-        async with SessionLocal() as session:
+        async with AsyncSessionLocal() as session:
             async with session.begin():
                 try:
                     # 기존 추천 질문이 있다면 삭제
@@ -236,10 +347,10 @@ class ChatRepository:
     # 채팅 요약 정보 조회
     async def get_chat_summary(self, session_id: int):
         try:
-            result = await self.db.execute(select(ChatSession)
+            result = await self.db.execute(lambda_stmt(lambda: select(ChatSession)
                                         .options(joinedload(ChatSession.heritages))
                                         .where(ChatSession.id == session_id)
-                                    )
+                                    ))
             chat_session = result.scalar_one_or_none()
 
             if chat_session and chat_session.summary_keywords and chat_session.visited_buildings:
@@ -270,4 +381,44 @@ class ChatRepository:
         except SQLAlchemyError as e:
             logger.error(f"채팅 요약 저장 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
             await self.db.rollback()
-            raise DatabaseOperationException("채팅 요약 저장 중 데이터베이스 오류 발생")
\ No newline at end of file
+            raise DatabaseOperationException("채팅 요약 저장 중 데이터베이스 오류 발생")
+
+    # 사용자 채팅 세션 / 요약 스트리밍 조회 (서버 측 커서로 batch_size 행씩 읽음, 식별 맵 미사용)
+    async def stream_user_sessions(self, user_id: int, batch_size: int) -> AsyncResult:
+        return await self.db.stream(select(ChatSession.id,
+                                           ChatSession.heritage_id,
+                                           ChatSession.heritage_name,
+                                           ChatSession.start_time,
+                                           ChatSession.end_time,
+                                           ChatSession.summary_keywords,
+                                           ChatSession.visited_buildings,
+                                           ChatSession.summary_generated_at)
+                                    .where(ChatSession.user_id == user_id)
+                                    .order_by(ChatSession.id)
+                                    .execution_options(yield_per=batch_size))
+
+    # 사용자 채팅 메시지 스트리밍 조회
+    async def stream_user_messages(self, user_id: int, batch_size: int) -> AsyncResult:
+        return await self.db.stream(select(ChatMessage.session_id,
+                                           ChatMessage.id,
+                                           ChatMessage.role,
+                                           ChatMessage.content,
+                                           ChatMessage.created_at)
+                                    .join(ChatSession, ChatSession.id == ChatMessage.session_id)
+                                    .where(ChatSession.user_id == user_id)
+                                    .order_by(ChatMessage.session_id, ChatMessage.created_at, ChatMessage.id)
+                                    .execution_options(yield_per=batch_size))
+
+    # 사용자 퀴즈 스트리밍 조회
+    async def stream_user_quizzes(self, user_id: int, batch_size: int) -> AsyncResult:
+        return await self.db.stream(select(Quiz.session_id,
+                                           Quiz.id,
+                                           Quiz.question,
+                                           Quiz.options,
+                                           Quiz.answer,
+                                           Quiz.explanation,
+                                           Quiz.created_at)
+                                    .join(ChatSession, ChatSession.id == Quiz.session_id)
+                                    .where(ChatSession.user_id == user_id)
+                                    .order_by(Quiz.session_id, Quiz.id)
+                                    .execution_options(yield_per=batch_size))
@@ -1,49 +1,67 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, and_, Float, update, values, join, tuple_, asc, desc
+from sqlalchemy import func, and_, or_, Float, update, values, join, tuple_, asc, desc, lambda_stmt
 from sqlalchemy.future import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload, aliased
 
+from app.cache.reference_snapshot import BuildingRecord, get_reference_snapshot
 from app.models.chat.chat_session import ChatSession
-from app.models.enums import EraCategory, SortOrder
+from app.models.enums import CountMode, EraCategory, SortOrder
 from app.models.heritage.heritage_building_image import HeritageBuildingImage
 from app.models.heritage.heritage_building import HeritageBuilding
 from app.models.heritage.heritage_route import HeritageRoute
 from app.models.heritage.heritage_route_building import HeritageRouteBuilding
 from app.models.heritage.heritage import Heritage
+from app.models.heritage.heritage_era import HeritageEra
+from app.models.heritage.heritage_type import HeritageType
 from app.models.quiz import Quiz
+from app.models.spatial import WGS84_SRID, st_point
 from app.schemas.heritage import HeritageRouteInfo, HeritageBuildingInfo
-from app.utils.common import parse_heritage_dist_range
+from app.core.config import settings
+from app.utils.cache import TTLCache
+from app.utils.common import build_bounding_box_wkt, normalize_search_keyword, parse_heritage_dist_range
+from app.utils.explain import Explain, estimate_result_rows
 
 logger = logging.getLogger(__name__)
 
+# 검색 조건별 전체 개수 캐시
+_count_cache = TTLCache(settings.HERITAGE_COUNT_CACHE_TTL_SECONDS, settings.HERITAGE_COUNT_CACHE_SIZE)
+
 class HeritageRepository:
     
     def __init__ (self, db: AsyncSession):
         self.db = db
 
     # 문화재 ID에 해당하는 문화재 조회
+    # 단건 조회 쿼리는 lambda_stmt 로 구문 구성 / 컴파일 결과를 캐시하고 ID 는 바인드 파라미터로 전달
     async def get_heritage_by_id(self, heritage_id: int) -> Heritage:
-        result = await self.db.execute(select(Heritage)
+        result = await self.db.execute(lambda_stmt(lambda: select(Heritage)
                                        .options(joinedload(Heritage.heritage_types))
-                                       .where(Heritage.id == heritage_id))
+                                       .where(Heritage.id == heritage_id)))
         return result.unique().scalar_one_or_none()
     
     # 건축물 ID로 문화재 이름 조회
     async def get_heritage_building_name_by_id(self, building_id: int) -> str:
-        result = await self.db.execute(select(HeritageBuilding.name)
+        snapshot = get_reference_snapshot()
+        building = snapshot.get_building(building_id) if snapshot else None
+        if building is not None:
+            return building.name
+
+        result = await self.db.execute(lambda_stmt(lambda: select(HeritageBuilding.name)
                                        .where(HeritageBuilding.id == building_id)
-                                    )
+                                    ))
         return result.scalar_one_or_none()
     
     # 세션 ID로 문화재 ID 조회
     async def get_heritage_id_by_session(self, session_id: int) -> int:
-        result = await self.db.execute(select(ChatSession.heritage_id)
-                                       .where(ChatSession.id == session_id))
+        result = await self.db.execute(lambda_stmt(lambda: select(ChatSession.heritage_id)
+                                       .where(ChatSession.id == session_id)))
         heritage_id = result.scalar_one_or_none()
         if heritage_id is None:
             raise ValueError(f"세션 ID {session_id}에 대한 문화재 ID를 찾을 수 없습니다.")
@@ -51,33 +69,57 @@ class HeritageRepository:
     
     # 문화재 ID로 문화재 이름 조회
     async def get_heritage_name_by_id(self, heritage_id: int) -> str:
-        result = await self.db.execute(select(Heritage.name)
-                                       .where(Heritage.id == heritage_id))
+        result = await self.db.execute(lambda_stmt(lambda: select(Heritage.name)
+                                       .where(Heritage.id == heritage_id)))
         heritage_name = result.scalar_one_or_none()
         if heritage_name is None:
             raise ValueError(f"문화재 ID {heritage_id}에 대한 이름을 찾을 수 없습니다.")
         return heritage_name
 
     # 문화재 건축물 ID 조회
-    async def get_heritage_building_by_id(self, building_id: int) -> Optional[HeritageBuilding]:
-        result = await self.db.execute(select(HeritageBuilding)
+    async def get_heritage_building_by_id(self, building_id: int) -> Optional[Union[HeritageBuilding, BuildingRecord]]:
+        # 참조 데이터 스냅샷에 있으면 DB 조회 생략 (스냅샷 이후 추가된 건축물은 DB 조회)
+        snapshot = get_reference_snapshot()
+        building = snapshot.get_building(building_id) if snapshot else None
+        if building is not None:
+            return building
+
+        result = await self.db.execute(lambda_stmt(lambda: select(HeritageBuilding)
                                        .where(HeritageBuilding.id == building_id)
                                        .options(
                                            joinedload(HeritageBuilding.building_types),
                                            joinedload(HeritageBuilding.heritages))
-                                        )
+                                        ))
         return result.scalars().first()
     
     # 문화재 건축물 이미지 조회
     async def get_heritage_building_images(self, building_id: int) -> List[HeritageBuildingImage]:
-        result = await self.db.execute(select(HeritageBuildingImage)
+        result = await self.db.execute(lambda_stmt(lambda: select(HeritageBuildingImage)
                                        .options(joinedload(HeritageBuildingImage.buildings))
                                        .where(HeritageBuildingImage.building_id == building_id)
-                                       .order_by(HeritageBuildingImage.image_order))
+                                       .order_by(HeritageBuildingImage.image_order)))
         return result.scalars().all()
     
     # 문화재 건축물 코스 조회
     async def get_routes_with_buildings_by_heritages_id(self, heritage_id: int) -> List[HeritageRouteInfo]:
+        snapshot = get_reference_snapshot()
+        if snapshot is not None:
+            return [
+                HeritageRouteInfo(
+                    route_id=route.id,
+                    name=route.name,
+                    buildings=[
+                        HeritageBuildingInfo(
+                            building_id=building.id,
+                            name=building.name,
+                            coordinate=(building.longitude, building.latitude)
+                        )
+                        for building in route.buildings
+                    ]
+                )
+                for route in snapshot.get_routes(heritage_id)
+            ]
+
         result = await self.db.execute(select(HeritageRoute)
                                        .options(joinedload(HeritageRoute.route_buildings)
                                                 .joinedload(HeritageRouteBuilding.buildings))
@@ -103,11 +145,11 @@ class HeritageRepository:
     
     # 문화재 건축물 퀴즈 조회
     async def get_quiz_by_id(self, quiz_id: int):
-        quiz = await self.db.execute(select(Quiz)
-                                     .where(Quiz.id == quiz_id))
+        quiz = await self.db.execute(lambda_stmt(lambda: select(Quiz)
+                                     .where(Quiz.id == quiz_id)))
         return quiz.scalar_one_or_none()
     
-    # 문화재 건축물 퀴즈 저장
+    # 문화재 건축물 퀴즈 저장 (커밋은 호출 측에서 수행)
     async def save_quiz_data(self, session_id: int, parsed_quiz: Dict[str, Any]):
         quiz = Quiz(
             session_id = session_id,
@@ -117,20 +159,45 @@ class HeritageRepository:
             explanation=parsed_quiz['explanation']
         )
         self.db.add(quiz)
-        await self.db.commit()
-        await self.db.refresh(quiz)
+        # 퀴즈 사용 횟수 차감과 같은 트랜잭션으로 커밋하도록 flush 만 수행 (저장한 값 그대로 사용, refresh 조회 생략)
+        await self.db.flush()
         return quiz
     
     # 문화재에 속한 건축물 검증
     async def verify_building_belongs_to_heritage(self, heritage_id: int, building_id: int) -> bool:
-        verified_building = await self.db.execute(select(HeritageBuilding)
+        snapshot = get_reference_snapshot()
+        belongs = snapshot.building_belongs_to_heritage(heritage_id, building_id) if snapshot else None
+        if belongs is not None:
+            return belongs
+
+        verified_building = await self.db.execute(lambda_stmt(lambda: select(HeritageBuilding.id)
                                                   .where(
                                                       (HeritageBuilding.id == building_id) &
                                                       (HeritageBuilding.heritage_id == heritage_id)
                                                   )
-                                                )
+                                                ))
         return verified_building.scalar_one_or_none() is not None
     
+    # 검색 인덱스 빌드용 문화재 카탈로그 전체 조회
+    async def get_heritage_catalog_rows(self) -> List[Tuple]:
+        result = await self.db.execute(select(
+                                            Heritage.id,
+                                            Heritage.heritage_type_id,
+                                            Heritage.latitude,
+                                            Heritage.longitude,
+                                            Heritage.area_code,
+                                            Heritage.era,
+                                            Heritage.name,
+                                            Heritage.name_hanja,
+                                            Heritage.location_list,
+                                            Heritage.location,
+                                            Heritage.image_url,
+                                            HeritageType.name
+                                       )
+                                       .outerjoin(HeritageType, Heritage.heritage_type_id == HeritageType.type_id)
+                                       .order_by(Heritage.id))
+        return result.all()
+
     async def search_heritages(
         self, 
         limit: int, 
@@ -139,79 +206,157 @@ class HeritageRepository:
         user_longitude: float,
         name: Optional[str] = None,
         area_code: Optional[int] = None,
-        heritage_type: Optional[int] = None,
+        heritage_type: Optional[List[int]] = None,
         distance_range: Optional[str] = None,
         era_category: Optional[EraCategory] = None,
         sort_by: str = "id",
         sort_order: SortOrder = SortOrder.ASC,
-        count_total: bool = False
-) -> Tuple[List[Tuple[Heritage, float]], int]:
+        count_total: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+        cursor: Optional[Tuple[Optional[float], int]] = None
+) -> Tuple[List[Tuple[Heritage, float]], int, bool]:
 
         query = select(Heritage).options(joinedload(Heritage.heritage_types))
 
-        # 거리 계산 표현식
+        # 거리 계산 표현식 (저장된 geo_point 컬럼 사용)
         distance_expr = func.round(
             func.st_distance_sphere(
-                func.point(func.cast(Heritage.longitude, Float), func.cast(Heritage.latitude, Float)),
-                func.point(func.cast(user_longitude, Float), func.cast(user_latitude, Float))
+                Heritage.geo_point,
+                st_point(user_longitude, user_latitude)
             ) / 1000, 2
         ).label('distance')
 
         query = query.add_columns(distance_expr)
 
-        # 이름 필터링
-        if name:
-            query = query.where(Heritage.name.like(f"%{name}%"))
+        # 목록 조회와 개수 계산에 공통으로 적용되는 필터
+        filters = []
+
+        # 이름 필터링 (한글/한자 이름 FULLTEXT ngram 인덱스 사용)
+        relevance_expr = None
+        keyword = normalize_search_keyword(name) if name else ""
+        if len(keyword) >= settings.FULLTEXT_NGRAM_TOKEN_SIZE:
+            # 따옴표로 감싼 구문 검색으로 연속된 n-gram 만 일치 (부분 문자열 검색과 동일한 결과)
+            relevance_expr = match(Heritage.name, Heritage.name_hanja, against=f'"{keyword}"').in_boolean_mode()
+            filters.append(relevance_expr)
+        elif name and name.strip():
+            # n-gram 길이보다 짧은 검색어는 인덱스로 찾을 수 없으므로 LIKE 검색
+            filters.append(or_(Heritage.name.like(f"%{name}%"), Heritage.name_hanja.like(f"%{name}%")))
 
         # 지역 필터링 (area_code None이 아닐 때만 적용)
         if area_code is not None:
-            query = query.where(Heritage.area_code == area_code)
+            filters.append(Heritage.area_code == area_code)
 
         # 문화재 유형 필터링
         if heritage_type is not None:
-            query = query.where(Heritage.heritage_type_id.in_(heritage_type))
+            filters.append(Heritage.heritage_type_id.in_(heritage_type))
 
         # 시대 카테고리 필터링
         if era_category and era_category != EraCategory.ALL:
-            query = query.filter(Heritage.era.like(f"%{era_category.value}"))
+            # 정규화된 시대 카테고리 테이블 (era, heritage_id) 인덱스 탐색
+            filters.append(Heritage.id.in_(
+                select(HeritageEra.heritage_id).where(HeritageEra.era == era_category)
+            ))
+
+        # 거리 범위 필터링
+        if distance_range:
+            min_dist, max_dist = parse_heritage_dist_range(distance_range)
+            # SPATIAL INDEX 를 타는 경계 사각형으로 먼저 후보를 좁힌 뒤 정확한 구면 거리로 필터링
+            if max_dist != float('inf'):
+                bounding_box = func.ST_GeomFromText(
+                    build_bounding_box_wkt(user_latitude, user_longitude, max_dist),
+                    WGS84_SRID,
+                    'axis-order=long-lat'
+                )
+                filters.append(func.MBRContains(bounding_box, Heritage.geo_point))
+            filters.append(and_(distance_expr >= min_dist, distance_expr < max_dist))
 
-        # 정렬 로직 추가
+        query = query.where(*filters)
+
+        # 커서 페이지네이션 (마지막 항목의 정렬 키 이후만 조회)
+        if cursor is not None:
+            last_distance, last_id = cursor
+            if sort_by == "distance":
+                if sort_order == SortOrder.ASC:
+                    query = query.where(or_(
+                        distance_expr > last_distance,
+                        and_(distance_expr == last_distance, Heritage.id > last_id)
+                    ))
+                else:
+                    query = query.where(or_(
+                        distance_expr < last_distance,
+                        and_(distance_expr == last_distance, Heritage.id < last_id)
+                    ))
+            elif sort_order == SortOrder.ASC:
+                query = query.where(Heritage.id > last_id)
+            else:
+                query = query.where(Heritage.id < last_id)
+
+        # 정렬 로직 추가 (거리 정렬 시 동일 거리는 ID 순)
         if sort_by == "distance":
-            order_column = distance_expr
+            order_columns = [distance_expr, Heritage.id]
         else:
-            order_column = Heritage.id
+            order_columns = [Heritage.id]
         
-        if sort_order == SortOrder.ASC:
-            query = query.order_by(asc(order_column))
+        if sort_by == "relevance" and relevance_expr is not None:
+            # 관련도 정렬은 항상 관련도 높은 순
+            query = query.order_by(desc(relevance_expr), asc(Heritage.id))
+        elif sort_order == SortOrder.ASC:
+            query = query.order_by(*[asc(column) for column in order_columns])
         else:
-            query = query.order_by(desc(order_column))
+            query = query.order_by(*[desc(column) for column in order_columns])
 
-        # 전체 개수 계산
+        # 전체 개수 계산 (거리 범위가 없으면 거리 계산 없이 개수만 조회)
         if count_total:
-            # count_query = query.with_only_columns(func.count()).order_by(None)
-            total_count = await self.db.execute(select(func.count())
-                                                .select_from(query.subquery())
-                                            )
-            total_count = total_count.scalar()
+            count_key = (
+                count_mode,
+                name.strip().casefold() if name else None,
+                area_code,
+                tuple(sorted(heritage_type)) if heritage_type else heritage_type,
+                era_category if era_category != EraCategory.ALL else None,
+                # 거리 범위 개수는 좌표에 따라 달라지므로 반올림 없이 정확한 좌표로 구분
+                (distance_range, user_latitude, user_longitude) if distance_range else None
+            )
+            total_count, total_count_estimated = await self.count_heritages(filters, count_key, count_mode)
         else:
-            total_count = 0
-
-        # 거리 범위 필터링
-        if distance_range:
-            min_dist, max_dist = parse_heritage_dist_range(distance_range)
-            query = query.where(and_(distance_expr >= min_dist, distance_expr < max_dist))
+            total_count, total_count_estimated = 0, False
 
         # 페이지 네이션 적용
         query = query.limit(limit).offset(offset)
 
-        logger.info(f"문화재 조회 SQL 쿼리가 생성되었습니다.: {query}")
+        # MATCH 구문은 MySQL 방언으로만 문자열 변환 가능
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"문화재 조회 SQL 쿼리가 생성되었습니다.: {query.compile(dialect=mysql.dialect())}")
         logger.info(f"쿼리 파라미터: user_latitude={user_latitude}, user_longitude={user_longitude}, area_code={area_code}, distance_range={distance_range}, limit={limit}, offset={offset}")
         
         try:
             result = await self.db.execute(query)
             heritages = result.unique().all()
             logger.info(f"쿼리 개수 결과 : {len(heritages)}")
-            return heritages, total_count
+            return heritages, total_count, total_count_estimated
         except Exception as e:
             logger.error(f"쿼리 실행 중 오류 발생: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    # 검색 조건별 문화재 개수 조회 (정규화된 조건 키로 TTL 캐싱)
+    # (개수, 추정치 여부) 반환 - 추정 불가로 정확한 개수를 조회한 경우 추정치 아님
+    async def count_heritages(self, filters: list, count_key: tuple, count_mode: CountMode = CountMode.EXACT) -> Tuple[int, bool]:
+        cached = _count_cache.get(count_key)
+        if cached is not None:
+            return cached
+
+        total_count = None
+        if count_mode == CountMode.ESTIMATED:
+            total_count = await self.estimate_heritage_count(select(Heritage.id).where(*filters))
+        estimated = total_count is not None
+        if total_count is None:
+            result = await self.db.execute(select(func.count(Heritage.id)).where(*filters))
+            total_count = result.scalar()
+
+        _count_cache.set(count_key, (total_count, estimated))
+        return total_count, estimated
+
+    # 옵티마이저 실행 계획의 예상 행 수로 개수 추정 (대량 결과용)
+    # 전문 검색 / 세미 조인처럼 heritages 를 조회당 인덱스 탐색으로 읽는 계획은 추정 불가 (None, 정확한 개수로 대체)
+    async def estimate_heritage_count(self, query) -> Optional[int]:
+        result = await self.db.execute(Explain(query))
+        return estimate_result_rows(result.mappings(), Heritage.__tablename__)
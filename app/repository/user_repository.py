@@ -1,10 +1,15 @@
 import logging
+from typing import Optional
+from sqlalchemy import lambda_stmt, update, delete, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
 
 from app.error.auth_exception import DatabaseOperationException, InvalidTokenException, UserNotFoundException
+from app.models.chat.chat_session import ChatSession
 from app.models.user import User
+from app.models.user_bookmark import UserBookmark
 
 logger = logging.getLogger(__name__)
 
@@ -30,22 +35,25 @@ class UserRepository:
         return result.scalars().first()
     
     async def get_user_by_id(self, user_id: int) -> User:
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
         return result.scalars().first()
 
+    # 인증 요청마다 호출되므로 lambda_stmt 로 구문 구성 / 컴파일 결과 캐시 (토큰 값은 바인드 파라미터)
     async def get_user_by_token(self, token: str) -> User:
-        result = await self.db.execute(select(User).where(User.token == token))
+        result = await self.db.execute(lambda_stmt(lambda: select(User).where(User.token == token)))
         user = result.scalar_one_or_none()
         if not user:
             raise InvalidTokenException(token)
         return user
     
-    async def update_user_token(self, user_id: int, token: str) -> User:
+    # 토큰 변경 (로그아웃 시 token=None 이면 만료 시각도 삭제)
+    async def update_user_token(self, user_id: int, token: Optional[str], expires_at: Optional[datetime] = None) -> User:
         try:
             user = await self.db.get(User, user_id)
             if not user:
                 raise UserNotFoundException(f"ID: {user_id}")
             user.token = token
+            user.token_expires_at = expires_at if token else None
             await self.db.commit()
             await self.db.refresh(user)
             return user
@@ -62,4 +70,54 @@ class UserRepository:
         except Exception as e:
             await self.db.rollback()
             logger.error(f"유저 업데이트 중 오류 발생: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    # 만료된 토큰 일괄 삭제 (토큰 유니크 인덱스 크기 유지, 처리한 사용자 수 반환)
+    async def clear_expired_tokens(self, now: datetime, batch_size: int) -> int:
+        try:
+            # 다른 워커가 처리 중인 행은 건너뜀
+            result = await self.db.execute(select(User.id)
+                                           .where(User.token_expires_at < now)
+                                           .order_by(User.token_expires_at)
+                                           .limit(batch_size)
+                                           .with_for_update(skip_locked=True))
+            user_ids = result.scalars().all()
+            if user_ids:
+                # last_login 자동 갱신(onupdate) 방지를 위해 기존 값 유지
+                await self.db.execute(update(User)
+                                      .where(User.id.in_(user_ids))
+                                      .values(token=None, token_expires_at=None, last_login=User.last_login)
+                                      .execution_options(synchronize_session=False))
+            await self.db.commit()
+            return len(user_ids)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"만료 토큰 정리 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
+            raise DatabaseOperationException("만료 토큰 정리")
+
+    # 토큰이 없고 마지막 로그인이 cutoff 이전이며 채팅 세션 / 북마크가 없는 게스트 사용자 일괄 삭제
+    async def delete_inactive_guests(self, cutoff: datetime, batch_size: int) -> int:
+        try:
+            no_history = (
+                ~exists().where(ChatSession.user_id == User.id) &
+                ~exists().where(UserBookmark.user_id == User.id)
+            )
+            result = await self.db.execute(select(User.id)
+                                           .where((User.last_login < cutoff) & (User.token == None) & no_history)
+                                           .order_by(User.last_login)
+                                           .limit(batch_size)
+                                           .with_for_update(skip_locked=True))
+            user_ids = result.scalars().all()
+            deleted = 0
+            if user_ids:
+                # 조회 이후 세션이 생성된 사용자는 제외
+                result = await self.db.execute(delete(User)
+                                               .where(User.id.in_(user_ids) & no_history)
+                                               .execution_options(synchronize_session=False))
+                deleted = result.rowcount
+            await self.db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"게스트 사용자 정리 중 데이터베이스 오류 발생: {str(e)}", exc_info=True)
+            raise DatabaseOperationException("게스트 사용자 정리")
@@ -1,10 +1,12 @@
 from fastapi import APIRouter
 
-from app.router.v1 import user, chat, image, heritage
+from app.router.v1 import user, chat, image, heritage, system, analytics
 
 api_router = APIRouter()
 
 api_router.include_router(user.router, prefix="/users", tags=["users"])
 api_router.include_router(chat.router, prefix="/chat", tags=["chat"])
 api_router.include_router(heritage.router, prefix="/heritages", tags=["heritages"])
-api_router.include_router(image.router, prefix="/image", tags=["image"])
\ No newline at end of file
+api_router.include_router(image.router, prefix="/image", tags=["image"])
+api_router.include_router(system.router, prefix="/system", tags=["system"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
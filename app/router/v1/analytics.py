@@ -0,0 +1,62 @@
+import logging
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_read_db
+from app.schemas.analytics import BuildingVisitStat, DailyUsageStat, HeritageUsageStat
+from app.service.analytics_service import AnalyticsService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# 문화재별 이용 통계 (세션 수, 퀴즈 수, 세션당 평균 대화 수)
+@router.get("/heritages", response_model=List[HeritageUsageStat])
+async def get_heritage_usage_stats(
+    start_date: Optional[date] = Query(None, description="시작일 (기본값: 종료일 기준 30일 전)"),
+    end_date: Optional[date] = Query(None, description="종료일 (기본값: 오늘)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db)
+):
+    try:
+        return await AnalyticsService(db).get_heritage_stats(start_date, end_date, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"문화재별 이용 통계 조회 중 예상치 못한 오류 발생: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 에러")
+
+# 일별 이용 통계
+@router.get("/daily", response_model=List[DailyUsageStat])
+async def get_daily_usage_stats(
+    start_date: Optional[date] = Query(None, description="시작일 (기본값: 종료일 기준 30일 전)"),
+    end_date: Optional[date] = Query(None, description="종료일 (기본값: 오늘)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    try:
+        return await AnalyticsService(db).get_daily_stats(start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"일별 이용 통계 조회 중 예상치 못한 오류 발생: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 에러")
+
+# 인기 건축물 (채팅 요약의 방문 건축물 기준)
+@router.get("/buildings", response_model=List[BuildingVisitStat])
+async def get_popular_buildings(
+    start_date: Optional[date] = Query(None, description="시작일 (기본값: 종료일 기준 30일 전)"),
+    end_date: Optional[date] = Query(None, description="종료일 (기본값: 오늘)"),
+    heritage_id: Optional[int] = Query(None, description="문화재 ID"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db)
+):
+    try:
+        return await AnalyticsService(db).get_building_visits(start_date, end_date, heritage_id, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"인기 건축물 조회 중 예상치 못한 오류 발생: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 에러")
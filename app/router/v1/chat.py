@@ -4,11 +4,12 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db
 from app.error.chat_exception import (
     ChatServiceException, 
     NoQuizAvailableException, 
     QuizGenerationException,
+    SessionEndedException,
     SessionNotFoundException, 
     SummaryNotFoundException
 )
@@ -71,6 +72,8 @@ async def add_chat_message(
     try:
         return await chat_service.update_chat_conversation(session_id, message.content)
        
+    except SessionEndedException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except SessionNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ChatServiceException as e:
@@ -90,6 +93,8 @@ async def get_heritage_building_info(
     try:
         return await chat_service.update_info_conversation(session_id, building_data.building_id)
         
+    except SessionEndedException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except (SessionNotFoundException, BuildingNotFoundException, InvalidAssociationException) as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ChatServiceException as e:
@@ -109,6 +114,8 @@ async def get_heritage_building_quiz(
     try:
         return await chat_service.update_quiz_conversation(session_id, building_data.building_id)
 
+    except SessionEndedException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except (SessionNotFoundException, BuildingNotFoundException, InvalidAssociationException) as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except NoQuizAvailableException as e:
@@ -132,6 +139,8 @@ async def get_building_recommented_questions(
     try:
         return await chat_service.get_building_questions(session_id, building_data.building_id)
     
+    except SessionEndedException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except (SessionNotFoundException, BuildingNotFoundException, InvalidAssociationException) as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -142,7 +151,7 @@ async def get_building_recommented_questions(
 @router.get("/{session_id}/message/recommend-questions", response_model=List[str])
 async def get_message_recommented_questions(
     session_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     chat_service = ChatService(db)
     try:
@@ -159,7 +168,7 @@ async def get_message_recommented_questions(
 @router.get("/sessions/{session_id}/summary", response_model=ChatSummaryResponse)
 async def get_chat_summary(
     session_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     chat_service = ChatService(db)
     try:    
@@ -202,7 +211,7 @@ async def end_chat_session(
     
 # 채팅 세션 종료 여부 확인
 @router.get("/sessions/{session_id}/status", response_model=ChatSessionStatusResponse)
-async def check_chat_session_status(session_id: int, db: AsyncSession = Depends(get_db)):
+async def check_chat_session_status(session_id: int, db: AsyncSession = Depends(get_read_db)):
     chat_service = ChatService(db)
     try:
         ended_status = await chat_service.is_chat_session_ended(session_id)
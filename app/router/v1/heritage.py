@@ -5,9 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from app.core.deps import get_db
+from app.core.deps import get_read_db
 from app.error.heritage_exceptions import DatabaseConnectionError, HeritageNotFoundException, HeritageServiceException, InvalidCoordinatesException
-from app.models.enums import EraCategory, SortOrder
+from app.models.enums import CountMode, EraCategory, SortOrder
 from app.schemas.heritage import HeritageDetailResponse, HeritageListResponse, PaginatedHeritageResponse
 from app.service.heritage_service import HeritageService
 
@@ -19,7 +19,7 @@ router = APIRouter()
 # 문화재 리스트 조회
 @router.get("/lists", response_model=PaginatedHeritageResponse)
 async def get_heritage_list(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     user_latitude: float = Query(..., ge=-90, le=90),
@@ -29,8 +29,10 @@ async def get_heritage_list(
     heritage_type: Optional[List[int]] = Query(None, description="문화재 유형"),
     distance_range: Optional[str] = Query(None, description="거리 범위 유형 (0-0.5, 0.5-1, 1-10, 10-100, 100-1000)"),
     era_category: Optional[EraCategory] = Query(None),
-    sort_by: str = Query("id", description="정렬할 필드 (ID, 거리)"),
-    sort_order: SortOrder = Query(SortOrder.ASC, description="정렬 순서 (오름차순 or 내림차순)")
+    sort_by: str = Query("id", description="정렬할 필드 (id, distance, relevance: 이름 검색 관련도)"),
+    sort_order: SortOrder = Query(SortOrder.ASC, description="정렬 순서 (오름차순 or 내림차순)"),
+    count_mode: CountMode = Query(CountMode.EXACT, description="전체 개수 계산 방식 (정확 or 추정)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 대신 커서 기준으로 조회)")
 ):
     try:
         heritage_service = HeritageService(db)
@@ -45,7 +47,9 @@ async def get_heritage_list(
             distance_range,
             era_category,
             sort_by,
-            sort_order
+            sort_order,
+            count_mode,
+            cursor
         )
 
         return heritages
@@ -67,7 +71,7 @@ async def get_heritage_list(
 @router.get("/{heritage_id}/details", response_model=HeritageDetailResponse)
 async def get_heritage_detail(
     heritage_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         heritage_service = HeritageService(db)
@@ -0,0 +1,19 @@
+import logging
+
+from fastapi import APIRouter
+
+from app.core.database import pooled_engines
+from app.core.db_metrics import get_pool_metrics
+from app.schemas.system import DatabasePoolMetrics, DatabasePoolMetricsResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# 데이터베이스 커넥션 풀 사용 현황 조회
+@router.get("/metrics/db-pool", response_model=DatabasePoolMetricsResponse)
+async def get_db_pool_metrics():
+    return DatabasePoolMetricsResponse(pools=[
+        DatabasePoolMetrics(name=name, **get_pool_metrics(pooled_engine.pool))
+        for name, pooled_engine in pooled_engines.items()
+    ])
@@ -2,17 +2,20 @@ import logging
 import secrets
 import string
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db, get_token    
+from app.core.deps import get_db, get_read_db, get_token    
 from app.core.security import decode_token
 from app.error.auth_exception import (
     AuthServiceException,
     InvalidTokenException,
     UserCreationException
 )
+from app.models.enums import ExportFormat
 from app.schemas.user import UserValidationResponse, UserTempLoginResponse, UserLogoutResponse
+from app.service.export_service import ExportService
 from app.service.user_service import UserService
 
 # 로깅 설정
@@ -90,4 +93,34 @@ async def logout(token: str = Depends(get_token), db: AsyncSession = Depends(get
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
     except Exception as e:
         logger.error(f"로그아웃 중 예상치 못한 오류 발생: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 에러")
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 에러")
+
+# 사용자 이용 기록 내보내기 (NDJSON / CSV 스트리밍)
+@router.get("/{user_id}/export")
+async def export_user_history(
+    user_id: int,
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="내보내기 형식 (ndjson, csv)"),
+    token: str = Depends(get_token),
+    db: AsyncSession = Depends(get_read_db)
+):
+    user_service = UserService(db)
+    try:
+        user = await user_service.get_user_by_token(token)
+    except InvalidTokenException:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰", headers={"WWW-Authenticate": "Bearer"})
+    except Exception as e:
+        logger.error(f"이용 기록 내보내기 사용자 확인 중 예상치 못한 오류 발생: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 에러")
+
+    # 본인 기록만 내보내기 가능
+    if user.id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="다른 사용자의 이용 기록은 내보낼 수 없습니다.")
+
+    # 최근 쓰기로 주 DB 에 고정된 클라이언트는 내보내기도 주 DB 에서 조회
+    export_service = ExportService(use_replica=db.sync_session.info.get("use_replica", True))
+    media_type = "text/csv; charset=utf-8" if format == ExportFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        export_service.stream_user_history(user_id, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="user_{user_id}_history.{format.value}"'}
+    )
@@ -0,0 +1,26 @@
+from datetime import date
+from typing import Optional
+from pydantic import BaseModel
+
+# 문화재별 이용 통계
+class HeritageUsageStat(BaseModel):
+    heritage_id: int
+    heritage_name: Optional[str]
+    session_count: int
+    quiz_count: int
+    turn_count: int
+    avg_turns_per_session: float
+
+# 일별 이용 통계
+class DailyUsageStat(BaseModel):
+    stat_date: date
+    session_count: int
+    quiz_count: int
+    turn_count: int
+    avg_turns_per_session: float
+
+# 인기 건축물 통계
+class BuildingVisitStat(BaseModel):
+    heritage_id: int
+    building_name: str
+    visit_count: int
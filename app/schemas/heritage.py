@@ -61,8 +61,10 @@ class HeritageListResponse(BaseModel):
 class PaginatedHeritageResponse(BaseModel):
     items: List[HeritageListResponse]
     total_count : int
+    total_count_estimated: bool = False
     page: int
     limit: int
+    next_cursor: Optional[str] = None
 
 class HeritageDetailResponse(BaseModel):
     id: int
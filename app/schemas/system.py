@@ -0,0 +1,21 @@
+from typing import List
+
+from pydantic import BaseModel
+
+# 데이터베이스 커넥션 풀 지표
+class DatabasePoolMetrics(BaseModel):
+    name: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    utilization: float
+    checkout_count: int
+    checkout_timeouts: int
+    checkout_wait_avg_ms: float
+    checkout_wait_max_ms: float
+
+# 엔진별 커넥션 풀 지표 (주 DB / 복제본)
+class DatabasePoolMetricsResponse(BaseModel):
+    pools: List[DatabasePoolMetrics]
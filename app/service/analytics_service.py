@@ -0,0 +1,73 @@
+import logging
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repository.analytics_repository import AnalyticsRepository
+from app.schemas.analytics import BuildingVisitStat, DailyUsageStat, HeritageUsageStat
+
+logger = logging.getLogger(__name__)
+
+# 기간 미지정 시 최근 30일
+DEFAULT_PERIOD_DAYS = 30
+
+# SUM 결과 (DECIMAL) 정수 변환
+def as_int(value) -> int:
+    return int(value or 0)
+
+def average_turns(turn_count: int, session_count: int) -> float:
+    return round(turn_count / session_count, 2) if session_count else 0.0
+
+class AnalyticsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.analytics_repository = AnalyticsRepository(db)
+
+    # 조회 기간 확인 (종료일 기본값 오늘, 시작일 기본값 종료일 기준 30일 전)
+    def resolve_period(self, start_date: Optional[date], end_date: Optional[date]) -> Tuple[date, date]:
+        end_date = end_date or date.today()
+        start_date = start_date or end_date - timedelta(days=DEFAULT_PERIOD_DAYS - 1)
+        if start_date > end_date:
+            raise ValueError("시작일은 종료일보다 늦을 수 없습니다.")
+        return start_date, end_date
+
+    # 문화재별 이용 통계 조회
+    async def get_heritage_stats(self, start_date: Optional[date], end_date: Optional[date], limit: int) -> List[HeritageUsageStat]:
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        rows = await self.analytics_repository.get_heritage_stats(start_date, end_date, limit)
+        return [
+            HeritageUsageStat(
+                heritage_id=row.heritage_id,
+                heritage_name=row.name,
+                session_count=as_int(row.session_count),
+                quiz_count=as_int(row.quiz_count),
+                turn_count=as_int(row.turn_count),
+                avg_turns_per_session=average_turns(as_int(row.turn_count), as_int(row.session_count))
+            )
+            for row in rows
+        ]
+
+    # 일별 이용 통계 조회
+    async def get_daily_stats(self, start_date: Optional[date], end_date: Optional[date]) -> List[DailyUsageStat]:
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        rows = await self.analytics_repository.get_daily_stats(start_date, end_date)
+        return [
+            DailyUsageStat(
+                stat_date=row.stat_date,
+                session_count=as_int(row.session_count),
+                quiz_count=as_int(row.quiz_count),
+                turn_count=as_int(row.turn_count),
+                avg_turns_per_session=average_turns(as_int(row.turn_count), as_int(row.session_count))
+            )
+            for row in rows
+        ]
+
+    # 인기 건축물 조회
+    async def get_building_visits(self, start_date: Optional[date], end_date: Optional[date], heritage_id: Optional[int], limit: int) -> List[BuildingVisitStat]:
+        start_date, end_date = self.resolve_period(start_date, end_date)
+        rows = await self.analytics_repository.get_building_visits(start_date, end_date, heritage_id, limit)
+        return [
+            BuildingVisitStat(heritage_id=row.heritage_id, building_name=row.building_name, visit_count=as_int(row.visit_count))
+            for row in rows
+        ]
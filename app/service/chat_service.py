@@ -13,13 +13,15 @@ from typing import Any, Callable, Dict, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.heritage_index import get_heritage_index
 from app.core.config import settings
 from app.error.chat_exception import ChatServiceException, NoQuizAvailableException, QuizGenerationException
 from app.error.heritage_exceptions import (
     BuildingNotFoundException, 
+    HeritageNotFoundException,
     InvalidAssociationException
 )
-from app.error.chat_exception import SessionNotFoundException
+from app.error.chat_exception import SessionEndedException, SessionNotFoundException
 from app.models.enums import ChatbotType, RoleType
 from app.schemas.heritage import BuildingInfoButtonResponse, BuildingQuizButtonResponse, RecommendedQuestionResponse
 from app.service.clova_service import ClovaService
@@ -36,6 +38,7 @@ from app.schemas.chat import (
     VisitedBuilding
 )
 
+from app.utils.codec import decode_text
 from app.utils.common import extract_hashtags, parse_quiz_content, process_hashtags
 
 logger = logging.getLogger(__name__)
@@ -53,25 +56,34 @@ class ChatService:
         self.clova_service = ClovaService(db)
         self.s3_service = S3Service()
         self.current_sliding_window = None
+        self.current_session_started_at = None
     
     # 채팅 세션 생성하기
     async def create_chat_session(self, user_id: int, heritage_id: int) -> ChatSessionCreateResponse:
         logger.info(f"ChatService에서 채팅 세션 생성을 시도합니다. (user_id: {user_id}, heritage_id: {heritage_id})")
         async with self.db.begin():
             try:
-                # 채팅 세션 생성하기
-                new_session = await self.chat_repository.create_chat_session(user_id, heritage_id)
-
-                # 문화재 정보 가져오기
-                heritage = await self.heritage_repository.get_heritage_by_id(heritage_id)
+                # 문화재 이름은 검색 인덱스에서 조회 (인덱스에 없을 때만 DB 조회)
+                heritage_index = get_heritage_index()
+                heritage_name = heritage_index.get_name(heritage_id) if heritage_index else None
+                if heritage_name is None:
+                    try:
+                        heritage_name = await self.heritage_repository.get_heritage_name_by_id(heritage_id)
+                    except ValueError:
+                        raise HeritageNotFoundException(heritage_id)
+
+                # 채팅 세션 생성하기 (이미 활성 세션이 있으면 기존 세션)
+                new_session = await self.chat_repository.create_chat_session(user_id, heritage_id, heritage_name)
+
+                # 코스 정보는 참조 데이터 스냅샷에서 조회
                 routes = await self.heritage_repository.get_routes_with_buildings_by_heritages_id(heritage_id)
 
                 return ChatSessionCreateResponse(
                     session_id=new_session.id,
                     start_time=new_session.start_time,
                     created_at=new_session.created_at,
-                    heritage_id=heritage.id,
-                    heritage_name=heritage.name,
+                    heritage_id=heritage_id,
+                    heritage_name=new_session.heritage_name,
                     routes=routes
                 )
             except Exception as e:
@@ -105,10 +117,16 @@ class ChatService:
             chat_session = await self.chat_repository.get_chat_session(session_id)
             if not chat_session:
                 raise SessionNotFoundException(session_id)
+
+            # 종료된 세션 (보관 후 대화 내용이 비워진 세션 포함) 에는 대화 추가 불가
+            if chat_session.end_time is not None:
+                raise SessionEndedException(session_id)
             
+            self.current_session_started_at = chat_session.start_time
+
             # 기존 대화 내용 가져오기
-            full_conversation = json.loads(chat_session.full_conversation) if chat_session.full_conversation else []
-            self.current_sliding_window = json.loads(chat_session.sliding_window) if chat_session.sliding_window else []
+            full_conversation = json.loads(decode_text(chat_session.full_conversation)) if chat_session.full_conversation else []
+            self.current_sliding_window = json.loads(decode_text(chat_session.sliding_window)) if chat_session.sliding_window else []
 
             logger.debug(f"현재 슬라이딩 윈도우: {self.current_sliding_window}")
             
@@ -128,7 +146,7 @@ class ChatService:
             await self.save_conversation(session_id, full_conversation, new_sliding_window)
 
             return bot_response
-        except SessionNotFoundException:
+        except (SessionNotFoundException, SessionEndedException):
             raise
         except Exception as e:
             logger.error(f"챗봇 대화 업데이트 중 오류 발생: {str(e)}", exc_info=True)
@@ -226,7 +244,9 @@ class ChatService:
 
             # 가장 최근 챗봇 메시지 조회 
             # 최근 메시지 뿐 아니라 연관된 다른 컬럼 데이터도 가져올 수 있기 때문에 bot_response와 구분
-            bot_message = await self.chat_repository.get_latest_message(session_id, RoleType.ASSISTANT)
+            bot_message = await self.chat_repository.get_latest_message(
+                session_id, RoleType.ASSISTANT, since=self.current_session_started_at
+            )
             
             if bot_message is None:
                 raise ChatServiceException("대화 업데이트 이후 챗봇 메시지를 찾을 수 없습니다.")
@@ -245,6 +265,8 @@ class ChatService:
                 timestamp=bot_message.timestamp,
                 # audio_url=audio_url
             )
+        except (SessionNotFoundException, SessionEndedException):
+            raise
         except Exception as e:
             logger.error(f"채팅 대화 업데이트 중 오류 발생: {str(e)}", exc_info=True)
             raise ChatServiceException("채팅 대화 업데이트 실패")
@@ -275,7 +297,7 @@ class ChatService:
                 image_url=image_url or "",
                 bot_response=bot_response or ""
             )
-        except (SessionNotFoundException, BuildingNotFoundException, InvalidAssociationException):
+        except (SessionNotFoundException, SessionEndedException, BuildingNotFoundException, InvalidAssociationException):
             raise
         except Exception as e:
             logger.error(f"건축물 정보 제공 중 오류 발생: {str(e)}", exc_info=True)
@@ -304,26 +326,32 @@ class ChatService:
     # 문화재 건축물 퀴즈 제공 
     async def update_quiz_conversation(self, session_id: int, building_id: int) -> BuildingQuizButtonResponse:
         try:
-            chat_session, building = await self.validation_service.validate_session_and_building(session_id, building_id)
-
-            if chat_session.quiz_count <= 0:
-                raise NoQuizAvailableException("퀴즈를 더이상 사용하실 수 없습니다.")
+            await self.validation_service.validate_session_and_building(session_id, building_id)
 
             # 해당 건축물의 이름 조회
             building_name = await self.heritage_repository.get_heritage_building_name_by_id(building_id)
             if not building_name:
                 raise BuildingNotFoundException(f"건축물 ID {building_id} 에 해당하는 건축물 이름을 찾을 수 없습니다.")
-            
-            # 퀴즈 데이터 파싱
+
+            # 남은 퀴즈 사용 횟수 사전 확인 (횟수가 없으면 퀴즈 생성 생략)
+            chat_session = await self.chat_repository.get_chat_session(session_id)
+            if not chat_session or not chat_session.quiz_count:
+                raise NoQuizAvailableException("퀴즈를 더이상 사용하실 수 없습니다.")
+
+            # 퀴즈 데이터 파싱 (LLM 호출 동안 세션 행을 잠그지 않도록 차감 전에 생성)
             parsed_quiz = await self.get_quiz_with_retry(session_id, building_name)
 
-            # 퀴즈 카운트
-            chat_session.quiz_count -= 1
-            self.db.add(chat_session)
-            await self.db.commit()
+            # 퀴즈 사용 횟수 차감과 퀴즈 저장을 한 트랜잭션으로 커밋 (동시 요청 시에도 남은 횟수 이상 차감되지 않음)
+            try:
+                quiz_count = await self.chat_repository.reserve_quiz(session_id)
+                if quiz_count is None:
+                    raise NoQuizAvailableException("퀴즈를 더이상 사용하실 수 없습니다.")
 
-            # 퀴즈 데이터 저장
-            saved_quiz = await self.heritage_repository.save_quiz_data(session_id, parsed_quiz)
+                saved_quiz = await self.heritage_repository.save_quiz_data(session_id, parsed_quiz)
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
 
             # full_conversation 퀴즈 참조 추가
             # quiz_reference = {'question': saved_quiz.question, 'options': saved_quiz.options, 'answer': saved_quiz.answer, 'explanation': saved_quiz.explanation}
@@ -338,10 +366,11 @@ class ChatService:
                 options=json.loads(saved_quiz.options) if isinstance(saved_quiz.options, str) else saved_quiz.options,
                 answer=saved_quiz.answer,
                 explanation=saved_quiz.explanation,
-                quiz_count=chat_session.quiz_count
+                quiz_count=quiz_count
             )
 
-        except (SessionNotFoundException, BuildingNotFoundException, InvalidAssociationException):
+        except (SessionNotFoundException, SessionEndedException, BuildingNotFoundException, InvalidAssociationException,
+                NoQuizAvailableException, QuizGenerationException):
             raise
         except Exception as e:
             logger.error(f"퀴즈 대화 업데이트 중 오류 발생: {str(e)}", exc_info=True)
@@ -389,7 +418,7 @@ class ChatService:
                 questions=questions[:3]
             )
 
-        except (SessionNotFoundException, BuildingNotFoundException, InvalidAssociationException):
+        except (SessionNotFoundException, SessionEndedException, BuildingNotFoundException, InvalidAssociationException):
             raise
         except Exception as e:
             logger.error(f"추천 질문 업데이트 중 오류 발생: {str(e)}", exc_info=True)
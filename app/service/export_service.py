@@ -0,0 +1,122 @@
+import io
+import csv
+import json
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.enums import ExportFormat
+from app.repository.chat_repository import ChatRepository
+
+logger = logging.getLogger(__name__)
+
+# CSV 내보내기 컬럼 (레코드 유형별로 해당하지 않는 컬럼은 빈 값)
+CSV_COLUMNS = (
+    "record_type", "session_id", "id", "created_at",
+    "heritage_id", "heritage_name", "end_time",
+    "role", "content",
+    "question", "options", "answer", "explanation",
+    "keywords", "visited_buildings",
+)
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON 으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+def _parse_options(options: str):
+    try:
+        return json.loads(options) if options else []
+    except ValueError:
+        return options
+
+def session_records(row) -> Iterable[Dict[str, Any]]:
+    yield {
+        "record_type": "session",
+        "session_id": row.id,
+        "id": row.id,
+        "created_at": row.start_time,
+        "heritage_id": row.heritage_id,
+        "heritage_name": row.heritage_name,
+        "end_time": row.end_time,
+    }
+    if row.summary_keywords or row.visited_buildings:
+        yield {
+            "record_type": "summary",
+            "session_id": row.id,
+            "created_at": row.summary_generated_at,
+            "keywords": row.summary_keywords,
+            "visited_buildings": row.visited_buildings,
+        }
+
+def message_records(row) -> Iterable[Dict[str, Any]]:
+    yield {
+        "record_type": "message",
+        "session_id": row.session_id,
+        "id": row.id,
+        "created_at": row.created_at,
+        "role": row.role.value if row.role else None,
+        "content": row.content,
+    }
+
+def quiz_records(row) -> Iterable[Dict[str, Any]]:
+    yield {
+        "record_type": "quiz",
+        "session_id": row.session_id,
+        "id": row.id,
+        "created_at": row.created_at,
+        "question": row.question,
+        "options": _parse_options(row.options),
+        "answer": row.answer,
+        "explanation": row.explanation,
+    }
+
+def format_ndjson(records: Iterable[Dict[str, Any]]) -> str:
+    return "".join(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n" for record in records)
+
+def format_csv(records: Iterable[Dict[str, Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        writer.writerow([
+            json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else
+            value.isoformat() if isinstance(value, datetime) else
+            "" if value is None else value
+            for value in (record.get(column) for column in CSV_COLUMNS)
+        ])
+    return buffer.getvalue()
+
+class ExportService:
+    """사용자 이용 기록 (채팅 세션, 요약, 메시지, 퀴즈) 스트리밍 내보내기"""
+
+    def __init__(self, use_replica: bool = True):
+        self.use_replica = use_replica
+
+    # 서버 측 커서로 batch 단위로 읽어 바로 전송하므로 기록 양과 관계없이 메모리 사용량 일정
+    async def stream_user_history(self, user_id: int, export_format: ExportFormat) -> AsyncIterator[str]:
+        formatter = format_csv if export_format == ExportFormat.CSV else format_ndjson
+        batch_size = settings.USER_EXPORT_BATCH_SIZE
+
+        # 응답 전송 동안 유지되는 별도 조회 세션
+        async with AsyncSessionLocal(info={"read_only": True, "use_replica": self.use_replica}) as session:
+            chat_repository = ChatRepository(session)
+            sources = [
+                (chat_repository.stream_user_sessions, session_records),
+                (chat_repository.stream_user_messages, message_records),
+                (chat_repository.stream_user_quizzes, quiz_records),
+            ]
+
+            if export_format == ExportFormat.CSV:
+                yield format_csv([{column: column for column in CSV_COLUMNS}])
+
+            try:
+                # 서버 측 커서는 커넥션당 하나이므로 조회 대상별로 순서대로 읽음
+                for stream, to_records in sources:
+                    result = await stream(user_id, batch_size)
+                    async for rows in result.partitions():
+                        yield formatter(record for row in rows for record in to_records(row))
+            except Exception as e:
+                logger.error(f"사용자 이용 기록 내보내기 중 오류 발생 (user_id: {user_id}): {str(e)}", exc_info=True)
+                raise
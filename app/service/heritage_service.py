@@ -3,13 +3,19 @@ import logging
 from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from haversine import haversine
 
+from app.cache.heritage_index import get_heritage_index
 from app.error.heritage_exceptions import DatabaseConnectionError, HeritageNotFoundException, InvalidCoordinatesException
-from app.models.enums import EraCategory, SortOrder
+from app.models.enums import CountMode, EraCategory, SortOrder
 from app.repository.heritage_repository import HeritageRepository
 from app.schemas.heritage import HeritageDetailResponse, HeritageListResponse, PaginatedHeritageResponse
-from app.utils.common import parse_location_for_detail, parse_location_for_list
+from app.utils.common import (
+    decode_heritage_cursor,
+    encode_heritage_cursor,
+    normalize_search_keyword,
+    parse_location_for_detail,
+    parse_location_for_list
+)
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -32,11 +38,57 @@ class HeritageService:
             distance_range: Optional[str] = None,
             era_category: Optional[EraCategory] = None,
             sort_by: str = "id",
-            sort_order: SortOrder = SortOrder.ASC
+            sort_order: SortOrder = SortOrder.ASC,
+            count_mode: CountMode = CountMode.EXACT,
+            cursor: Optional[str] = None
     ) -> PaginatedHeritageResponse:
+        # 커서가 있으면 OFFSET 없이 마지막 항목 이후부터 조회
+        cursor_position = decode_heritage_cursor(cursor, sort_by, sort_order.name) if cursor else None
+        offset = 0 if cursor_position else (page - 1) * limit
+
+        # 검색어는 한 번만 정규화하여 인메모리 인덱스 / DB 조회에 동일하게 사용 (정규화 후 빈 검색어는 이름 필터 없음)
+        name = (normalize_search_keyword(name) or None) if name else None
+
+        # 인메모리 인덱스가 로드된 경우 DB 조회 없이 응답
+        heritage_index = get_heritage_index()
+        if heritage_index is not None:
+            heritages, total_count = heritage_index.search(
+                limit,
+                offset,
+                user_latitude,
+                user_longitude,
+                name,
+                area_code,
+                heritage_type,
+                distance_range,
+                era_category,
+                sort_by,
+                sort_order,
+                cursor_position
+            )
+
+            heritage_list = [
+                HeritageListResponse(
+                    id = heritage.id,
+                    name = heritage.name,
+                    location = heritage.location,
+                    heritage_type = heritage.heritage_type or "Unknown",
+                    image_url = heritage.image_url or settings.DEFAULT_IMAGE_URL,
+                    distance = round(distance, 1)
+                )
+                for heritage, distance in heritages
+            ]
+
+            return PaginatedHeritageResponse(
+                items=heritage_list,
+                total_count=total_count,
+                page=page,
+                limit=limit,
+                next_cursor=self.build_next_cursor(heritages, limit, sort_by, sort_order)
+            )
+
         try:
-            offset = (page - 1) * limit
-            heritages, total_count = await self.heritage_repository.search_heritages(
+            heritages, total_count, total_count_estimated = await self.heritage_repository.search_heritages(
                 limit, 
                 offset, 
                 user_latitude, 
@@ -48,7 +100,9 @@ class HeritageService:
                 era_category,
                 sort_by,
                 sort_order,
-                count_total=True
+                count_total=True,
+                count_mode=count_mode,
+                cursor=cursor_position
             )
         except SQLAlchemyError as e:
             logger.error(f"Database error in get_heritages: {str(e)}")
@@ -58,7 +112,7 @@ class HeritageService:
             HeritageListResponse(
                 id = heritage.id,
                 name = heritage.name,
-                location = parse_location_for_list(heritage.location),
+                location = heritage.location_list if heritage.location_list is not None else parse_location_for_list(heritage.location),
                 heritage_type = heritage.heritage_types.name if heritage.heritage_types else "Unknown",
                 image_url = heritage.image_url or settings.DEFAULT_IMAGE_URL,
                 distance = round(distance, 1) if distance is not None else None
@@ -69,8 +123,24 @@ class HeritageService:
         return PaginatedHeritageResponse(
             items=heritage_list,
             total_count=total_count,
+            total_count_estimated=total_count_estimated,
             page=page,
-            limit=limit
+            limit=limit,
+            next_cursor=self.build_next_cursor(heritages, limit, sort_by, sort_order)
+        )
+
+    # 다음 페이지 커서 생성 (마지막 페이지면 None)
+    def build_next_cursor(self, heritages: list, limit: int, sort_by: str, sort_order: SortOrder) -> Optional[str]:
+        # 관련도 정렬은 페이지 번호 방식으로만 조회
+        if len(heritages) < limit or sort_by == "relevance":
+            return None
+
+        last_heritage, last_distance = heritages[-1]
+        return encode_heritage_cursor(
+            sort_by,
+            sort_order.name,
+            float(last_distance) if last_distance is not None else None,
+            last_heritage.id
         )
     
     # 문화재 상세 조회
@@ -94,5 +164,5 @@ class HeritageService:
             sub_category1 = heritage.sub_category1,
             sub_category2 = heritage.sub_category2,
             era = heritage.era,
-            location = parse_location_for_detail(heritage.location)
+            location = heritage.location_detail if heritage.location_detail is not None else parse_location_for_detail(heritage.location)
         )
\ No newline at end of file
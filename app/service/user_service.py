@@ -2,8 +2,9 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import Depends, HTTPException
-from datetime import timedelta
+from datetime import datetime, timedelta
 
+from app.core.config import settings
 from app.core.deps import get_db    
 from app.error.auth_exception import (
     AuthServiceException, 
@@ -31,12 +32,15 @@ class UserService:
                 if not user:
                     raise UserCreationException("사용자 생성 실패")
 
+                expires_delta = timedelta(minutes=settings.GUEST_TOKEN_EXPIRE_MINUTES)
                 access_token = create_access_token(
                     data={"sub": str(user.id)},
-                    expires_delta=timedelta(hours=1)
+                    expires_delta=expires_delta
                 )
                 
-                updated_user = await self.user_repository.update_user_token(user.id, access_token)
+                updated_user = await self.user_repository.update_user_token(
+                    user.id, access_token, expires_at=datetime.now() + expires_delta
+                )
                 
                 if not updated_user:
                     raise UserCreationException("사용자 토큰 업데이트 실패")
@@ -1,5 +1,5 @@
 from typing import Any, Dict
-from app.error.chat_exception import SessionNotFoundException
+from app.error.chat_exception import SessionEndedException, SessionNotFoundException
 from app.repository.chat_repository import ChatRepository
 from app.repository.heritage_repository import HeritageRepository
 from app.error.heritage_exceptions import BuildingNotFoundException, InvalidAssociationException
@@ -15,6 +15,10 @@ class ValidationService:
         if not chat_session:
             raise SessionNotFoundException(session_id)
 
+        # 종료된 세션은 대화 내용이 보관 테이블로 이동되므로 대화 추가 불가
+        if chat_session.end_time is not None:
+            raise SessionEndedException(session_id)
+
         building = await self.heritage_repository.get_heritage_building_by_id(building_id)
         if not building:
             raise BuildingNotFoundException(building_id)
@@ -0,0 +1,34 @@
+import logging
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repository.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# 만료 게스트 토큰 정리 및 이용 기록 없는 게스트 사용자 삭제 (짧은 트랜잭션의 배치 단위로 반복)
+async def sweep_guest_users():
+    batch_size = settings.GUEST_SWEEP_BATCH_SIZE
+    # 토큰 만료 시각은 애플리케이션 시각으로 저장되므로 같은 기준으로 비교
+    now = datetime.now()
+    cutoff = now - timedelta(days=settings.GUEST_USER_RETENTION_DAYS)
+
+    cleared, deleted = 0, 0
+    async with AsyncSessionLocal() as session:
+        user_repository = UserRepository(session)
+
+        while True:
+            count = await user_repository.clear_expired_tokens(now, batch_size)
+            cleared += count
+            if count < batch_size:
+                break
+
+        while True:
+            count = await user_repository.delete_inactive_guests(cutoff, batch_size)
+            deleted += count
+            if count < batch_size:
+                break
+
+    if cleared or deleted:
+        logger.info(f"게스트 사용자 정리 완료 (만료 토큰 삭제: {cleared}건, 사용자 삭제: {deleted}건)")
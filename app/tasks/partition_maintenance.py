@@ -0,0 +1,111 @@
+import logging
+from datetime import date
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLE = "chat_messages"
+FUTURE_PARTITION = "p_future"
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+# 월별 파티션 이름 (pYYYYMM)
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+# first_month ~ last_month 월별 파티션 정의 (각 파티션 상한은 다음 달 1일)
+def monthly_partition_definitions(first_month: date, last_month: date) -> List[str]:
+    definitions = []
+    month = first_month
+    while month <= last_month:
+        definitions.append(f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d}')")
+        month = add_months(month, 1)
+    return definitions
+
+# 파티션 목록 조회 (이름, 상한 날짜 / MAXVALUE 는 None)
+async def get_partitions(conn: AsyncConnection, table: str) -> List[Tuple[str, date]]:
+    result = await conn.execute(text("""
+        SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """), {"table": table})
+
+    partitions = []
+    for name, description in result:
+        bound = None if description == "MAXVALUE" else date.fromisoformat(description.strip("'")[:10])
+        partitions.append((name, bound))
+    return partitions
+
+# DB 서버 기준 이번 달 1일
+async def current_month(conn: AsyncConnection) -> date:
+    result = await conn.execute(text("SELECT CURRENT_DATE()"))
+    return result.scalar().replace(day=1)
+
+# 앞으로 사용할 월별 파티션 미리 생성 (미리 만들어 두면 p_future 가 비어 있어 데이터 이동 없음)
+async def ensure_future_partitions(conn: AsyncConnection, table: str, months_ahead: int) -> int:
+    partitions = await get_partitions(conn, table)
+    bounds = [bound for _, bound in partitions if bound is not None]
+
+    this_month = await current_month(conn)
+    first_month = max(bounds) if bounds else this_month
+    definitions = monthly_partition_definitions(first_month, add_months(this_month, months_ahead))
+    if not definitions:
+        return 0
+
+    await conn.execute(text(
+        f"ALTER TABLE {table} REORGANIZE PARTITION {FUTURE_PARTITION} INTO "
+        f"({', '.join(definitions)}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE))"
+    ))
+    return len(definitions)
+
+# 보관 기간이 지난 파티션 정리 (행 단위 DELETE 없이 파티션 단위로 삭제 / 분리)
+async def expire_partitions(conn: AsyncConnection, table: str, retention_months: int, mode: str) -> List[str]:
+    cutoff = add_months(await current_month(conn), -retention_months)
+    expired = [
+        name for name, bound in await get_partitions(conn, table)
+        if bound is not None and bound <= cutoff
+    ]
+
+    for name in expired:
+        if mode == "archive":
+            # 동일 구조의 비파티션 테이블과 교환하면 데이터 복사 없이 분리됨
+            archive_table = f"{table}_{name}"
+            await conn.execute(text(f"CREATE TABLE IF NOT EXISTS {archive_table} LIKE {table}"))
+            # 이전 실행에서 교환 후 삭제 전에 중단된 경우 이미 분리된 데이터를 되돌리지 않음
+            result = await conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {archive_table})"))
+            if not result.scalar():
+                await conn.execute(text(f"ALTER TABLE {archive_table} REMOVE PARTITIONING"))
+                await conn.execute(text(f"ALTER TABLE {table} EXCHANGE PARTITION {name} WITH TABLE {archive_table}"))
+        await conn.execute(text(f"ALTER TABLE {table} DROP PARTITION {name}"))
+
+    return expired
+
+# 채팅 메시지 파티션 유지 관리 (미래 파티션 생성 및 보관 기간 만료 파티션 정리)
+async def maintain_chat_message_partitions():
+    # MySQL DDL 은 암묵적으로 커밋됨
+    async with engine.begin() as conn:
+        if not await get_partitions(conn, PARTITIONED_TABLE):
+            logger.warning(f"{PARTITIONED_TABLE} 테이블이 파티션되어 있지 않습니다. 마이그레이션을 먼저 적용하세요.")
+            return
+
+        created = await ensure_future_partitions(conn, PARTITIONED_TABLE, settings.CHAT_MESSAGE_PARTITION_MONTHS_AHEAD)
+
+        expired = []
+        if settings.CHAT_MESSAGE_RETENTION_MONTHS > 0:
+            expired = await expire_partitions(
+                conn, PARTITIONED_TABLE, settings.CHAT_MESSAGE_RETENTION_MONTHS, settings.CHAT_MESSAGE_RETENTION_MODE
+            )
+
+    if created or expired:
+        logger.info(
+            f"{PARTITIONED_TABLE} 파티션 관리 완료 (신규 파티션: {created}개, "
+            f"만료 파티션 {settings.CHAT_MESSAGE_RETENTION_MODE}: {expired})"
+        )
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# 주기적으로 비동기 작업 실행 (작업 실패 시에도 다음 주기에 재시도)
+async def run_periodically(name: str, interval_seconds: float, job: Callable[[], Awaitable[None]]):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"주기 작업 '{name}' 실행 중 오류 발생: {str(e)}", exc_info=True)
+
+def start_periodic_task(name: str, interval_seconds: float, job: Callable[[], Awaitable[None]]) -> asyncio.Task:
+    logger.info(f"주기 작업 '{name}'을 시작합니다. (주기: {interval_seconds}초)")
+    return asyncio.create_task(run_periodically(name, interval_seconds, job), name=name)
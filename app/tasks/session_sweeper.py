@@ -0,0 +1,30 @@
+import logging
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repository.chat_repository import ChatRepository
+
+logger = logging.getLogger(__name__)
+
+# 유휴 세션 종료 및 종료 세션 대화 내용 보관 (배치 단위로 반복)
+async def sweep_chat_sessions():
+    batch_size = settings.CHAT_SESSION_SWEEP_BATCH_SIZE
+
+    ended, archived = 0, 0
+    async with AsyncSessionLocal() as session:
+        chat_repository = ChatRepository(session)
+
+        while True:
+            count = await chat_repository.end_idle_sessions(settings.CHAT_SESSION_IDLE_MINUTES, batch_size)
+            ended += count
+            if count < batch_size:
+                break
+
+        while True:
+            count = await chat_repository.archive_ended_sessions(settings.CHAT_SESSION_ARCHIVE_AFTER_MINUTES, batch_size)
+            archived += count
+            if count < batch_size:
+                break
+
+    if ended or archived:
+        logger.info(f"채팅 세션 정리 완료 (유휴 세션 종료: {ended}건, 대화 내용 보관: {archived}건)")
@@ -0,0 +1,84 @@
+import logging
+from collections import Counter
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.chat.chat_message import ChatMessage
+from app.models.chat.chat_session import ChatSession
+from app.models.quiz import Quiz
+from app.repository.analytics_repository import AnalyticsRepository
+
+logger = logging.getLogger(__name__)
+
+# 건축물 방문 집계 위치 이름 (보관 처리된 세션 기준)
+BUILDING_VISIT_SOURCE = "chat_session_archives"
+
+# 원본 행을 ID 순서로 집계 (집계 위치 잠금 -> 다음 구간 조회 -> 누적 + 위치 갱신을 한 트랜잭션으로 커밋)
+async def aggregate_id_source(writer: AnalyticsRepository, reader: AnalyticsRepository, name: str, model, column: str, counter) -> int:
+    aggregated = 0
+    while True:
+        watermark = await writer.lock_watermark(name)
+        if watermark is None:
+            # 다른 워커가 집계 중
+            await writer.db.rollback()
+            return aggregated
+
+        upto = await reader.next_id_bound(model, watermark.last_id, settings.ANALYTICS_BATCH_SIZE, settings.ANALYTICS_SETTLE_MINUTES)
+        if upto is None:
+            await writer.db.rollback()
+            return aggregated
+
+        rows = await counter(watermark.last_id, upto)
+        await writer.add_heritage_stats(column, rows)
+        watermark.last_id = upto
+        await writer.db.commit()
+        aggregated += sum(count for _, _, count in rows)
+
+# 보관 처리된 세션의 방문 건축물 집계 (요약 생성이 끝난 뒤 보관되므로 세션당 한 번만 집계)
+async def aggregate_building_visits(writer: AnalyticsRepository, reader: AnalyticsRepository) -> int:
+    aggregated = 0
+    while True:
+        watermark = await writer.lock_watermark(BUILDING_VISIT_SOURCE)
+        if watermark is None:
+            await writer.db.rollback()
+            return aggregated
+
+        rows = await reader.get_archived_visits(
+            watermark.last_time, watermark.last_id, settings.ANALYTICS_BATCH_SIZE, settings.ANALYTICS_SETTLE_MINUTES
+        )
+        if not rows:
+            await writer.db.rollback()
+            return aggregated
+
+        visits = Counter()
+        for row in rows:
+            for building in row.visited_buildings or []:
+                if building.get("visited") and building.get("name"):
+                    visits[(row.stat_date, row.heritage_id, building["name"][:255])] += 1
+
+        await writer.add_building_visits(visits)
+        watermark.last_time, watermark.last_id = rows[-1].archived_at, rows[-1].session_id
+        await writer.db.commit()
+        aggregated += sum(visits.values())
+
+        if len(rows) < settings.ANALYTICS_BATCH_SIZE:
+            return aggregated
+
+# 이용 통계 증분 집계 (원본 조회는 조회 전용 세션, 집계 테이블 쓰기만 주 DB)
+async def aggregate_usage_analytics():
+    async with AsyncSessionLocal() as write_session, \
+            AsyncSessionLocal(info={"read_only": True, "use_replica": settings.ANALYTICS_USE_REPLICA}) as read_session:
+        writer, reader = AnalyticsRepository(write_session), AnalyticsRepository(read_session)
+
+        sources = [
+            ("chat_sessions", ChatSession, "session_count", reader.count_sessions),
+            ("chat_messages", ChatMessage, "turn_count", reader.count_turns),
+            ("quizzes", Quiz, "quiz_count", reader.count_quizzes),
+        ]
+        counts = {}
+        for name, model, column, counter in sources:
+            counts[column] = await aggregate_id_source(writer, reader, name, model, column, counter)
+        counts["visit_count"] = await aggregate_building_visits(writer, reader)
+
+    if any(counts.values()):
+        logger.info(f"이용 통계 집계 완료 ({counts})")
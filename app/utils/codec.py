@@ -0,0 +1,53 @@
+import zlib
+from typing import Optional, Union
+
+# 인코딩된 값 헤더 (0x00 으로 시작하는 JSON 텍스트는 없으므로 기존 평문 데이터와 구분 가능)
+CODEC_MARKER = b"\x00"
+CODEC_RAW = 0       # 압축하지 않은 UTF-8 (압축 이득이 없는 짧은 값)
+CODEC_ZLIB = 1      # zlib 압축 UTF-8
+
+# 이 크기 미만의 값은 압축하지 않음
+MIN_COMPRESS_BYTES = 256
+ZLIB_LEVEL = 6
+
+# 대화 내용 컬럼 값 인코딩 (헤더 + 압축 데이터)
+def encode_text(value: Optional[str]) -> Optional[bytes]:
+    if value is None:
+        return None
+
+    raw = value.encode()
+    if len(raw) >= MIN_COMPRESS_BYTES:
+        compressed = zlib.compress(raw, ZLIB_LEVEL)
+        if len(compressed) < len(raw):
+            return CODEC_MARKER + bytes([CODEC_ZLIB]) + compressed
+    return CODEC_MARKER + bytes([CODEC_RAW]) + raw
+
+# 대화 내용 컬럼 값 디코딩 (헤더 없는 기존 평문 / zlib 데이터도 지원)
+def decode_text(value: Optional[Union[bytes, str]]) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+
+    value = bytes(value)
+    if value[:1] == CODEC_MARKER and len(value) >= 2:
+        version, payload = value[1], value[2:]
+        if version == CODEC_ZLIB:
+            return zlib.decompress(payload).decode()
+        if version == CODEC_RAW:
+            return payload.decode()
+        raise ValueError(f"지원하지 않는 인코딩 버전입니다: {version}")
+
+    # 헤더 없이 zlib 으로만 압축된 이전 보관 데이터
+    if value[:1] == b"\x78":
+        try:
+            return zlib.decompress(value).decode()
+        except zlib.error:
+            pass
+    return value.decode()
+
+# 이미 인코딩된 값은 그대로, 아니면 인코딩
+def ensure_encoded(value: Optional[Union[bytes, str]]) -> Optional[bytes]:
+    if isinstance(value, (bytes, bytearray)) and value[:1] == CODEC_MARKER:
+        return bytes(value)
+    return encode_text(decode_text(value))
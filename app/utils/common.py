@@ -1,8 +1,14 @@
 import re
+import json
+import math
+import base64
+import binascii
 import logging
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.error.chat_exception import QuizParsingException
+from app.error.heritage_exceptions import InvalidCursorException
+from app.models.enums import EraCategory
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +145,51 @@ def parse_location_for_list(location: str) -> str:
 
     return cleaned
 
+# 시대 원문 키워드별 시대 카테고리 (상위 시대 포함)
+ERA_KEYWORDS = [
+    ("석기", [EraCategory.STONE_AGE, EraCategory.PREHISTORIC]),
+    ("청동기", [EraCategory.BRONZE_AGE, EraCategory.PREHISTORIC]),
+    ("철기", [EraCategory.IRON_AGE, EraCategory.PREHISTORIC]),
+    ("선사", [EraCategory.PREHISTORIC]),
+    ("삼한", [EraCategory.SAMHAN]),
+    ("삼국", [EraCategory.THREE_KINGDOMS]),
+    ("고구려", [EraCategory.GOGURYEO, EraCategory.THREE_KINGDOMS]),
+    ("백제", [EraCategory.BAEKJE, EraCategory.THREE_KINGDOMS]),
+    ("가야", [EraCategory.THREE_KINGDOMS]),
+    ("통일신라", [EraCategory.UNIFIED_SILLA]),
+    ("발해", [EraCategory.BALHAE]),
+    ("고려", [EraCategory.GORYEO]),
+    ("조선", [EraCategory.JOSEON]),
+    ("대한제국", [EraCategory.KOREAN_EMPIRE]),
+    ("일제", [EraCategory.JAPANESE_COLONIAL]),
+]
+
+# 문화재 시대 원문을 시대 카테고리 목록으로 분류
+def classify_era(era: Optional[str]) -> List[EraCategory]:
+    if not era:
+        return []
+
+    text = re.sub(r'\s+', '', era)
+    categories = []
+    for keyword, matched in ERA_KEYWORDS:
+        if keyword in text:
+            categories.extend(category for category in matched if category not in categories)
+
+    # '통일신라'를 제외한 '신라'는 삼국시대 신라로 분류
+    if re.search(r'(?<!통일)신라', text):
+        categories.extend(category for category in [EraCategory.SILLA, EraCategory.THREE_KINGDOMS] if category not in categories)
+
+    return categories
+
+# 시대 카테고리 목록을 비트마스크로 변환 ('전체' 제외 정의 순서대로 비트 할당)
+def era_bitmask(categories: List[EraCategory]) -> int:
+    bits = [category for category in EraCategory if category != EraCategory.ALL]
+    mask = 0
+    for category in categories:
+        if category != EraCategory.ALL:
+            mask |= 1 << bits.index(category)
+    return mask
+
 # 문화재 사용자 거리 파싱
 def parse_heritage_dist_range(distance_range: str) -> Tuple[float, float]:
     ranges = {
@@ -151,6 +202,52 @@ def parse_heritage_dist_range(distance_range: str) -> Tuple[float, float]:
 
     return ranges.get(distance_range, (0, float('inf')))
 
+# 사용자 위치 기준 반경(km)을 감싸는 경계 사각형 WKT 생성 (경도-위도 순서)
+def build_bounding_box_wkt(latitude: float, longitude: float, radius_km: float) -> str:
+    lat_delta = radius_km / 111.32
+    # 고위도에서 경도 간격이 0 으로 수렴하지 않도록 cos 값 하한 지정
+    lon_delta = radius_km / (111.32 * max(math.cos(math.radians(latitude)), 0.01))
+
+    min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+    min_lon, max_lon = max(longitude - lon_delta, -180.0), min(longitude + lon_delta, 180.0)
+
+    return (
+        f"POLYGON(({min_lon} {min_lat}, {max_lon} {min_lat}, {max_lon} {max_lat}, "
+        f"{min_lon} {max_lat}, {min_lon} {min_lat}))"
+    )
+
+# 전문 검색어 정규화 (BOOLEAN MODE 연산자 제거 및 공백 정리)
+def normalize_search_keyword(keyword: str) -> str:
+    cleaned = re.sub(r'[+\-<>()~*"@]', ' ', keyword)
+    return re.sub(r'\s+', ' ', cleaned).strip()
+
+# 문화재 리스트 커서 생성 (정렬 방식 + 마지막 항목의 거리, ID)
+def encode_heritage_cursor(sort_by: str, sort_order: str, distance: Optional[float], heritage_id: int) -> str:
+    payload = {
+        "s": f"{'distance' if sort_by == 'distance' else 'id'}:{sort_order}",
+        "d": distance,
+        "i": heritage_id
+    }
+    encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
+# 문화재 리스트 커서 파싱 (요청의 정렬 방식과 다르면 유효하지 않은 커서로 처리)
+def decode_heritage_cursor(cursor: str, sort_by: str, sort_order: str) -> Tuple[Optional[float], int]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if sort_by == "relevance":
+            raise ValueError("관련도 정렬은 커서 페이지네이션을 지원하지 않음")
+        if payload["s"] != f"{'distance' if sort_by == 'distance' else 'id'}:{sort_order}":
+            raise ValueError("정렬 방식 불일치")
+
+        distance = float(payload["d"]) if payload["d"] is not None else None
+        if sort_by == "distance" and distance is None:
+            raise ValueError("거리 값 누락")
+
+        return distance, int(payload["i"])
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise InvalidCursorException(cursor) from e
+
 # 해시태그 처리 함수
 def process_hashtags(text):
     hashtags = []
@@ -0,0 +1,38 @@
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+class Explain(Executable, ClauseElement):
+    """바인딩 파라미터를 유지한 채 EXPLAIN 을 실행하기 위한 구문"""
+    inherit_cache = False
+
+    def __init__(self, statement, format: str = None):
+        self.statement = statement
+        self.format = format
+
+@compiles(Explain)
+def compile_explain(element, compiler, **kw):
+    prefix = f"EXPLAIN FORMAT={element.format} " if element.format else "EXPLAIN "
+    return prefix + compiler.process(element.statement, **kw)
+
+# 테이블을 조회당 인덱스 탐색으로 읽는 접근 방식 (전문 검색, 세미 조인의 피구동 테이블 등)
+# 이 경우 rows 는 조회 1회당 예상 행 수이므로 전체 결과 행 수 추정에 사용할 수 없음
+PER_LOOKUP_ACCESS_TYPES = frozenset({"fulltext", "eq_ref", "ref"})
+
+def estimate_result_rows(plan_rows: Iterable[Mapping[str, Any]], table: str) -> Optional[int]:
+    """
+    EXPLAIN (기본 형식) 결과로 최상위 쿼리 결과 행 수 추정
+    조인 순서대로 rows * filtered 를 곱하며, table 을 조회당 인덱스 탐색으로 읽거나 계획에 없으면 None
+    """
+    estimate, found = 1.0, False
+    for row in plan_rows:
+        # 종속 서브쿼리 (select_id > 1) 는 외부 행마다 실행되므로 제외
+        if row.get("id") not in (1, None):
+            continue
+        if row["table"] == table:
+            if row["type"] in PER_LOOKUP_ACCESS_TYPES:
+                return None
+            found = True
+        estimate *= (row["rows"] or 0) * (row["filtered"] or 100) / 100
+    return int(estimate) if found else None
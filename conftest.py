@@ -0,0 +1,131 @@
+"""
+pytest 공통 픽스처
+
+mysql_test_url: 설정된 MySQL 서버에 테스트용 데이터베이스 ({MYSQL_DB}_test) 를 만들고 스키마 생성
+                (MySQL 에 접속할 수 없으면 이 픽스처를 쓰는 테스트는 건너뜀)
+client: 테스트용 데이터베이스 세션을 사용하는 애플리케이션 TestClient (lifespan 백그라운드 작업 미실행)
+query_budget: 블록 안에서 처리된 요청이 쿼리 예산을 넘거나 같은 구문을 반복 실행하면 테스트 실패
+
+    def test_get_heritage_detail(client, query_budget):
+        with query_budget(max_queries=3, max_repeats=1):
+            client.get("/api/v1/heritages/1/details")
+"""
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.database import Base
+from app.core.deps import get_db, get_read_db
+from app.core.query_stats import (
+    RequestQueryStats,
+    add_query_stats_observer,
+    enable_query_stats,
+    remove_query_stats_observer
+)
+from main import app
+
+MYSQL_TEST_DATABASE = f"{settings.MYSQL_DB}_test"
+
+# 테스트용 데이터베이스 생성 / 삭제 권한이 필요하므로 root 계정으로 접속
+def mysql_server_url() -> URL:
+    return make_url(str(settings.SQLALCHEMY_DATABASE_URI)).set(
+        username="root", password=settings.MYSQL_ROOT_PASSWORD, database=None
+    )
+
+async def _execute_on_server(*statements: str):
+    server_engine = create_async_engine(mysql_server_url(), poolclass=NullPool, connect_args={"connect_timeout": 3})
+    try:
+        async with server_engine.begin() as conn:
+            for statement in statements:
+                await conn.execute(text(statement))
+    finally:
+        await server_engine.dispose()
+
+async def _create_schema(url: URL):
+    test_engine = create_async_engine(url, poolclass=NullPool)
+    try:
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await test_engine.dispose()
+
+@pytest.fixture(scope="session")
+def mysql_test_url():
+    try:
+        asyncio.run(_execute_on_server(
+            f"DROP DATABASE IF EXISTS `{MYSQL_TEST_DATABASE}`",
+            f"CREATE DATABASE `{MYSQL_TEST_DATABASE}` CHARACTER SET utf8mb4"
+        ))
+    except Exception as e:
+        pytest.skip(f"MySQL 테스트 서버에 접속할 수 없습니다: {e}")
+
+    url = mysql_server_url().set(database=MYSQL_TEST_DATABASE)
+    asyncio.run(_create_schema(url))
+    yield url
+    asyncio.run(_execute_on_server(f"DROP DATABASE IF EXISTS `{MYSQL_TEST_DATABASE}`"))
+
+@pytest.fixture
+def client(mysql_test_url):
+    # 커넥션을 재사용하지 않으므로 TestClient 의 이벤트 루프와 관계없이 사용 가능
+    test_engine = create_async_engine(mysql_test_url, poolclass=NullPool)
+    enable_query_stats(test_engine.sync_engine)
+
+    async def override_get_db():
+        async with AsyncSession(test_engine, expire_on_commit=False) as session:
+            yield session
+            await session.commit()
+
+    async def override_get_read_db():
+        async with AsyncSession(test_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(test_engine.dispose())
+
+@pytest.fixture
+def query_budget():
+    # TestClient 는 별도 스레드의 이벤트 루프에서 요청을 처리하므로 잠금 후 수집
+    lock = threading.Lock()
+    recorded: List[RequestQueryStats] = []
+
+    def observe(stats: RequestQueryStats):
+        with lock:
+            recorded.append(stats)
+
+    @contextmanager
+    def check(max_queries: int, max_repeats: Optional[int] = None):
+        with lock:
+            start = len(recorded)
+        yield
+        with lock:
+            requests = recorded[start:]
+
+        for stats in requests:
+            if stats.count > max_queries:
+                statements = "\n".join(f"  {count}회: {statement[:200]}" for statement, count in stats.statements.most_common())
+                pytest.fail(f"쿼리 예산 초과 ({stats.path}): {stats.count}회 / 예산 {max_queries}회\n{statements}")
+            if max_repeats is not None:
+                repeated = stats.repeated(max_repeats + 1)
+                if repeated:
+                    statements = "\n".join(f"  {count}회: {statement[:200]}" for statement, count in repeated.items())
+                    pytest.fail(f"N+1 의심 쿼리 ({stats.path}): 같은 구문 {max_repeats}회 초과 실행\n{statements}")
+
+    add_query_stats_observer(observe)
+    try:
+        yield check
+    finally:
+        remove_query_stats_observer(observe)
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
@@ -15,11 +17,22 @@ from app.models.init import (
     HeritageRouteBuilding,
     HeritageType
 )
+from app.cache.heritage_index import refresh_heritage_index
+from app.cache.reference_snapshot import refresh_reference_snapshot
 from app.core.database import Base, engine
 from app.core.config import settings
+from app.core.primary_pin import PrimaryPinMiddleware
+from app.core.query_stats import QueryStatsMiddleware
 from app.router.api import api_router
+from app.tasks.scheduler import start_periodic_task
+from app.tasks.session_sweeper import sweep_chat_sessions
+from app.tasks.partition_maintenance import maintain_chat_message_partitions
+from app.tasks.usage_analytics import aggregate_usage_analytics
+from app.tasks.guest_sweeper import sweep_guest_users
 from contextlib import asynccontextmanager
 
+logger = logging.getLogger(__name__)
+
 def custom_generate_unique_id(route: APIRoute) -> str:
     if route.tags:
         return f"{route.tags[0]}-{route.name}"
@@ -33,8 +46,61 @@ async def app_lifespan(app: FastAPI):
         # await conn.run_sync(Base.metadata.drop_all)
         # 모든 테이블 다시 생성
         await conn.run_sync(Base.metadata.create_all)
+
+    background_tasks = []
+
+    # 문화재 검색 인덱스 로드 (실패 시 DB 조회로 동작)
+    if settings.HERITAGE_INDEX_ENABLED:
+        try:
+            await refresh_heritage_index()
+        except Exception as e:
+            logger.error(f"문화재 검색 인덱스 로드 실패: {str(e)}", exc_info=True)
+        background_tasks.append(
+            start_periodic_task("heritage-index-refresh", settings.HERITAGE_INDEX_REFRESH_SECONDS, refresh_heritage_index)
+        )
+
+    # 문화재 유형 / 건축물 / 코스 참조 데이터 스냅샷 로드 (실패 시 DB 조회로 동작)
+    if settings.REFERENCE_SNAPSHOT_ENABLED:
+        try:
+            await refresh_reference_snapshot()
+        except Exception as e:
+            logger.error(f"참조 데이터 스냅샷 로드 실패: {str(e)}", exc_info=True)
+        background_tasks.append(
+            start_periodic_task("reference-snapshot-refresh", settings.REFERENCE_SNAPSHOT_REFRESH_SECONDS, refresh_reference_snapshot)
+        )
+
+    # 유휴 채팅 세션 정리 및 종료 세션 대화 내용 보관
+    if settings.CHAT_SESSION_SWEEPER_ENABLED:
+        background_tasks.append(
+            start_periodic_task("chat-session-sweeper", settings.CHAT_SESSION_SWEEP_INTERVAL_SECONDS, sweep_chat_sessions)
+        )
+
+    # 채팅 메시지 월별 파티션 생성 및 보관 기간 만료 파티션 정리
+    if settings.CHAT_MESSAGE_PARTITION_ENABLED:
+        try:
+            await maintain_chat_message_partitions()
+        except Exception as e:
+            logger.error(f"채팅 메시지 파티션 관리 실패: {str(e)}", exc_info=True)
+        background_tasks.append(
+            start_periodic_task("chat-message-partitions", settings.CHAT_MESSAGE_PARTITION_INTERVAL_SECONDS, maintain_chat_message_partitions)
+        )
+
+    # 이용 통계 증분 집계
+    if settings.ANALYTICS_ENABLED:
+        background_tasks.append(
+            start_periodic_task("usage-analytics", settings.ANALYTICS_INTERVAL_SECONDS, aggregate_usage_analytics)
+        )
+
+    # 만료 게스트 토큰 정리 및 장기 미사용 게스트 사용자 삭제
+    if settings.GUEST_SWEEPER_ENABLED:
+        background_tasks.append(
+            start_periodic_task("guest-user-sweeper", settings.GUEST_SWEEP_INTERVAL_SECONDS, sweep_guest_users)
+        )
+
     yield
     # 애플리케이션 종료 시 실행될 로직 (필요한 경우)
+    for task in background_tasks:
+        task.cancel()
 
 app = FastAPI(
     lifespan= app_lifespan,
@@ -47,6 +113,13 @@ app = FastAPI(
 )
 
 app.add_middleware(SessionMiddleware, secret_key=settings.BACKEND_SESSION_SECRET_KEY)
+app.add_middleware(PrimaryPinMiddleware, pin_seconds=settings.REPLICA_PRIMARY_PIN_SECONDS)
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        budget=settings.QUERY_BUDGET_PER_REQUEST,
+        repeat_threshold=settings.QUERY_REPEAT_THRESHOLD
+    )
 # Base.metadata.create_all(bind=engine)
 
 # Set All CORS enabled origins
@@ -0,0 +1,45 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import IntegrityError
+
+from app.repository.chat_repository import MYSQL_DUPLICATE_ENTRY, ChatRepository
+
+class FakeResult:
+    def __init__(self, session):
+        self.session = session
+
+    def scalars(self):
+        return SimpleNamespace(first=lambda: self.session)
+
+class FakeSession:
+    """INSERT 는 중복 키 오류, 이후 조회는 동시 요청이 만든 세션 반환"""
+
+    def __init__(self, existing_session):
+        self.existing_session = existing_session
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=mysql.dialect())))
+        if len(self.statements) == 1:
+            raise IntegrityError("INSERT", {}, Exception(MYSQL_DUPLICATE_ENTRY, "Duplicate entry"))
+        return FakeResult(self.existing_session)
+
+def test_duplicate_insert_returns_concurrent_session_with_locking_read():
+    existing_session = SimpleNamespace(id=7)
+    db = FakeSession(existing_session)
+
+    session = asyncio.run(ChatRepository(db).create_chat_session(1, 1, "경복궁"))
+
+    assert session is existing_session
+    # 스냅샷이 아닌 최신 커밋 행을 보도록 공유 잠금 읽기
+    assert "LOCK IN SHARE MODE" in db.statements[1]
+
+def test_active_session_lookup_is_plain_read_by_default():
+    db = FakeSession(None)
+    db.statements.append("INSERT")
+
+    asyncio.run(ChatRepository(db).get_active_session(1, 1))
+
+    assert "LOCK IN SHARE MODE" not in db.statements[1]
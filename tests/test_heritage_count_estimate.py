@@ -0,0 +1,124 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.models.enums import CountMode
+from app.repository import heritage_repository
+from app.repository.heritage_repository import HeritageRepository
+from app.utils.explain import estimate_result_rows
+
+def plan_row(table, access_type, rows, filtered=100.0, select_id=1):
+    return {"id": select_id, "table": table, "type": access_type, "rows": rows, "filtered": filtered}
+
+def test_full_scan_uses_rows_times_filtered():
+    plan = [plan_row("heritages", "ALL", 20000, 10.0)]
+    assert estimate_result_rows(plan, "heritages") == 2000
+
+def test_range_scan_uses_rows_times_filtered():
+    plan = [plan_row("heritages", "range", 1200, 50.0)]
+    assert estimate_result_rows(plan, "heritages") == 600
+
+def test_fulltext_access_is_not_estimated():
+    # 전문 검색의 rows 는 결과 크기와 무관하게 1 로 표시됨
+    plan = [plan_row("heritages", "fulltext", 1)]
+    assert estimate_result_rows(plan, "heritages") is None
+
+def test_semi_join_with_heritages_driven_by_eq_ref_is_not_estimated():
+    # 시대 IN 서브쿼리 -> heritage_eras 가 구동 테이블, heritages 는 조회당 1행
+    plan = [
+        plan_row("heritage_eras", "ref", 3000),
+        plan_row("heritages", "eq_ref", 1),
+    ]
+    assert estimate_result_rows(plan, "heritages") is None
+
+def test_heritages_ref_access_is_not_estimated():
+    plan = [plan_row("heritages", "ref", 1, 100.0)]
+    assert estimate_result_rows(plan, "heritages") is None
+
+def test_materialized_semi_join_multiplies_along_join_order():
+    plan = [
+        plan_row("heritages", "ALL", 20000, 100.0),
+        plan_row("<subquery2>", "eq_ref", 1, 100.0),
+        plan_row("heritage_eras", "ref", 3000, 100.0, select_id=2),
+    ]
+    assert estimate_result_rows(plan, "heritages") == 20000
+
+def test_joined_tables_multiply_estimates():
+    plan = [
+        plan_row("heritages", "range", 1000, 50.0),
+        plan_row("heritage_types", "ALL", 10, 10.0),
+    ]
+    assert estimate_result_rows(plan, "heritages") == 500
+
+def test_plan_without_heritages_is_not_estimated():
+    assert estimate_result_rows([plan_row("heritage_eras", "ALL", 100)], "heritages") is None
+
+class FakeResult:
+    def __init__(self, plan=None, scalar=None):
+        self.plan = plan or []
+        self.scalar_value = scalar
+
+    def mappings(self):
+        return self.plan
+
+    def scalar(self):
+        return self.scalar_value
+
+class FakeSession:
+    """첫 실행은 EXPLAIN 결과, 이후 실행은 COUNT 결과 반환"""
+
+    def __init__(self, plan, exact_count):
+        self.results = [FakeResult(plan=plan), FakeResult(scalar=exact_count)]
+        self.executed = 0
+
+    async def execute(self, statement):
+        result = self.results[self.executed]
+        self.executed += 1
+        return result
+
+def count_with_plan(plan, exact_count, count_key):
+    session = FakeSession(plan, exact_count)
+    repository = HeritageRepository(session)
+    count = asyncio.run(repository.count_heritages([], count_key, CountMode.ESTIMATED))
+    return count, session.executed
+
+def test_estimated_count_uses_plan_estimate():
+    heritage_repository._count_cache.clear()
+    count, executed = count_with_plan([plan_row("heritages", "ALL", 20000, 10.0)], 1234, ("estimate-scan",))
+    assert (count, executed) == ((2000, True), 1)
+
+def test_estimated_count_falls_back_to_exact_count_for_fulltext():
+    heritage_repository._count_cache.clear()
+    count, executed = count_with_plan([plan_row("heritages", "fulltext", 1)], 1234, ("estimate-fulltext",))
+    # 정확한 개수로 대체했으므로 추정치가 아님
+    assert (count, executed) == ((1234, False), 2)
+    # 추정 불가 시 정확한 개수가 추정치 여부와 함께 캐시됨
+    assert heritage_repository._count_cache.get(("estimate-fulltext",)) == (1234, False)
+
+def test_cached_count_keeps_estimated_flag():
+    heritage_repository._count_cache.clear()
+    count_with_plan([plan_row("heritages", "ALL", 20000, 10.0)], 1234, ("estimate-cached",))
+    count, executed = count_with_plan([], 0, ("estimate-cached",))
+    assert (count, executed) == ((2000, True), 0)
+
+class SearchSession(FakeSession):
+    """EXPLAIN 결과 이후 목록 조회 결과 반환"""
+
+    def __init__(self, plan):
+        super().__init__(plan, None)
+        self.results[1] = SimpleNamespace(unique=lambda: SimpleNamespace(all=lambda: []))
+
+def test_distance_range_counts_are_keyed_on_exact_coordinates():
+    heritage_repository._count_cache.clear()
+    plan = [plan_row("heritages", "ALL", 20000, 10.0)]
+
+    async def search(session, user_latitude):
+        return await HeritageRepository(session).search_heritages(
+            limit=10, offset=0, user_latitude=user_latitude, user_longitude=126.9780,
+            distance_range="0-0.5", count_total=True, count_mode=CountMode.ESTIMATED
+        )
+
+    # 소수점 3자리로 반올림하면 같은 좌표가 되는 약 30m 떨어진 두 사용자는 개수 캐시를 공유하지 않음
+    for user_latitude in (37.56610, 37.56640):
+        session = SearchSession(plan)
+        asyncio.run(search(session, user_latitude))
+        assert session.executed == 2
@@ -0,0 +1,8 @@
+from sqlalchemy import inspect
+
+from app.models.heritage.heritage import Heritage
+
+def test_setting_era_does_not_touch_eras_collection():
+    heritage = Heritage(id=1, era="조선시대")
+    # 속성 변경만으로 eras 컬렉션을 로드 / 교체하지 않음 (AsyncSession 지연 로딩 방지)
+    assert "eras" not in inspect(heritage).dict
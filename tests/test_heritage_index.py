@@ -0,0 +1,43 @@
+import numpy as np
+
+from app.cache.heritage_index import HeritageIndex
+
+# (id, 유형 ID, 위도, 경도, 지역 코드, 시대, 이름, 한자 이름, 목록 위치, 위치, 이미지, 유형 이름)
+ROWS = [
+    (1, 1, 37.5796, 126.9770, 11, "조선", "경복궁", "景福宮", "서울 종로구", None, None, "사적"),
+    (2, 1, 37.5794, 126.9910, 11, "조선", "창덕궁", "昌德宮", "서울 종로구", None, None, "사적"),
+    (3, 2, 35.7898, 129.3320, 37, "통일신라", "불국사", "佛國寺", "경북 경주시", None, None, "사적"),
+]
+
+class CountingPool(bytes):
+    """문자열 풀 바이트 검색 횟수 기록"""
+    finds = 0
+
+    def find(self, *args):
+        CountingPool.finds += 1
+        return super().find(*args)
+
+def build_index() -> HeritageIndex:
+    index = HeritageIndex.from_rows(ROWS)
+    index.catalog.pool = CountingPool(index.catalog.pool)
+    CountingPool.finds = 0
+    return index
+
+def search_ids(index: HeritageIndex, name):
+    results, total_count = index.search(limit=10, offset=0, user_latitude=37.5665, user_longitude=126.9780, name=name)
+    return [entry.id for entry, _ in results], total_count
+
+def test_keyword_search_matches_name_and_hanja():
+    index = build_index()
+    assert search_ids(index, "궁") == ([1, 2], 2)
+    assert search_ids(index, "佛國") == ([3], 1)
+
+def test_empty_keyword_returns_all_rows_without_scan():
+    index = build_index()
+    assert np.array_equal(index.catalog.find_rows("name_search", b""), [0, 1, 2])
+    assert CountingPool.finds == 0
+
+def test_blank_name_is_not_a_name_filter():
+    index = build_index()
+    assert search_ids(index, "   ") == search_ids(index, None) == ([1, 2, 3], 3)
+    assert CountingPool.finds == 0
@@ -0,0 +1,36 @@
+import asyncio
+
+from app.service import heritage_service
+from app.service.heritage_service import HeritageService
+
+class RecordingIndex:
+    def __init__(self):
+        self.names = []
+
+    def search(self, limit, offset, user_latitude, user_longitude, name, *args):
+        self.names.append(name)
+        return [], 0
+
+class RecordingRepository:
+    def __init__(self):
+        self.names = []
+
+    async def search_heritages(self, limit, offset, user_latitude, user_longitude, name, *args, **kwargs):
+        self.names.append(name)
+        return [], 0, False
+
+def searched_names(monkeypatch, name):
+    index, repository = RecordingIndex(), RecordingRepository()
+    service = HeritageService.__new__(HeritageService)
+    service.heritage_repository = repository
+
+    for loaded_index in (index, None):
+        monkeypatch.setattr(heritage_service, "get_heritage_index", lambda: loaded_index)
+        asyncio.run(service.get_heritages(1, 10, 37.5665, 126.9780, name=name))
+    return index.names + repository.names
+
+def test_index_and_db_paths_receive_the_same_normalized_keyword(monkeypatch):
+    assert searched_names(monkeypatch, '  "경복궁"  (근정전) ') == ["경복궁 근정전", "경복궁 근정전"]
+
+def test_keyword_without_searchable_characters_is_not_a_name_filter(monkeypatch):
+    assert searched_names(monkeypatch, ' "()" ') == [None, None]
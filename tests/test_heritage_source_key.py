@@ -0,0 +1,19 @@
+import pandas as pd
+
+from app.commands.ingest_heritages import clean_chunk, heritage_source_key
+
+def csv_source_key(**row) -> str:
+    records = clean_chunk(pd.DataFrame([{"heritage_type_id": 1, "area_code": 11, "name": "경복궁", **row}]))
+    return records["source_key"].iloc[0]
+
+def test_legacy_empty_markers_match_cleaned_csv_key():
+    # 기존 적재 스크립트는 빈 한자 이름을 'nan' 문자열로 저장
+    expected = csv_source_key(name_hanja=float("nan"))
+    for legacy_value in ("nan", "None", "", "  ", None):
+        assert heritage_source_key(1, 11, "경복궁", legacy_value) == expected
+
+def test_stored_values_are_stripped_like_csv_values():
+    assert heritage_source_key(1, 11, " 경복궁 ", "景福宮 ") == csv_source_key(name_hanja="景福宮")
+
+def test_different_hanja_names_have_different_keys():
+    assert heritage_source_key(1, 11, "경복궁", "景福宮") != heritage_source_key(1, 11, "경복궁", None)
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.primary_pin import (
+    PRIMARY_PIN_COOKIE,
+    PrimaryPinMiddleware,
+    is_primary_pinned,
+    register_write_session
+)
+
+PIN_SECONDS = 5
+
+def fake_session(has_writes=False, new=()):
+    return SimpleNamespace(info={"has_writes": has_writes}, new=set(new), dirty=set(), deleted=set())
+
+# 워커 2개를 흉내 낸 별도 앱 인스턴스 (프로세스 메모리 공유 없음)
+def build_worker_app() -> FastAPI:
+    worker_app = FastAPI()
+    worker_app.add_middleware(PrimaryPinMiddleware, pin_seconds=PIN_SECONDS)
+
+    @worker_app.post("/write")
+    def write(request: Request):
+        register_write_session(request, fake_session(has_writes=True))
+        return {}
+
+    @worker_app.post("/pending")
+    def pending(request: Request):
+        # get_db 종료 시 커밋될 변경만 있는 경우
+        register_write_session(request, fake_session(new=[object()]))
+        return {}
+
+    @worker_app.get("/read")
+    def read(request: Request):
+        register_write_session(request, fake_session())
+        return {"pinned": is_primary_pinned(request, PIN_SECONDS)}
+
+    return worker_app
+
+def test_pin_follows_client_to_another_worker():
+    first, second = build_worker_app(), build_worker_app()
+    client = TestClient(first)
+
+    response = client.post("/write")
+    assert PRIMARY_PIN_COOKIE in response.cookies
+
+    # 같은 클라이언트의 다음 요청이 다른 워커로 가도 주 DB 로 조회
+    other_worker = TestClient(second, cookies=client.cookies)
+    assert other_worker.get("/read").json() == {"pinned": True}
+
+def test_pending_changes_set_pin():
+    client = TestClient(build_worker_app())
+    assert PRIMARY_PIN_COOKIE in client.post("/pending").cookies
+
+def test_read_only_request_does_not_set_pin():
+    client = TestClient(build_worker_app())
+    response = client.get("/read")
+
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+    assert response.json() == {"pinned": False}
+
+def test_expired_or_far_future_pin_is_ignored():
+    def request_with(value):
+        return SimpleNamespace(cookies={PRIMARY_PIN_COOKIE: value})
+
+    assert is_primary_pinned(request_with("1003.0"), PIN_SECONDS, now=1000.0)
+    assert not is_primary_pinned(request_with("999.0"), PIN_SECONDS, now=1000.0)
+    assert not is_primary_pinned(request_with("99999.0"), PIN_SECONDS, now=1000.0)
+    assert not is_primary_pinned(request_with("invalid"), PIN_SECONDS, now=1000.0)
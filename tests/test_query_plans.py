@@ -0,0 +1,453 @@
+"""
+저장소 핫 조회 쿼리 실행 계획 회귀 테스트
+
+테스트용 MySQL 데이터베이스에 대표 데이터셋을 적재한 뒤, 저장소 메서드가 실제로 실행하는 SELECT 구문을 가로채
+EXPLAIN FORMAT=JSON 으로 실행 계획을 확인한다. (MySQL 에 접속할 수 없으면 건너뜀)
+
+- 기대한 인덱스 사용 여부 (인덱스 이름 대신 선두 컬럼으로 지정, 외래키 자동 인덱스 포함)
+- 목록 조회의 filesort 여부
+- 테이블별 검사 예상 행 수 (rows_examined_per_scan) 상한
+
+로컬 MySQL 컨테이너로 실행:
+    docker run -d --name neonadeuli-mysql-test -p 3307:3306 -e MYSQL_ROOT_PASSWORD=<MYSQL_ROOT_PASSWORD> mysql:8.0
+    MYSQL_SERVER=127.0.0.1 MYSQL_PORT=3307 pytest tests/test_query_plans.py
+"""
+import re
+import json
+import random
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base
+from app.models.enums import EraCategory, HeritageTypeName, RoleType, SortOrder
+from app.models.init import (
+    ChatMessage,
+    ChatSession,
+    Heritage,
+    HeritageBuilding,
+    HeritageBuildingImage,
+    HeritageEra,
+    HeritageType,
+    User
+)
+from app.models.question import RecommendedQuestion
+from app.models.quiz import Quiz
+from app.models.spatial import st_point
+from app.repository.chat_repository import ChatRepository
+from app.repository.heritage_repository import HeritageRepository
+from app.repository.user_repository import UserRepository
+
+# 대표 데이터셋 크기
+SEED_HERITAGES = 20000
+SEED_HERITAGES_WITH_BUILDINGS = 2000
+SEED_BUILDINGS_PER_HERITAGE = 3
+SEED_IMAGES_PER_BUILDING = 3
+SEED_USERS = 5000
+SEED_SESSIONS = 20000
+SEED_MESSAGES_PER_SESSION = 6
+SEED_QUESTIONS_PER_SESSION = 3
+SEED_INSERT_BATCH_SIZE = 1000
+
+# 전문 검색 대상 이름 조합 (ngram 토큰이 겹치도록 공통 단어 사용)
+HERITAGE_NAME_WORDS = ["경복궁", "불국사", "석굴암", "창덕궁", "해인사", "수원화성", "종묘", "첨성대", "석탑", "향교"]
+SEARCH_KEYWORD = "석탑"
+
+class PlanCase:
+    """
+    실행 계획 검사 항목
+
+    indexes: 테이블별 사용해야 하는 인덱스의 선두 컬럼
+    no_filesort: 목록 조회는 인덱스 순서로 정렬되어야 함
+    max_rows: 테이블별 rows_examined_per_scan 상한 (범위 / 전문 검색처럼 LIMIT 이 반영되지 않는 경우 None)
+    """
+    __slots__ = ("name", "call", "indexes", "no_filesort", "max_rows")
+
+    def __init__(self, name: str, call: Callable[[AsyncSession, SimpleNamespace], Awaitable],
+                 indexes: Dict[str, Tuple[str, ...]], no_filesort: bool = False, max_rows: Optional[int] = None):
+        self.name = name
+        self.call = call
+        self.indexes = indexes
+        self.no_filesort = no_filesort
+        self.max_rows = max_rows
+
+CASES: List[PlanCase] = [
+    PlanCase(
+        "UserRepository.get_user_by_token",
+        lambda session, args: UserRepository(session).get_user_by_token(args.token),
+        {"users": ("token",)}, max_rows=1,
+    ),
+    PlanCase(
+        "ChatRepository.get_active_session",
+        lambda session, args: ChatRepository(session).get_active_session(args.user_id, args.heritage_id),
+        {"chat_sessions": ("user_id", "heritage_id", "is_active")}, max_rows=1,
+    ),
+    PlanCase(
+        "ChatRepository.get_chat_session",
+        lambda session, args: ChatRepository(session).get_chat_session(args.session_id),
+        {"chat_sessions": ("id",)}, max_rows=1,
+    ),
+    PlanCase(
+        "ChatRepository.get_latest_message",
+        lambda session, args: ChatRepository(session).get_latest_message(args.session_id, RoleType.ASSISTANT, args.session_started_at),
+        {"chat_messages": ("session_id", "role", "created_at")}, no_filesort=True, max_rows=SEED_MESSAGES_PER_SESSION * 10,
+    ),
+    PlanCase(
+        "ChatRepository.get_recommended_questions",
+        lambda session, args: ChatRepository(session).get_recommended_questions(args.session_id),
+        {"recommended_questions": ("session_id",)}, no_filesort=True, max_rows=SEED_QUESTIONS_PER_SESSION * 10,
+    ),
+    PlanCase(
+        "ChatRepository.get_chat_summary",
+        lambda session, args: ChatRepository(session).get_chat_summary(args.session_id),
+        {"chat_sessions": ("id",), "heritages": ("id",)}, max_rows=1,
+    ),
+    PlanCase(
+        "HeritageRepository.get_heritage_by_id",
+        lambda session, args: HeritageRepository(session).get_heritage_by_id(args.heritage_id),
+        {"heritages": ("id",), "heritage_types": ("type_id",)}, max_rows=1,
+    ),
+    PlanCase(
+        "HeritageRepository.get_heritage_building_by_id",
+        lambda session, args: HeritageRepository(session).get_heritage_building_by_id(args.building_id),
+        {"heritage_buildings": ("id",)}, max_rows=SEED_BUILDINGS_PER_HERITAGE * 10,
+    ),
+    PlanCase(
+        "HeritageRepository.get_heritage_building_images",
+        lambda session, args: HeritageRepository(session).get_heritage_building_images(args.building_id),
+        {"heritage_building_images": ("building_id",)}, max_rows=SEED_IMAGES_PER_BUILDING * 10,
+    ),
+    PlanCase(
+        "HeritageRepository.verify_building_belongs_to_heritage",
+        lambda session, args: HeritageRepository(session).verify_building_belongs_to_heritage(args.building_heritage_id, args.building_id),
+        {"heritage_buildings": ("id",)}, max_rows=1,
+    ),
+    PlanCase(
+        "HeritageRepository.search_heritages (기본 목록)",
+        lambda session, args: HeritageRepository(session).search_heritages(
+            limit=10, offset=0, user_latitude=37.5665, user_longitude=126.9780
+        ),
+        {"heritages": ("id",)}, no_filesort=True, max_rows=100,
+    ),
+    PlanCase(
+        "HeritageRepository.search_heritages (커서 역순 목록)",
+        lambda session, args: HeritageRepository(session).search_heritages(
+            limit=10, offset=0, user_latitude=37.5665, user_longitude=126.9780,
+            sort_order=SortOrder.DESC, cursor=(None, args.heritage_id)
+        ),
+        {"heritages": ("id",)}, no_filesort=True,
+    ),
+    PlanCase(
+        "HeritageRepository.search_heritages (이름 전문 검색)",
+        lambda session, args: HeritageRepository(session).search_heritages(
+            limit=10, offset=0, user_latitude=37.5665, user_longitude=126.9780, name=SEARCH_KEYWORD
+        ),
+        {"heritages": ("name", "name_hanja")},
+    ),
+]
+
+class StatementRecorder:
+    """저장소 호출 중 실행된 SELECT 구문과 바인딩 파라미터 수집"""
+
+    def __init__(self, sync_engine):
+        self.active = False
+        self.statements: List[Tuple[str, Any]] = []
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active and statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+    async def record(self, call: Callable[[], Awaitable]) -> List[Tuple[str, Any]]:
+        self.statements, self.active = [], True
+        try:
+            await call()
+        finally:
+            self.active = False
+        return self.statements
+
+# 실행 계획의 테이블 노드 (조인 / 서브쿼리 포함)
+def plan_tables(node) -> Iterator[Dict[str, Any]]:
+    if isinstance(node, dict):
+        if "table_name" in node:
+            yield node
+        for value in node.values():
+            yield from plan_tables(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from plan_tables(item)
+
+def uses_filesort(node) -> bool:
+    if isinstance(node, dict):
+        return node.get("using_filesort") is True or any(uses_filesort(value) for value in node.values())
+    if isinstance(node, list):
+        return any(uses_filesort(item) for item in node)
+    return False
+
+# 테이블 이름 / joinedload 별칭 (heritage_types_1) 일치 여부
+def matches_table(table_name: str, table: str) -> bool:
+    return re.fullmatch(rf"{re.escape(table)}(_\d+)?", table_name) is not None
+
+# 테이블별 인덱스 컬럼 목록 ({table: {index_name: [column, ...]}})
+async def get_index_columns(conn: AsyncConnection) -> Dict[str, Dict[str, List[str]]]:
+    result = await conn.execute(text("""
+        SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+    """))
+    indexes: Dict[str, Dict[str, List[str]]] = {}
+    for table, index, column in result:
+        indexes.setdefault(table, {}).setdefault(index, []).append(column)
+    return indexes
+
+# 선두 컬럼이 일치하는 인덱스 이름
+def expected_index_names(indexes: Dict[str, Dict[str, List[str]]], table: str, columns: Tuple[str, ...]) -> Set[str]:
+    return {
+        name for name, index_columns in indexes.get(table, {}).items()
+        if tuple(index_columns[:len(columns)]) == columns
+    }
+
+# 실행 계획 검사 (실패 사유 목록 반환)
+def check_plan(case: PlanCase, plans: List[Dict[str, Any]], indexes: Dict[str, Dict[str, List[str]]]) -> List[str]:
+    failures = []
+    tables = [table for plan in plans for table in plan_tables(plan)]
+
+    for table, columns in case.indexes.items():
+        expected = expected_index_names(indexes, table, columns)
+        if not expected:
+            failures.append(f"{table}: ({', '.join(columns)}) 로 시작하는 인덱스가 없습니다.")
+            continue
+        matched = [node for node in tables if matches_table(node["table_name"], table)]
+        if not matched:
+            failures.append(f"{table}: 실행 계획에 테이블이 없습니다.")
+        elif not any(node.get("key") in expected for node in matched):
+            used = ", ".join(f"{node.get('access_type')}/{node.get('key')}" for node in matched)
+            failures.append(f"{table}: 기대 인덱스 {sorted(expected)} 미사용 (사용: {used})")
+
+    if case.no_filesort and any(uses_filesort(plan) for plan in plans):
+        failures.append("목록 조회에 filesort 가 사용되었습니다.")
+
+    if case.max_rows is not None:
+        for node in tables:
+            rows = int(node.get("rows_examined_per_scan") or 0)
+            if rows > case.max_rows:
+                failures.append(f"{node['table_name']}: 검사 예상 행 수 {rows} > 상한 {case.max_rows}")
+
+    return failures
+
+# 실행 계획 요약 (테이블별 접근 방식 / 인덱스 / 예상 행 수)
+def describe_plan(plans: List[Dict[str, Any]]) -> str:
+    return ", ".join(
+        f"{node['table_name']}={node.get('access_type')}/{node.get('key')}/{node.get('rows_examined_per_scan')}"
+        for plan in plans for node in plan_tables(plan)
+    ) + (" filesort" if any(uses_filesort(plan) for plan in plans) else "")
+
+async def insert_rows(conn: AsyncConnection, model, rows: Iterable[Dict[str, Any]]):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= SEED_INSERT_BATCH_SIZE:
+            await conn.execute(insert(model.__table__).values(batch))
+            batch = []
+    if batch:
+        await conn.execute(insert(model.__table__).values(batch))
+
+# 대표 데이터셋 적재 (난수 시드 고정으로 매번 같은 분포)
+async def seed_dataset(conn: AsyncConnection):
+    rng = random.Random(42)
+    now = datetime.now().replace(microsecond=0)
+    heritage_count = SEED_HERITAGES
+    building_heritage_count = SEED_HERITAGES_WITH_BUILDINGS
+    user_count = SEED_USERS
+    session_count = SEED_SESSIONS
+    type_names = list(HeritageTypeName)
+    eras = [era for era in EraCategory if era != EraCategory.ALL]
+
+    def coordinate():
+        return round(rng.uniform(33.1, 38.6), 8), round(rng.uniform(124.6, 131.0), 8)
+
+    await insert_rows(conn, HeritageType, (
+        {"type_id": type_id, "name": type_name.value, "type_name": type_name, "default_radius": 50.0}
+        for type_id, type_name in enumerate(type_names, start=1)
+    ))
+
+    def heritage_rows():
+        for heritage_id in range(1, heritage_count + 1):
+            latitude, longitude = coordinate()
+            yield {
+                "id": heritage_id,
+                "heritage_type_id": heritage_id % len(type_names) + 1,
+                "name": f"{rng.choice(HERITAGE_NAME_WORDS)} {rng.choice(HERITAGE_NAME_WORDS)} {heritage_id}",
+                "latitude": latitude,
+                "longitude": longitude,
+                "geo_point": st_point(longitude, latitude),
+                "area_code": heritage_id % 17 + 1,
+                "source_key": f"explain-{heritage_id}",
+            }
+    await insert_rows(conn, Heritage, heritage_rows())
+    await insert_rows(conn, HeritageEra, (
+        {"era": eras[heritage_id % len(eras)], "heritage_id": heritage_id}
+        for heritage_id in range(1, heritage_count + 1)
+    ))
+
+    def building_rows():
+        for heritage_id in range(1, building_heritage_count + 1):
+            for order in range(SEED_BUILDINGS_PER_HERITAGE):
+                latitude, longitude = coordinate()
+                yield {
+                    "heritage_id": heritage_id,
+                    "building_type_id": order % len(type_names) + 1,
+                    "name": f"건축물 {heritage_id}-{order}",
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "geo_point": st_point(longitude, latitude),
+                }
+    await insert_rows(conn, HeritageBuilding, building_rows())
+    building_count = building_heritage_count * SEED_BUILDINGS_PER_HERITAGE
+    await insert_rows(conn, HeritageBuildingImage, (
+        {
+            "heritage_id": (building_id - 1) // SEED_BUILDINGS_PER_HERITAGE + 1,
+            "building_id": building_id,
+            "image_url": f"https://example.com/{building_id}/{order}.jpg",
+            "image_order": order,
+        }
+        for building_id in range(1, building_count + 1) for order in range(SEED_IMAGES_PER_BUILDING)
+    ))
+
+    await insert_rows(conn, User, (
+        {
+            "id": user_id,
+            "name": f"guest{user_id}",
+            "token": f"explain-token-{user_id:08d}",
+            "token_expires_at": now + timedelta(hours=1),
+            "last_login": now - timedelta(minutes=user_id % 1440),
+        }
+        for user_id in range(1, user_count + 1)
+    ))
+
+    # 사용자당 활성 세션 1개 (활성 세션 유니크 제약), 나머지는 종료된 세션
+    session_starts = {}
+    def session_rows():
+        for session_id in range(1, session_count + 1):
+            heritage_id = rng.randint(1, heritage_count)
+            started_at = now - timedelta(minutes=rng.randint(10, 90 * 1440))
+            session_starts[session_id] = started_at
+            yield {
+                "id": session_id,
+                "user_id": (session_id - 1) % user_count + 1,
+                "heritage_id": heritage_id,
+                "heritage_name": f"문화재 {heritage_id}",
+                "start_time": started_at,
+                "end_time": None if session_id <= user_count else started_at + timedelta(minutes=30),
+            }
+    await insert_rows(conn, ChatSession, session_rows())
+
+    await insert_rows(conn, ChatMessage, (
+        {
+            "session_id": session_id,
+            "role": RoleType.USER if turn % 2 == 0 else RoleType.ASSISTANT,
+            "content": f"메시지 {session_id}-{turn}",
+            "created_at": session_starts[session_id] + timedelta(minutes=turn),
+        }
+        for session_id in range(1, session_count + 1) for turn in range(SEED_MESSAGES_PER_SESSION)
+    ))
+    await insert_rows(conn, RecommendedQuestion, (
+        {"session_id": session_id, "question": f"추천 질문 {session_id}-{order}"}
+        for session_id in range(1, session_count + 1) for order in range(SEED_QUESTIONS_PER_SESSION)
+    ))
+    await insert_rows(conn, Quiz, (
+        {
+            "session_id": session_id,
+            "question": f"퀴즈 {session_id}",
+            "options": json.dumps(["1", "2", "3", "4"]),
+            "answer": "1",
+            "explanation": "해설",
+        }
+        for session_id in range(1, session_count + 1)
+    ))
+
+    # 옵티마이저 통계 갱신
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    await conn.execute(text(f"ANALYZE TABLE {tables}"))
+
+# 검사 인자 (적재된 데이터 중 대표 행)
+async def load_samples(conn: AsyncConnection) -> SimpleNamespace:
+    session = (await conn.execute(text("""
+        SELECT id, user_id, heritage_id, start_time FROM chat_sessions
+        WHERE end_time IS NULL ORDER BY id LIMIT 1
+    """))).one()
+    token = (await conn.execute(text("SELECT token FROM users WHERE id = :id"), {"id": session.user_id})).scalar_one()
+    building = (await conn.execute(text("SELECT id, heritage_id FROM heritage_buildings ORDER BY id LIMIT 1"))).one()
+    return SimpleNamespace(
+        token=token,
+        user_id=session.user_id,
+        heritage_id=session.heritage_id,
+        session_id=session.id,
+        session_started_at=session.start_time,
+        building_id=building.id,
+        building_heritage_id=building.heritage_id,
+    )
+
+
+async def prepare_plan_database(engine) -> Tuple[Dict[str, Dict[str, List[str]]], SimpleNamespace]:
+    async with engine.begin() as conn:
+        await seed_dataset(conn)
+    async with engine.connect() as conn:
+        return await get_index_columns(conn), await load_samples(conn)
+
+# 저장소 호출이 실행한 SELECT 구문의 실행 계획
+async def explain_case(engine, recorder: StatementRecorder, case: PlanCase, samples: SimpleNamespace) -> List[Dict[str, Any]]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        statements = await recorder.record(lambda: case.call(session, samples))
+        conn = await session.connection()
+        plans = []
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN FORMAT=JSON {statement}", parameters)
+            plans.append(json.loads(result.scalar()))
+        return plans
+
+@pytest.fixture(scope="module")
+def plan_database(mysql_test_url):
+    engine = create_async_engine(mysql_test_url, poolclass=NullPool)
+    recorder = StatementRecorder(engine.sync_engine)
+    indexes, samples = asyncio.run(prepare_plan_database(engine))
+    yield engine, recorder, indexes, samples
+    asyncio.run(engine.dispose())
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_query_plan(plan_database, case):
+    engine, recorder, indexes, samples = plan_database
+    plans = asyncio.run(explain_case(engine, recorder, case, samples))
+
+    assert plans, "실행된 SELECT 구문이 없습니다."
+    failures = check_plan(case, plans, indexes)
+    assert not failures, f"{describe_plan(plans)}\n" + "\n".join(failures)
+
+# 실행 계획 검사 로직 자체 (MySQL 없이 실행)
+SAMPLE_LIST_PLAN = {"query_block": {"ordering_operation": {"using_filesort": False, "nested_loop": [
+    {"table": {"table_name": "heritages", "access_type": "index", "key": "PRIMARY", "rows_examined_per_scan": 10}},
+    {"table": {"table_name": "heritage_types_1", "access_type": "eq_ref", "key": "PRIMARY", "rows_examined_per_scan": 1}},
+]}}}
+SAMPLE_INDEXES = {"heritages": {"PRIMARY": ["id"], "ft_heritages_name": ["name", "name_hanja"]}}
+
+def test_check_plan_accepts_index_ordered_list():
+    case = PlanCase("list", None, {"heritages": ("id",)}, no_filesort=True, max_rows=100)
+    assert check_plan(case, [SAMPLE_LIST_PLAN], SAMPLE_INDEXES) == []
+
+def test_check_plan_reports_full_scan_and_filesort():
+    plan = {"query_block": {"ordering_operation": {"using_filesort": True, "table": {
+        "table_name": "heritages", "access_type": "ALL", "key": None, "rows_examined_per_scan": 20000
+    }}}}
+    case = PlanCase("list", None, {"heritages": ("id",)}, no_filesort=True, max_rows=100)
+    failures = check_plan(case, [plan], SAMPLE_INDEXES)
+
+    assert len(failures) == 3
+    assert "기대 인덱스" in failures[0]
+    assert "filesort" in failures[1]
+    assert "20000" in failures[2]
@@ -0,0 +1,67 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.query_stats import QueryStatsMiddleware, RequestQueryStats, enable_query_stats
+
+# 같은 구문을 repeat 회 실행하는 N+1 형태의 엔드포인트 (MySQL 없이 동작)
+def build_repeating_app(repeat: int, budget: int, repeat_threshold: int) -> FastAPI:
+    repeating_engine = create_engine("sqlite://")
+    enable_query_stats(repeating_engine)
+
+    repeating_app = FastAPI()
+    repeating_app.add_middleware(QueryStatsMiddleware, budget=budget, repeat_threshold=repeat_threshold)
+
+    @repeating_app.get("/items")
+    def list_items():
+        with repeating_engine.connect() as conn:
+            return [conn.execute(text("SELECT :id"), {"id": item_id}).scalar() for item_id in range(repeat)]
+
+    return repeating_app
+
+def test_statements_are_normalized_before_counting():
+    stats = RequestQueryStats("GET /items")
+    stats.record("SELECT id\n  FROM items WHERE id = %s", 0.001)
+    stats.record("SELECT id FROM items   WHERE id = %s", 0.002)
+
+    assert stats.count == 2
+    assert stats.total_ms == 3.0
+    assert stats.repeated(2) == {"SELECT id FROM items WHERE id = %s": 2}
+
+def test_request_within_budget_passes(query_budget):
+    client = TestClient(build_repeating_app(repeat=2, budget=5, repeat_threshold=3))
+
+    with query_budget(max_queries=2, max_repeats=2):
+        assert client.get("/items").json() == [0, 1]
+
+def test_over_budget_request_is_flagged(query_budget, caplog):
+    client = TestClient(build_repeating_app(repeat=6, budget=5, repeat_threshold=3))
+
+    with caplog.at_level(logging.WARNING, logger="app.sql.query_stats"):
+        with pytest.raises(pytest.fail.Exception, match="쿼리 예산 초과"):
+            with query_budget(max_queries=5):
+                client.get("/items")
+
+    assert "쿼리 예산 초과 (GET /items): 6회" in caplog.text
+    assert "N+1 의심 쿼리 (GET /items): 6회 반복" in caplog.text
+
+def test_repeated_statement_is_flagged(query_budget):
+    client = TestClient(build_repeating_app(repeat=3, budget=10, repeat_threshold=5))
+
+    with pytest.raises(pytest.fail.Exception, match="N\\+1 의심 쿼리"):
+        with query_budget(max_queries=10, max_repeats=1):
+            client.get("/items")
+
+def test_heritage_list_within_query_budget(client, query_budget):
+    # 목록 조회 + 전체 개수 조회 (문화재 유형은 joinedload 로 함께 조회)
+    with query_budget(max_queries=2, max_repeats=1):
+        response = client.get("/api/v1/heritages/lists", params={
+            "user_latitude": 37.5665,
+            "user_longitude": 126.9780,
+            "limit": 10,
+        })
+
+    assert response.status_code == 200
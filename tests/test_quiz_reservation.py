@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.error.chat_exception import ChatServiceException, NoQuizAvailableException
+from app.service.chat_service import ChatService
+
+QUIZ = {"question": "질문", "options": ["1", "2", "3", "4"], "answer": "1", "explanation": "해설"}
+
+class FakeDB:
+    def __init__(self):
+        self.calls = []
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+class FakeChatRepository:
+    def __init__(self, db, quiz_count):
+        self.db = db
+        self.quiz_count = quiz_count
+
+    async def get_chat_session(self, session_id):
+        return SimpleNamespace(id=session_id, quiz_count=self.quiz_count)
+
+    async def reserve_quiz(self, session_id):
+        self.db.calls.append("reserve")
+        if self.quiz_count <= 0:
+            return None
+        self.quiz_count -= 1
+        return self.quiz_count
+
+class FakeHeritageRepository:
+    def __init__(self, db, fail_save=False):
+        self.db = db
+        self.fail_save = fail_save
+
+    async def get_heritage_building_name_by_id(self, building_id):
+        return "근정전"
+
+    async def save_quiz_data(self, session_id, parsed_quiz):
+        self.db.calls.append("save")
+        if self.fail_save:
+            raise RuntimeError("저장 실패")
+        return SimpleNamespace(question=parsed_quiz["question"], options=parsed_quiz["options"],
+                               answer=parsed_quiz["answer"], explanation=parsed_quiz["explanation"])
+
+def build_service(quiz_count=3, fail_save=False):
+    db = FakeDB()
+    service = ChatService.__new__(ChatService)
+    service.db = db
+    service.chat_repository = FakeChatRepository(db, quiz_count)
+    service.heritage_repository = FakeHeritageRepository(db, fail_save)
+
+    async def validate_session_and_building(session_id, building_id):
+        return None
+    service.validation_service = SimpleNamespace(validate_session_and_building=validate_session_and_building)
+
+    async def get_quiz_with_retry(session_id, building_name):
+        db.calls.append("generate")
+        return QUIZ
+    service.get_quiz_with_retry = get_quiz_with_retry
+    return service, db
+
+def test_quiz_reservation_and_insert_commit_together():
+    service, db = build_service(quiz_count=3)
+    response = asyncio.run(service.update_quiz_conversation(1, 1))
+
+    assert response.quiz_count == 2
+    # 퀴즈 생성 후 차감 / 저장을 한 번의 커밋으로 반영
+    assert db.calls == ["generate", "reserve", "save", "commit"]
+
+def test_failed_quiz_insert_rolls_back_reservation():
+    service, db = build_service(quiz_count=3, fail_save=True)
+
+    with pytest.raises(ChatServiceException):
+        asyncio.run(service.update_quiz_conversation(1, 1))
+
+    assert db.calls == ["generate", "reserve", "save", "rollback"]
+
+def test_no_quiz_generated_without_remaining_count():
+    service, db = build_service(quiz_count=0)
+
+    with pytest.raises(NoQuizAvailableException):
+        asyncio.run(service.update_quiz_conversation(1, 1))
+
+    assert db.calls == []
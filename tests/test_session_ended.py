@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.error.chat_exception import SessionEndedException
+from app.service.chat_service import ChatService
+from app.service.validation_service import ValidationService
+
+# 유휴 종료 후 보관되어 대화 내용이 비워진 세션
+ARCHIVED_SESSION = SimpleNamespace(
+    id=1, heritage_id=1, start_time=datetime(2024, 1, 1, 10), end_time=datetime(2024, 1, 1, 12),
+    full_conversation=None, sliding_window=None, quiz_count=3
+)
+
+class FakeChatRepository:
+    def __init__(self):
+        self.writes = []
+
+    async def get_chat_session(self, session_id):
+        return ARCHIVED_SESSION
+
+    async def create_message(self, session_id, role, content):
+        self.writes.append(("message", content))
+
+    async def update_message(self, session_id, **kwargs):
+        self.writes.append(("conversation", kwargs))
+
+def test_message_after_archiving_is_rejected():
+    chat_repository = FakeChatRepository()
+    service = ChatService.__new__(ChatService)
+    service.chat_repository = chat_repository
+
+    async def get_chatting(session_id, sliding_window):
+        return "응답"
+    service.clova_service = SimpleNamespace(get_chatting=get_chatting)
+
+    with pytest.raises(SessionEndedException):
+        asyncio.run(service.update_chat_conversation(1, "다시 질문합니다"))
+
+    # 보관된 대화를 새 대화로 덮어쓰지 않도록 아무것도 저장하지 않음
+    assert chat_repository.writes == []
+
+def test_building_request_on_ended_session_is_rejected():
+    validation_service = ValidationService.__new__(ValidationService)
+    validation_service.chat_repository = FakeChatRepository()
+
+    with pytest.raises(SessionEndedException):
+        asyncio.run(validation_service.validate_session_and_building(1, 1))